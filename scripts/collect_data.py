@@ -29,7 +29,8 @@ def setup_logger():
         rotation="1 day",
         retention="30 days",
         level="INFO",
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}"
+        format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}",
+        enqueue=True  # 파일 쓰기를 별도 스레드에서 처리해 수집 루프를 막지 않음
     )
 
 
@@ -59,7 +59,8 @@ def setup_logging(log_file: str = None):
             format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
             level="DEBUG",
             rotation="10 MB",
-            retention="30 days"
+            retention="30 days",
+            enqueue=True  # 파일 쓰기를 별도 스레드에서 처리해 DB/분석 루프를 막지 않음
         )
 
 
@@ -207,7 +208,7 @@ def main():
 
     # Check database connection FIRST (needed for auto-date detection)
     try:
-        db = Database()
+        db = Database(pool_pre_ping=True)  # the run idles during the AI call
         logger.info(f"Database connected: {db._get_db_url_from_env()}")
     except Exception as e:
         logger.error(f"Failed to connect to database: {str(e)}")
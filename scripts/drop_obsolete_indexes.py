@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Drop single-column indexes that are now covered by composite indexes
+(the models no longer declare them, but existing databases still maintain them on every write)
+- *_stock_id: covered by (stock_id, date) style composites
+- ai_candidates.ai_screening_id / trading_signals.analysis_run_id: lead their composite indexes
+- trading_signals.status and (status, target_trade_date): replaced by the partial pending index on target_trade_date
+- *_stock_code on ai_candidates / technical_selections: lookups go through stock_id now
+Run after migrate_stock_id_columns.py so the stock_id columns and their indexes exist.
+"""
+
+import sys
+sys.path.insert(0, '/opt/AutoQuant')
+
+from src.database import Database
+from loguru import logger
+from sqlalchemy import text
+
+OBSOLETE_INDEXES = (
+    'ix_stock_prices_stock_id',
+    'ix_market_data_stock_id',
+    'ix_predictions_stock_id',
+    'ix_trades_stock_id',
+    'ix_ai_candidates_ai_screening_id',
+    'ix_ai_candidates_stock_code',
+    'ix_technical_selections_stock_code',
+    'ix_trading_signals_analysis_run_id',
+    'ix_trading_signals_stock_id',
+    'ix_trading_signals_status',
+    'ix_trading_signals_status_target_date',
+)
+
+
+def main():
+    logger.info("Dropping single-column indexes covered by composite indexes...")
+
+    db = Database()
+
+    try:
+        # Make sure the replacement composite indexes exist before dropping anything
+        db.create_tables()
+        with db.engine.begin() as conn:
+            for name in OBSOLETE_INDEXES:
+                conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        logger.info(f"✅ Successfully dropped obsolete indexes ({len(OBSOLETE_INDEXES)} checked)")
+        return 0
+    except Exception as e:
+        logger.error(f"❌ Failed to drop indexes: {e}")
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
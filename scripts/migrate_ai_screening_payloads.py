@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Move ai_screening_results.prompt_text / response_text into ai_screening_payloads
+(keeps the screening result rows small; the text is loaded only through the payload relationship)
+"""
+
+import sys
+sys.path.insert(0, '/opt/AutoQuant')
+
+from src.database import Database
+from src.database.models import AIScreeningPayload
+from loguru import logger
+from sqlalchemy import text
+
+PAYLOAD_COLUMNS = ('prompt_text', 'response_text')
+
+
+def main():
+    logger.info("Moving AI screening prompt/response text to ai_screening_payloads...")
+
+    db = Database()
+
+    if db.engine.dialect.name != 'postgresql':
+        logger.info("✅ Nothing to do: only PostgreSQL tables need migrating (recreate SQLite tables instead)")
+        return 0
+
+    statements = [
+        text("""
+            INSERT INTO ai_screening_payloads (id, prompt_text, response_text)
+            SELECT id, prompt_text, response_text
+            FROM ai_screening_results
+            WHERE prompt_text IS NOT NULL OR response_text IS NOT NULL
+            ON CONFLICT (id) DO NOTHING
+        """),
+    ] + [
+        text(f"ALTER TABLE ai_screening_results DROP COLUMN IF EXISTS {column}")
+        for column in PAYLOAD_COLUMNS
+    ]
+
+    try:
+        AIScreeningPayload.__table__.create(db.engine, checkfirst=True)
+        with db.engine.begin() as conn:
+            if int(conn.execute(text("SHOW server_version_num")).scalar_one()) >= 140000:
+                # LZ4 TOAST compression (PostgreSQL 14+) is faster than the default pglz
+                for column in PAYLOAD_COLUMNS:
+                    conn.execute(text(f"ALTER TABLE ai_screening_payloads ALTER COLUMN {column} SET COMPRESSION lz4"))
+            for sql in statements:
+                conn.execute(sql)
+        logger.info("✅ Successfully moved AI screening payloads")
+        return 0
+    except Exception as e:
+        logger.error(f"❌ Failed to migrate: {e}")
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Widen the id columns of the high-volume tables to BIGINT
+- stock_prices, market_data, predictions, trades: id INTEGER -> BIGINT, id sequence AS BIGINT
+Rewrites each table, so run it in a maintenance window.
+"""
+
+import sys
+sys.path.insert(0, '/opt/AutoQuant')
+
+from src.database import Database
+from src.database.models import StockPrice, MarketData, Prediction, Trade
+from loguru import logger
+from sqlalchemy import text
+
+BIGINT_ID_TABLES = tuple(model.__tablename__ for model in (StockPrice, MarketData, Prediction, Trade))
+
+
+def main():
+    logger.info("Widening id columns to BIGINT...")
+
+    db = Database()
+
+    if db.engine.dialect.name != 'postgresql':
+        logger.info("✅ Nothing to do: SQLite ids are already 64-bit rowids")
+        return 0
+
+    try:
+        with db.engine.begin() as conn:
+            for table_name in BIGINT_ID_TABLES:
+                conn.execute(text(f"ALTER TABLE {table_name} ALTER COLUMN id TYPE BIGINT"))
+                # serial sequences are created AS integer and would still stop at 2^31 - 1
+                sequence = conn.execute(text("SELECT pg_get_serial_sequence(:table_name, 'id')"),
+                                        {'table_name': table_name}).scalar()
+                if sequence:
+                    conn.execute(text(f"ALTER SEQUENCE {sequence} AS BIGINT"))
+        logger.info(f"✅ Successfully widened id columns on {len(BIGINT_ID_TABLES)} tables")
+        return 0
+    except Exception as e:
+        logger.error(f"❌ Failed to alter id columns: {e}")
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
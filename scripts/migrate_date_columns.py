@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Store pure trading dates as DATE instead of TIMESTAMP
+- stock_prices.date, market_data.date, predictions.target_date
+- rebuild ix_stock_prices_date as a BRIN index
+"""
+
+import sys
+sys.path.insert(0, '/opt/AutoQuant')
+
+from src.database import Database
+from src.database.models import StockPrice
+from loguru import logger
+from sqlalchemy import text
+
+DATE_COLUMNS = [
+    ('stock_prices', 'date'),
+    ('market_data', 'date'),
+    ('predictions', 'target_date'),
+]
+
+
+def main():
+    logger.info("Converting date columns to DATE...")
+
+    db = Database()
+
+    if db.engine.dialect.name != 'postgresql':
+        logger.info("✅ Nothing to do: only PostgreSQL tables need migrating (SQLite keeps the stored text)")
+        return 0
+
+    # Fails (and rolls back) if a stock has two rows on the same day with different times
+    statements = [
+        text(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE DATE USING {column}::date")
+        for table, column in DATE_COLUMNS
+    ] + [
+        text("DROP INDEX IF EXISTS ix_stock_prices_date"),
+    ]
+
+    try:
+        with db.engine.begin() as conn:
+            for sql in statements:
+                conn.execute(sql)
+            for index in StockPrice.__table__.indexes:
+                index.create(conn, checkfirst=True)
+        logger.info(f"✅ Successfully converted {len(DATE_COLUMNS)} columns")
+        return 0
+    except Exception as e:
+        logger.error(f"❌ Failed to convert columns: {e}")
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
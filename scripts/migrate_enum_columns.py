@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Convert short code columns (market, trade_type, trends, sentiment, volatility_rank, run/signal status)
+from VARCHAR to native PostgreSQL ENUM types. Stored values are unchanged.
+"""
+
+import sys
+sys.path.insert(0, '/opt/AutoQuant')
+
+from src.database import Database
+from src.database.models import Stock, Trade, AnalysisRun, MarketSnapshot, TradingSignal
+from loguru import logger
+from sqlalchemy import text
+
+ENUM_COLUMNS = [
+    Stock.__table__.c.market,
+    Trade.__table__.c.trade_type,
+    AnalysisRun.__table__.c.status,
+    MarketSnapshot.__table__.c.kospi_trend,
+    MarketSnapshot.__table__.c.kosdaq_trend,
+    MarketSnapshot.__table__.c.market_sentiment,
+    TradingSignal.__table__.c.volatility_rank,
+    TradingSignal.__table__.c.status,
+]
+
+# The partial index predicate compares status, so it is rebuilt against the new type
+PENDING_INDEX = next(
+    index for index in TradingSignal.__table__.indexes
+    if index.name == 'ix_trading_signals_pending_confidence'
+)
+
+
+def main():
+    logger.info("Converting code columns to ENUM types...")
+
+    db = Database()
+
+    if db.engine.dialect.name != 'postgresql':
+        logger.info("✅ Nothing to do: only PostgreSQL uses native ENUM types (recreate SQLite tables for CHECK constraints)")
+        return 0
+
+    try:
+        # Types created by an earlier run may lack values added since (e.g. signal_status 'missed');
+        # ADD VALUE must be committed before the new label can be used by the ALTER below
+        with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+            for column in ENUM_COLUMNS:
+                for value in column.type.enums:
+                    conn.execute(text(
+                        f"DO $$ BEGIN IF EXISTS (SELECT 1 FROM pg_type WHERE typname = '{column.type.name}') THEN "
+                        f"ALTER TYPE {column.type.name} ADD VALUE IF NOT EXISTS '{value}'; END IF; END $$"
+                    ))
+
+        with db.engine.begin() as conn:
+            conn.execute(text("UPDATE trades SET trade_type = UPPER(trade_type)"))
+            conn.execute(text(f"DROP INDEX IF EXISTS {PENDING_INDEX.name}"))
+
+            for column in ENUM_COLUMNS:
+                column.type.create(conn, checkfirst=True)
+                conn.execute(text(
+                    f"ALTER TABLE {column.table.name} ALTER COLUMN {column.name} "
+                    f"TYPE {column.type.name} USING {column.name}::text::{column.type.name}"
+                ))
+
+            PENDING_INDEX.create(conn, checkfirst=True)
+
+        logger.info(f"✅ Successfully converted {len(ENUM_COLUMNS)} columns")
+        return 0
+    except Exception as e:
+        logger.error(f"❌ Failed to convert columns: {e}")
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
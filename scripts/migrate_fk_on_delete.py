@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Move stock deletes to the database: ON DELETE CASCADE / SET NULL on stocks.id foreign keys
+- stock_prices, market_data, predictions, trades, portfolios: CASCADE
+- ai_candidates, technical_selections, trading_signals: SET NULL (analysis history is kept)
+The ORM relationships now use passive_deletes=True and no longer load child rows to delete them.
+"""
+
+import sys
+sys.path.insert(0, '/opt/AutoQuant')
+
+from src.database import Database
+from src.database.models import Base
+from loguru import logger
+from sqlalchemy import text
+
+
+def main():
+    logger.info("Adding ON DELETE actions to stocks.id foreign keys...")
+
+    db = Database()
+
+    if db.engine.dialect.name != 'postgresql':
+        logger.info("✅ Nothing to do: only PostgreSQL tables need migrating (recreate SQLite tables instead)")
+        return 0
+
+    foreign_keys = [
+        (table.name, fk.parent.name, fk.ondelete)
+        for table in Base.metadata.sorted_tables
+        for fk in table.foreign_keys
+        if fk.target_fullname == 'stocks.id' and fk.ondelete
+    ]
+
+    try:
+        with db.engine.begin() as conn:
+            for table_name, column, action in foreign_keys:
+                # Existing constraints may carry a generated name, so look them up by column
+                names = conn.execute(text("""
+                    SELECT c.conname FROM pg_constraint c
+                    JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = ANY (c.conkey)
+                    WHERE c.conrelid = to_regclass(:table_name) AND c.contype = 'f' AND a.attname = :column
+                """), {'table_name': table_name, 'column': column}).scalars().all()
+                for name in names:
+                    conn.execute(text(f"ALTER TABLE {table_name} DROP CONSTRAINT {name}"))
+                conn.execute(text(
+                    f"ALTER TABLE {table_name} ADD CONSTRAINT {table_name}_{column}_fkey "
+                    f"FOREIGN KEY ({column}) REFERENCES stocks (id) ON DELETE {action}"
+                ))
+        logger.info(f"✅ Successfully updated {len(foreign_keys)} foreign keys")
+        return 0
+    except Exception as e:
+        logger.error(f"❌ Failed to alter foreign keys: {e}")
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
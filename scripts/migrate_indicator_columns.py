@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Promote key technical indicators to typed columns and normalize sector performance
+- technical_selections: add sma_5 ... bb_lower, convert indicators to JSONB + GIN index
+- sector_performances: create table and backfill from market_snapshots.sector_performance
+"""
+
+import sys
+sys.path.insert(0, '/opt/AutoQuant')
+
+from src.database import Database
+from src.database.models import SectorPerformance
+from loguru import logger
+from sqlalchemy import text
+
+INDICATOR_COLUMNS = ('sma_5', 'sma_20', 'rsi_14', 'macd', 'macd_signal', 'bb_upper', 'bb_lower')
+
+
+def main():
+    logger.info("Migrating technical_selections indicators and sector performance...")
+
+    db = Database()
+
+    if db.engine.dialect.name != 'postgresql':
+        logger.info("✅ Nothing to do: only PostgreSQL tables need migrating (recreate SQLite tables instead)")
+        return 0
+
+    statements = [
+        text(f"ALTER TABLE technical_selections ADD COLUMN IF NOT EXISTS {column} DOUBLE PRECISION")
+        for column in INDICATOR_COLUMNS
+    ] + [
+        text("ALTER TABLE technical_selections ALTER COLUMN indicators TYPE JSONB USING indicators::jsonb"),
+        text("CREATE INDEX IF NOT EXISTS ix_technical_selections_indicators "
+             "ON technical_selections USING gin (indicators)"),
+        # Existing snapshots store {sector: change_pct}
+        text("""
+            INSERT INTO sector_performances (snapshot_id, sector, change_pct)
+            SELECT s.id, kv.key, (kv.value #>> '{}')::double precision
+            FROM market_snapshots s, json_each(s.sector_performance::json) kv
+            WHERE json_typeof(s.sector_performance::json) = 'object'
+              AND NOT EXISTS (SELECT 1 FROM sector_performances p WHERE p.snapshot_id = s.id)
+        """),
+    ]
+
+    try:
+        SectorPerformance.__table__.create(db.engine, checkfirst=True)
+        with db.engine.begin() as conn:
+            for sql in statements:
+                conn.execute(sql)
+        logger.info("✅ Successfully migrated indicator columns and sector performance rows")
+        return 0
+    except Exception as e:
+        logger.error(f"❌ Failed to migrate: {e}")
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
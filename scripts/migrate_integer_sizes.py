@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Right-size integer columns on existing tables
+- BIGINT: stock_prices.volume, trades.quantity (large-cap volume can exceed int32)
+- SMALLINT: run/screening counters and trading_signals.ai_confidence (0-100)
+"""
+
+import sys
+sys.path.insert(0, '/opt/AutoQuant')
+
+from src.database import Database
+from src.database.models import TRADE_COMMISSION_RATE
+from loguru import logger
+from sqlalchemy import text
+
+COLUMN_TYPES = [
+    ('stock_prices', 'volume', 'BIGINT'),
+    ('trades', 'quantity', 'BIGINT'),
+    ('analysis_runs', 'total_stocks_analyzed', 'SMALLINT'),
+    ('analysis_runs', 'ai_candidates_count', 'SMALLINT'),
+    ('analysis_runs', 'technical_selections_count', 'SMALLINT'),
+    ('analysis_runs', 'final_signals_count', 'SMALLINT'),
+    ('ai_screening_results', 'total_input_stocks', 'SMALLINT'),
+    ('ai_screening_results', 'selected_count', 'SMALLINT'),
+    ('technical_screening_results', 'input_candidates_count', 'SMALLINT'),
+    ('technical_screening_results', 'final_selections_count', 'SMALLINT'),
+    ('technical_screening_results', 'max_selections', 'SMALLINT'),
+    ('trading_signals', 'ai_confidence', 'SMALLINT'),
+]
+
+
+def main():
+    logger.info("Right-sizing integer columns...")
+
+    db = Database()
+
+    if db.engine.dialect.name != 'postgresql':
+        logger.info("✅ Nothing to do: SQLite stores every INTEGER as a variable-length int64")
+        return 0
+
+    # PostgreSQL refuses to retype a column used by a generated column,
+    # so trades.amount / commission are dropped and re-added around the change
+    statements = [
+        text("ALTER TABLE trades DROP COLUMN IF EXISTS amount, DROP COLUMN IF EXISTS commission"),
+    ] + [
+        text(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {sql_type}")
+        for table, column, sql_type in COLUMN_TYPES
+    ] + [
+        text("ALTER TABLE trades "
+             "ADD COLUMN amount DOUBLE PRECISION GENERATED ALWAYS AS (quantity * price) STORED, "
+             f"ADD COLUMN commission DOUBLE PRECISION GENERATED ALWAYS AS (quantity * price * {TRADE_COMMISSION_RATE}) STORED"),
+    ]
+
+    try:
+        with db.engine.begin() as conn:
+            for sql in statements:
+                conn.execute(sql)
+        logger.info(f"✅ Successfully altered {len(COLUMN_TYPES)} columns")
+        logger.info("Run VACUUM ANALYZE (or CLUSTER stock_prices USING ix_stock_prices_stock_date) to reclaim space")
+        return 0
+    except Exception as e:
+        logger.error(f"❌ Failed to alter columns: {e}")
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Make (stock_id, date) unique on market_data
+- removes duplicate rows (keeps the earliest id per stock/date)
+- rebuilds ix_market_data_stock_date as a unique index so re-ingest can use ON CONFLICT DO NOTHING
+"""
+
+import sys
+sys.path.insert(0, '/opt/AutoQuant')
+
+from src.database import Database
+from loguru import logger
+from sqlalchemy import text
+
+
+def main():
+    logger.info("Making market_data (stock_id, date) unique...")
+
+    db = Database()
+
+    statements = [
+        text("""
+            DELETE FROM market_data
+            WHERE id NOT IN (SELECT MIN(id) FROM market_data GROUP BY stock_id, date)
+        """),
+        text("DROP INDEX IF EXISTS ix_market_data_stock_date"),
+        text("CREATE UNIQUE INDEX ix_market_data_stock_date ON market_data (stock_id, date)"),
+    ]
+
+    try:
+        with db.engine.begin() as conn:
+            removed = conn.execute(statements[0]).rowcount
+            for sql in statements[1:]:
+                conn.execute(sql)
+        logger.info(f"✅ Successfully rebuilt unique index ({removed} duplicate rows removed)")
+        return 0
+    except Exception as e:
+        logger.error(f"❌ Failed to migrate: {e}")
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Store stock_prices OHLC as INTEGER (whole KRW) instead of DOUBLE PRECISION
+- open, high, low, close: rounded to the nearest won
+Rewrites the table (and ix_stock_prices_stock_date, which INCLUDEs these columns),
+so run it in a maintenance window.
+"""
+
+import sys
+sys.path.insert(0, '/opt/AutoQuant')
+
+from src.database import Database
+from loguru import logger
+from sqlalchemy import text
+
+PRICE_COLUMNS = ('open', 'high', 'low', 'close')
+
+
+def main():
+    logger.info("Converting stock_prices OHLC columns to INTEGER...")
+
+    db = Database()
+
+    if db.engine.dialect.name != 'postgresql':
+        logger.info("✅ Nothing to do: SQLite stores whole-number values as integers already")
+        return 0
+
+    sql = text("ALTER TABLE stock_prices " + ", ".join(
+        f"ALTER COLUMN {column} TYPE INTEGER USING round({column})::integer"
+        for column in PRICE_COLUMNS
+    ))
+
+    try:
+        with db.engine.begin() as conn:
+            conn.execute(sql)
+        logger.info(f"✅ Successfully altered {len(PRICE_COLUMNS)} columns")
+        logger.info("Run VACUUM ANALYZE stock_prices to refresh planner statistics")
+        return 0
+    except Exception as e:
+        logger.error(f"❌ Failed to alter columns: {e}")
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
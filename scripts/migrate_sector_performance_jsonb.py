@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Store market_snapshots.sector_performance as JSONB with a GIN (jsonb_path_ops) index
+so containment filters (sector_performance @> '{"IT": 1.2}') use the index
+"""
+
+import sys
+sys.path.insert(0, '/opt/AutoQuant')
+
+from src.database import Database
+from src.database.models import MarketSnapshot
+from loguru import logger
+from sqlalchemy import text
+
+SECTOR_INDEX = next(
+    index for index in MarketSnapshot.__table__.indexes
+    if index.name == 'ix_market_snapshots_sector_performance'
+)
+
+
+def main():
+    logger.info("Converting market_snapshots.sector_performance to JSONB...")
+
+    db = Database()
+
+    if db.engine.dialect.name != 'postgresql':
+        logger.info("✅ Nothing to do: JSONB and GIN indexes are PostgreSQL only")
+        return 0
+
+    try:
+        with db.engine.begin() as conn:
+            conn.execute(text(
+                "ALTER TABLE market_snapshots ALTER COLUMN sector_performance "
+                "TYPE JSONB USING sector_performance::jsonb"
+            ))
+            SECTOR_INDEX.create(conn, checkfirst=True)
+        logger.info("✅ Successfully converted sector_performance and created its GIN index")
+        return 0
+    except Exception as e:
+        logger.error(f"❌ Failed to convert sector_performance: {e}")
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
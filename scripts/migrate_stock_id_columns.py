@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Link ai_candidates / technical_selections to stocks by integer stock_id
+- add nullable stock_id FK columns and backfill them from stock_code
+- backfill trading_signals.stock_id the same way
+- replace the standalone stock_code indexes with (ai_screening_id, stock_code)
+"""
+
+import sys
+sys.path.insert(0, '/opt/AutoQuant')
+
+from src.database import Database
+from src.database.models import AICandidate, TechnicalSelection
+from loguru import logger
+from sqlalchemy import text
+
+LINKED_TABLES = ('ai_candidates', 'technical_selections', 'trading_signals')
+
+
+def main():
+    logger.info("Adding stock_id links to screening tables...")
+
+    db = Database()
+
+    if db.engine.dialect.name != 'postgresql':
+        logger.info("✅ Nothing to do: only PostgreSQL tables need migrating (recreate SQLite tables instead)")
+        return 0
+
+    statements = [
+        text(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS stock_id INTEGER REFERENCES stocks (id)")
+        for table in LINKED_TABLES
+    ] + [
+        text(f"UPDATE {table} t SET stock_id = s.id FROM stocks s "
+             f"WHERE t.stock_id IS NULL AND s.ticker = t.stock_code")
+        for table in LINKED_TABLES
+    ] + [
+        text("DROP INDEX IF EXISTS ix_ai_candidates_stock_code"),
+        text("DROP INDEX IF EXISTS ix_technical_selections_stock_code"),
+    ]
+
+    try:
+        with db.engine.begin() as conn:
+            for sql in statements:
+                conn.execute(sql)
+            for model in (AICandidate, TechnicalSelection):
+                for index in model.__table__.indexes:
+                    index.create(conn, checkfirst=True)
+        logger.info("✅ Successfully linked screening tables to stocks")
+        return 0
+    except Exception as e:
+        logger.error(f"❌ Failed to migrate: {e}")
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Make (stock_id, date) unique on stock_prices
+- removes duplicate rows (keeps the earliest id per stock/date)
+- rebuilds ix_stock_prices_stock_date as a unique index so price inserts can use ON CONFLICT DO NOTHING
+"""
+
+import sys
+sys.path.insert(0, '/opt/AutoQuant')
+
+from src.database import Database
+from src.database.models import StockPrice
+from loguru import logger
+from sqlalchemy import text
+
+STOCK_DATE_INDEX = next(
+    index for index in StockPrice.__table__.indexes
+    if index.name == 'ix_stock_prices_stock_date'
+)
+
+
+def main():
+    logger.info("Making stock_prices (stock_id, date) unique...")
+
+    db = Database()
+
+    try:
+        with db.engine.begin() as conn:
+            removed = conn.execute(text("""
+                DELETE FROM stock_prices
+                WHERE id NOT IN (SELECT MIN(id) FROM stock_prices GROUP BY stock_id, date)
+            """)).rowcount
+            conn.execute(text(f"DROP INDEX IF EXISTS {STOCK_DATE_INDEX.name}"))
+            # Model index definition (PostgreSQL adds INCLUDE columns for index-only scans)
+            STOCK_DATE_INDEX.create(conn)
+        logger.info(f"✅ Successfully rebuilt unique index ({removed} duplicate rows removed)")
+        return 0
+    except Exception as e:
+        logger.error(f"❌ Failed to migrate: {e}")
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Set DEFAULT LOCALTIMESTAMP on existing created_at / updated_at columns
+(the models now let the database fill these timestamps)
+"""
+
+import sys
+sys.path.insert(0, '/opt/AutoQuant')
+
+from src.database import Database
+from src.database.models import Base
+from loguru import logger
+from sqlalchemy import text
+
+TIMESTAMP_COLUMNS = ('created_at', 'updated_at')
+
+
+def main():
+    logger.info("Setting server-side defaults on created_at/updated_at columns...")
+
+    db = Database()
+
+    if db.engine.dialect.name != 'postgresql':
+        logger.info("✅ Nothing to do: only PostgreSQL tables need migrating (SQLite defaults are set on create)")
+        return 0
+
+    statements = [
+        text(f"ALTER TABLE {table.name} ALTER COLUMN {column} SET DEFAULT LOCALTIMESTAMP")
+        for table in Base.metadata.sorted_tables
+        for column in TIMESTAMP_COLUMNS
+        if column in table.c
+    ]
+
+    try:
+        with db.engine.begin() as conn:
+            for sql in statements:
+                conn.execute(sql)
+        logger.info(f"✅ Successfully set defaults on {len(statements)} columns")
+        return 0
+    except Exception as e:
+        logger.error(f"❌ Failed to alter columns: {e}")
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Convert trades.amount / trades.commission to database-generated columns
+amount = quantity * price, commission = quantity * price * TRADE_COMMISSION_RATE
+"""
+
+import sys
+sys.path.insert(0, '/opt/AutoQuant')
+
+from src.database import Database
+from src.database.models import TRADE_COMMISSION_RATE
+from loguru import logger
+from sqlalchemy import text
+
+def main():
+    logger.info("Converting trades.amount/commission to generated columns...")
+
+    db = Database()
+
+    # PostgreSQL cannot turn an existing column into a generated one,
+    # so drop and re-add it (values are recomputed from quantity * price)
+    statements = [
+        text("ALTER TABLE trades DROP COLUMN IF EXISTS amount"),
+        text("ALTER TABLE trades ADD COLUMN amount DOUBLE PRECISION "
+             "GENERATED ALWAYS AS (quantity * price) STORED"),
+        text("ALTER TABLE trades DROP COLUMN IF EXISTS commission"),
+        text("ALTER TABLE trades ADD COLUMN commission DOUBLE PRECISION "
+             f"GENERATED ALWAYS AS (quantity * price * {TRADE_COMMISSION_RATE}) STORED"),
+    ]
+
+    try:
+        with db.engine.begin() as conn:
+            is_generated = conn.execute(text(
+                "SELECT is_generated FROM information_schema.columns "
+                "WHERE table_name = 'trades' AND column_name = 'amount'"
+            )).scalar()
+            if is_generated == 'ALWAYS':
+                logger.info("✅ trades.amount/commission are already generated columns")
+                return 0
+
+            for sql in statements:
+                conn.execute(sql)
+        logger.info("✅ Successfully converted trades.amount/commission to generated columns")
+        return 0
+    except Exception as e:
+        logger.error(f"❌ Failed to alter columns: {e}")
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
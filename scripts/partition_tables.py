@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Monthly range partitioning for stock_prices and trading_signals (PostgreSQL)
+
+First run converts the existing tables to PARTITION BY RANGE (date column) and copies the rows
+into monthly partitions (stock_prices_2025_01, ...). Every run pre-creates the partitions for
+the coming months, so schedule it from cron:
+
+    0 3 1 * * python scripts/partition_tables.py --months-ahead 2
+
+Indexes declared on the models are created on the parent table and PostgreSQL adds them to
+every partition, including ones created later.
+"""
+
+import argparse
+import sys
+sys.path.insert(0, '/opt/AutoQuant')
+
+from datetime import date
+
+import pandas as pd
+from src.database import Database
+from src.database.models import StockPrice, TradingSignal
+from loguru import logger
+from sqlalchemy import text
+
+# model -> partition key column
+PARTITIONED_MODELS = [
+    (StockPrice, 'date'),
+    (TradingSignal, 'analysis_date'),
+]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Partition stock_prices / trading_signals by month')
+    parser.add_argument(
+        '--months-ahead',
+        type=int,
+        default=2,
+        help='Number of future monthly partitions to pre-create (default: 2)'
+    )
+    return parser.parse_args()
+
+
+def is_partitioned(conn, table_name: str) -> bool:
+    return conn.execute(text(
+        "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table_name)"
+    ), {'table_name': table_name}).first() is not None
+
+
+def create_partition(conn, table_name: str, month: pd.Period):
+    """Create the monthly partition (no-op if it already exists)"""
+    start = month.start_time.date()
+    end = (month + 1).start_time.date()
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {table_name}_{month.year}_{month.month:02d} "
+        f"PARTITION OF {table_name} FOR VALUES FROM ('{start}') TO ('{end}')"
+    ))
+
+
+def convert_to_partitioned(conn, model, column: str):
+    """Rebuild an existing table as a range-partitioned table and copy its rows"""
+    table = model.__table__
+    old_name = f"{table.name}_unpartitioned"
+
+    logger.info(f"Converting {table.name} to monthly partitions on {column}...")
+
+    foreign_keys = conn.execute(text(
+        "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = to_regclass(:table_name) AND contype = 'f'"
+    ), {'table_name': table.name}).fetchall()
+    bounds = conn.execute(text(f"SELECT MIN({column}), MAX({column}) FROM {table.name}")).first()
+
+    conn.execute(text(f"ALTER TABLE {table.name} RENAME TO {old_name}"))
+    conn.execute(text(
+        f"CREATE TABLE {table.name} (LIKE {old_name} INCLUDING DEFAULTS INCLUDING GENERATED) "
+        f"PARTITION BY RANGE ({column})"
+    ))
+
+    # Partitions covering the existing rows, plus a DEFAULT partition for anything outside them
+    if bounds[0] is not None:
+        for month in pd.period_range(bounds[0], bounds[1], freq='M'):
+            create_partition(conn, table.name, month)
+    conn.execute(text(f"CREATE TABLE IF NOT EXISTS {table.name}_default PARTITION OF {table.name} DEFAULT"))
+
+    conn.execute(text(f"INSERT INTO {table.name} SELECT * FROM {old_name}"))
+
+    # The id sequence belongs to the old table; move it before dropping that table
+    sequence = conn.execute(text("SELECT pg_get_serial_sequence(:table_name, 'id')"),
+                            {'table_name': old_name}).scalar()
+    if sequence:
+        conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {table.name}.id"))
+    conn.execute(text(f"DROP TABLE {old_name}"))
+
+    # Primary/unique keys on a partitioned table must include the partition key.
+    # The ORM keeps mapping id alone as the identity, so session.get(model, id) is unchanged.
+    conn.execute(text(f"ALTER TABLE {table.name} ADD PRIMARY KEY (id, {column})"))
+    for name, definition in foreign_keys:
+        conn.execute(text(f"ALTER TABLE {table.name} ADD CONSTRAINT {name} {definition}"))
+    for index in table.indexes:
+        index.create(conn, checkfirst=True)
+
+
+def main():
+    args = parse_args()
+    logger.info("Maintaining monthly partitions...")
+
+    db = Database()
+
+    if db.engine.dialect.name != 'postgresql':
+        logger.info("✅ Nothing to do: table partitioning is PostgreSQL only")
+        return 0
+
+    this_month = pd.Period(date.today(), freq='M')
+    months = pd.period_range(this_month, this_month + args.months_ahead, freq='M')
+
+    try:
+        for model, column in PARTITIONED_MODELS:
+            table_name = model.__tablename__
+            with db.engine.begin() as conn:
+                if not is_partitioned(conn, table_name):
+                    convert_to_partitioned(conn, model, column)
+
+                for month in months:
+                    create_partition(conn, table_name, month)
+
+            logger.info(f"✅ {table_name}: partitions ready through {months[-1]}")
+        return 0
+    except Exception as e:
+        logger.error(f"❌ Failed to maintain partitions: {e}")
+        return 1
+
+if __name__ == '__main__':
+    sys.exit(main())
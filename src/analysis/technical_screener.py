@@ -21,6 +21,17 @@ from src.analysis.technical_indicators import TechnicalIndicators
 class TechnicalScreener:
     """Filter AI-selected candidates (30~40) to final selections (3~5) using technical scores"""
 
+    # Latest indicator values kept on each selection (TechnicalSelection column -> indicator column)
+    KEY_INDICATORS = {
+        'sma_5': 'SMA_5',
+        'sma_20': 'SMA_20',
+        'rsi_14': 'RSI_14',
+        'macd': 'MACD',
+        'macd_signal': 'MACD_Signal',
+        'bb_upper': 'BB_Upper',
+        'bb_lower': 'BB_Lower',
+    }
+
     def __init__(self):
         self.db = Database()
         self.tech_indicators = TechnicalIndicators()
@@ -77,19 +88,14 @@ class TechnicalScreener:
                     continue
 
                 # Rename columns to match TechnicalIndicators expectations
-                ohlcv_df = ohlcv_df.copy()
-                ohlcv_df.rename(columns={
+                # and cast to float in one pass
+                ohlcv_df = ohlcv_df.rename(columns={
                     'open': 'Open',
                     'high': 'High',
                     'low': 'Low',
                     'close': 'Close',
                     'volume': 'Volume'
-                }, inplace=True)
-
-                # Convert Decimal to float
-                for col in ['Open', 'High', 'Low', 'Close', 'Volume']:
-                    if col in ohlcv_df.columns:
-                        ohlcv_df[col] = ohlcv_df[col].astype(float)
+                }).astype({'Open': 'float64', 'High': 'float64', 'Low': 'float64', 'Close': 'float64', 'Volume': 'float64'})
 
                 # Calculate all technical indicators
                 ohlcv_with_indicators = self.tech_indicators.add_all_indicators(ohlcv_df)
@@ -122,6 +128,8 @@ class TechnicalScreener:
                 candidates_with_scores.loc[idx, 'volume_score'] = volume_score
                 candidates_with_scores.loc[idx, 'technical_score'] = technical_score
                 candidates_with_scores.loc[idx, 'final_score'] = final_score
+                for column, indicator in self.KEY_INDICATORS.items():
+                    candidates_with_scores.loc[idx, column] = latest.get(indicator)
 
                 logger.debug(f"✓ {stock_code}: technical={technical_score:.1f}, final={final_score:.1f}")
 
@@ -5,10 +5,13 @@
 from .models import (
     Base, Stock, StockPrice, MarketData, Prediction, Trade, Portfolio,
     BacktestResult, TradingSignal,
-    AnalysisRun, MarketSnapshot, AIScreeningResult, AICandidate,
-    TechnicalScreeningResult, TechnicalSelection
+    AnalysisRun, MarketSnapshot, SectorPerformance, AIScreeningResult, AIScreeningPayload, AICandidate,
+    TechnicalScreeningResult, TechnicalSelection,
+    MarketType, TradeType, MarketTrend, MarketSentiment, VolatilityRank, RunStatus, SignalStatus
 )
+from .dto import StockDTO, PredictionDTO, TradeDTO, PortfolioDTO, BacktestResultDTO
 from .database import Database
+from .async_database import AsyncDatabase
 
 __all__ = [
     'Base',
@@ -22,9 +25,24 @@ __all__ = [
     'TradingSignal',
     'AnalysisRun',
     'MarketSnapshot',
+    'SectorPerformance',
     'AIScreeningResult',
+    'AIScreeningPayload',
     'AICandidate',
     'TechnicalScreeningResult',
     'TechnicalSelection',
+    'MarketType',
+    'TradeType',
+    'MarketTrend',
+    'MarketSentiment',
+    'VolatilityRank',
+    'RunStatus',
+    'SignalStatus',
+    'StockDTO',
+    'PredictionDTO',
+    'TradeDTO',
+    'PortfolioDTO',
+    'BacktestResultDTO',
     'Database',
+    'AsyncDatabase',
 ]
@@ -0,0 +1,135 @@
+"""
+비동기 데이터베이스 조회 클래스
+KIS daily_ohlcv 읽기 전용 (PostgreSQL + asyncpg)
+
+대시보드처럼 여러 종목을 동시에 조회하는 경우 asyncio.gather 로 쿼리를 겹쳐 실행한다.
+쓰기와 ORM CRUD 는 Database 를 사용한다.
+
+    db = AsyncDatabase()
+    frames = await asyncio.gather(*[db.get_daily_ohlcv_from_kis_async(code) for code in codes])
+    await db.dispose()
+"""
+
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+import pandas as pd
+from loguru import logger
+from sqlalchemy.engine import make_url
+
+try:
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+    ASYNC_AVAILABLE = True
+except ImportError:
+    # greenlet 미설치 (pip install "sqlalchemy[asyncio]" asyncpg)
+    ASYNC_AVAILABLE = False
+
+from .database import (
+    Database,
+    _KIS_OHLCV_SYMBOL_STMT,
+    _KIS_AVAILABLE_SYMBOLS_STMT,
+)
+
+
+class AsyncDatabase:
+    """KIS daily_ohlcv 비동기 조회 (asyncpg 커넥션 풀)"""
+
+    # 동기 드라이버 → 비동기 드라이버 (daily_ohlcv 는 KIS PostgreSQL 에만 있으므로 PostgreSQL 전용)
+    ASYNC_DRIVERS = {
+        'postgresql': 'postgresql+asyncpg',
+    }
+
+    def __init__(self, db_url: str = None, echo: bool = False):
+        """
+        Args:
+            db_url: 데이터베이스 URL (None이면 .env에서 읽음, 동기 드라이버 URL도 자동 변환)
+            echo: SQL 로그 출력 여부
+
+        Raises:
+            ValueError: PostgreSQL 이 아닌 URL
+        """
+        if not ASYNC_AVAILABLE:
+            raise ImportError('AsyncDatabase 를 사용하려면 pip install "sqlalchemy[asyncio]" asyncpg 가 필요합니다.')
+
+        if db_url is None:
+            db_url = Database._get_db_url_from_env()
+
+        url = make_url(db_url)
+        backend = url.get_backend_name()
+        if backend not in self.ASYNC_DRIVERS:
+            raise ValueError(
+                f"AsyncDatabase 는 PostgreSQL 전용입니다 (KIS daily_ohlcv 조회): {url.render_as_string(hide_password=True)}"
+            )
+        url = url.set(drivername=self.ASYNC_DRIVERS[backend])
+
+        # 동기 Database 와 같은 풀 설정을 사용
+        self.engine = create_async_engine(url, echo=echo, **Database._get_pool_options_from_env())
+        self.async_session = async_sessionmaker(self.engine, expire_on_commit=False)
+
+        logger.info(f"비동기 데이터베이스 초기화: {url.render_as_string(hide_password=True)}")
+
+    async def dispose(self):
+        """커넥션 풀 종료"""
+        await self.engine.dispose()
+
+    @staticmethod
+    def _as_datetime(value) -> Optional[datetime]:
+        """날짜 파라미터를 datetime 으로 통일 (asyncpg 는 TIMESTAMP 파라미터에 date 를 받지 않음)"""
+        return pd.Timestamp(value).to_pydatetime() if value else None
+
+    async def get_daily_ohlcv_from_kis_async(self, symbol_code: str, start_date: datetime = None,
+                                             end_date: datetime = None, dtype: str = 'float64') -> pd.DataFrame:
+        """
+        KIS daily_ohlcv 일봉 데이터 조회 (개별 종목, Database.get_daily_ohlcv_from_kis 와 동일한 형식)
+
+        Args:
+            symbol_code: 종목코드 (예: '005930' - 삼성전자)
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            dtype: 가격/거래대금 컬럼 dtype ('float64' 기본 또는 'float32')
+
+        Returns:
+            pandas.DataFrame: OHLCV 데이터 (trade_date 인덱스)
+        """
+        params: Dict[str, Any] = {
+            'symbol_code': symbol_code,
+            'start_date': self._as_datetime(start_date),
+            'end_date': self._as_datetime(end_date)
+        }
+
+        try:
+            async with self.async_session() as session:
+                result = await session.execute(_KIS_OHLCV_SYMBOL_STMT, params)
+                df = pd.DataFrame(result.fetchall(), columns=list(result.keys()))
+
+            df['trade_date'] = pd.to_datetime(df['trade_date'])
+            df = df.astype(Database._kis_ohlcv_dtypes(dtype)).set_index('trade_date')
+
+            if not df.empty:
+                logger.debug("KIS daily_ohlcv 비동기 조회 성공: {}, {}건", symbol_code, len(df))
+            else:
+                logger.warning(f"KIS daily_ohlcv 데이터 없음: {symbol_code}")
+
+            return df
+
+        except Exception as e:
+            logger.error(f"KIS daily_ohlcv 비동기 조회 실패: {symbol_code} - {e}")
+            return pd.DataFrame()
+
+    async def get_available_symbols_from_kis_async(self) -> List[str]:
+        """
+        KIS 시스템에서 최근 30일간 거래된 종목 목록 조회
+
+        Returns:
+            list: 종목코드 리스트
+        """
+        try:
+            async with self.async_session() as session:
+                result = await session.execute(_KIS_AVAILABLE_SYMBOLS_STMT)
+                symbols = [row[0] for row in result.fetchall()]
+
+            logger.info(f"KIS 사용 가능 종목 비동기 조회: {len(symbols)}개")
+            return symbols
+
+        except Exception as e:
+            logger.error(f"KIS 사용 가능 종목 비동기 조회 실패: {e}")
+            return []
@@ -3,58 +3,334 @@
 PostgreSQL과 SQLite 지원
 """
 
+import hashlib
+import io
+import json
 import os
-from sqlalchemy import create_engine, and_
-from sqlalchemy.orm import sessionmaker, Session
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event, inspect, insert, select, update, text, bindparam, and_, DateTime
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import sessionmaker, Session, load_only, selectinload, undefer
 from sqlalchemy.pool import StaticPool
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any, Iterator
+from datetime import date, datetime, timedelta
+from pathlib import Path
 import pandas as pd
 from loguru import logger
 from dotenv import load_dotenv
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+
 from .models import (
     Base, Stock, StockPrice, MarketData, Prediction, Trade, Portfolio, BacktestResult,
-    AnalysisRun, MarketSnapshot, AIScreeningResult, AICandidate,
+    AnalysisRun, MarketSnapshot, SectorPerformance, AIScreeningResult, AICandidate,
     TechnicalScreeningResult, TechnicalSelection, TradingSignal
 )
+from .dto import StockDTO, PredictionDTO, TradeDTO, PortfolioDTO, BacktestResultDTO
 
 # .env 파일 로드
 load_dotenv()
 
 
+# ==================== KIS daily_ohlcv 쿼리 ====================
+
+_KIS_OHLCV_COLUMNS = """
+    trade_date,
+    open_price as open,
+    high_price as high,
+    low_price as low,
+    close_price as close,
+    volume,
+    trade_amount as amount
+"""
+
+
+def _build_kis_ohlcv_statement(columns: str, where: str, order_by: str, *bindparams):
+    """
+    daily_ohlcv 기간 조회문 구성
+
+    시작/종료일은 NULL이면 조건을 건너뛰는 형태로 항상 같은 SQL을 사용하므로
+    SQLAlchemy 컴파일 캐시와 PostgreSQL 플랜 캐시를 매 호출 재사용한다.
+    """
+    return text(f"""
+        SELECT {columns}
+        FROM daily_ohlcv
+        WHERE {where}
+          AND (:start_date IS NULL OR trade_date >= :start_date)
+          AND (:end_date IS NULL OR trade_date <= :end_date)
+        ORDER BY {order_by}
+    """).bindparams(
+        bindparam('start_date', type_=DateTime),
+        bindparam('end_date', type_=DateTime),
+        *bindparams
+    )
+
+
+_KIS_OHLCV_BATCH_STMT = _build_kis_ohlcv_statement(
+    "symbol_code," + _KIS_OHLCV_COLUMNS, "1=1", "symbol_code, trade_date ASC"
+)
+_KIS_OHLCV_SYMBOL_STMT = _build_kis_ohlcv_statement(
+    _KIS_OHLCV_COLUMNS, "symbol_code = :symbol_code", "trade_date ASC"
+)
+_KIS_OHLCV_SYMBOLS_STMT = _build_kis_ohlcv_statement(
+    "symbol_code," + _KIS_OHLCV_COLUMNS, "symbol_code IN :symbols", "symbol_code, trade_date ASC",
+    bindparam('symbols', expanding=True)
+)
+
+_KIS_AVAILABLE_SYMBOLS_STMT = text("""
+    SELECT DISTINCT symbol_code
+    FROM daily_ohlcv
+    WHERE trade_date >= CURRENT_DATE - INTERVAL '30 days'
+    ORDER BY symbol_code
+""")
+
+_KIS_AVAILABLE_SYMBOLS_COUNT_STMT = text("""
+    SELECT COUNT(DISTINCT symbol_code)
+    FROM daily_ohlcv
+    WHERE trade_date >= CURRENT_DATE - INTERVAL '30 days'
+""")
+
+_KIS_SYMBOLS_SUMMARY_STMT = text("""
+    SELECT DISTINCT
+        symbol_code,
+        MAX(trade_date) as last_trade_date,
+        COUNT(*) as data_count
+    FROM daily_ohlcv
+    GROUP BY symbol_code
+    ORDER BY last_trade_date DESC
+""")
+
+
+# ==================== stock_prices INSERT 문 ====================
+# 적재 호출마다 INSERT 문 객체를 새로 만들지 않고 한 번 만든 문을 재사용 (컴파일 결과는 엔진 query cache 에서 재사용)
+
+_STOCK_PRICE_INSERT_STMT = insert(StockPrice.__table__)
+
+# 이미 있는 (stock_id, date)는 건너뛰는 INSERT ... ON CONFLICT DO NOTHING (방언별)
+_STOCK_PRICE_UPSERT_STMTS = {
+    'sqlite': sqlite_insert(StockPrice.__table__).on_conflict_do_nothing(index_elements=['stock_id', 'date']),
+    'postgresql': postgresql_insert(StockPrice.__table__).on_conflict_do_nothing(index_elements=['stock_id', 'date']),
+}
+
+
+class _TTLCache:
+    """만료 시간(TTL)이 있는 간단한 스레드 안전 캐시"""
+
+    _MISSING = object()
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Any, tuple] = {}
+        self._lock = threading.RLock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key, self._MISSING)
+            if entry is self._MISSING:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._data.pop(next(iter(self._data)))
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
 class Database:
     """데이터베이스 관리 클래스 (PostgreSQL & SQLite 지원)"""
 
-    def __init__(self, db_url: str = None, echo: bool = False):
+    # IN (...) 절 하나에 넣을 최대 파라미터 수 (SQLite/PostgreSQL 파라미터 한도 회피)
+    IN_CLAUSE_CHUNK_SIZE = 1000
+
+    # 한글 주가 컬럼명 -> 저장용 영문 컬럼명
+    PRICE_COLUMN_MAP = {
+        '시가': 'Open',
+        '고가': 'High',
+        '저가': 'Low',
+        '종가': 'Close',
+        '거래량': 'Volume',
+        '거래대금': 'Amount',
+    }
+
+    # 조회 캐시 TTL (초): 종목/포트폴리오는 짧게, KIS 종목 유니버스는 장중 거의 변하지 않으므로 길게
+    STOCK_CACHE_TTL = 60
+    KIS_SYMBOLS_CACHE_TTL = 3600
+
+    # KIS 종목 목록 일자별 디스크 캐시 위치 (kis_symbols/{DB URL 해시}/{yyyymmdd}.json, 당일 파일만 유지)
+    KIS_SYMBOLS_CACHE_DIR = os.getenv("CACHE_DIR", "data/cache")
+
+    # 종목/월별 주가 Parquet 캐시 위치 ({DB URL 해시}/{ticker}/{yyyymm}.parquet)
+    PRICE_CACHE_DIR = os.path.join(os.getenv("CACHE_DIR", "data/cache"), "prices")
+
+    # 백테스트/지표 스캔용 주가 Parquet 데이터셋 위치 (연/월 파티션, export_prices_to_parquet)
+    PRICE_LAKE_DIR = os.getenv("PRICE_LAKE_DIR", "data/lake/stock_prices")
+
+    # (db_url, echo, pool_pre_ping) -> (생성한 프로세스 pid, 엔진) 공유 레지스트리
+    _engines: Dict[tuple, tuple] = {}
+    _engines_lock = threading.Lock()
+
+    # 주가 저장 시 INSERT/COPY 한 번에 보낼 행 수 (배포 환경별로 조정)
+    INSERT_CHUNK_SIZE = 1000
+
+    # 여러 종목 주가 일괄 저장(bulk_insert_prices) 시 INSERT 한 번에 보낼 행 수
+    BULK_INSERT_CHUNK_SIZE = 10000
+
+    # 엔진별 컴파일된 SQL 캐시 크기 (기본 500, 모델/조회문이 많아 밀려나지 않도록 늘림)
+    QUERY_CACHE_SIZE = 1200
+
+    # PostgreSQL executemany 를 다중 행 INSERT ... VALUES 로 묶을 때 문장 하나당 행 수
+    # (SQLAlchemy 기본값 1000 이면 BULK_INSERT_CHUNK_SIZE 한 묶음이 10번 왕복으로 나뉨)
+    INSERTMANYVALUES_PAGE_SIZE = 10000
+
+    # 주가 조회 시 서버 측 커서에서 한 번에 가져올 행 수
+    PRICE_FETCH_CHUNK_SIZE = 10000
+
+    # KIS daily_ohlcv 조회 시 서버 측 커서에서 한 번에 가져올 행 수
+    KIS_FETCH_CHUNK_SIZE = 50000
+
+    # SQLite 커넥션마다 적용할 PRAGMA (WAL 저널 + 256MB 페이지 캐시 + 1GB mmap)
+    # foreign_keys 는 PostgreSQL과 같이 FK 제약/ON DELETE CASCADE 를 적용하기 위함
+    SQLITE_MEMORY_PRAGMAS = (
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-262144",
+        "PRAGMA foreign_keys=ON",
+    )
+    SQLITE_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA mmap_size=1073741824",
+    ) + SQLITE_MEMORY_PRAGMAS
+
+    def __init__(self, db_url: str = None, echo: bool = False, price_cache: bool = None,
+                 pool_pre_ping: bool = None):
         """
         Args:
             db_url: 데이터베이스 URL (None이면 .env에서 읽음)
             echo: SQL 로그 출력 여부
+            price_cache: get_stock_prices 결과를 월별 Parquet 파일로 캐시할지 여부
+                (None이면 .env의 PRICE_CACHE_ENABLED, pyarrow 필요)
+            pool_pre_ping: PostgreSQL 커넥션 체크아웃마다 연결 상태 확인 (None이면 .env의 DB_POOL_PRE_PING).
+                AI API 호출처럼 오래 쉬는 동안 서버/방화벽이 끊은 커넥션을 걸러내야 하는 배치 작업용
         """
         # .env에서 DB 설정 읽기
         if db_url is None:
             db_url = self._get_db_url_from_env()
 
         self.db_url = db_url
+        self.engine = self._get_engine(db_url, echo, pool_pre_ping)
+        self.SessionLocal = sessionmaker(bind=self.engine)
+
+        # ticker -> stocks.id 캐시 (실행 중 사실상 불변이므로 조회 결과를 재사용)
+        self._ticker_id_cache: Dict[str, int] = {}
+
+        # stock_prices (stock_id, date) 유니크 인덱스 존재 여부 (None이면 첫 적재 시 확인)
+        self._price_unique_index: Optional[bool] = None
 
+        # 자주 읽고 거의 바뀌지 않는 조회 결과 캐시 (쓰기 시 무효화)
+        self._stock_cache = _TTLCache(self.STOCK_CACHE_TTL)
+        self._portfolio_cache = _TTLCache(self.STOCK_CACHE_TTL)
+        self._kis_symbols_cache = _TTLCache(self.KIS_SYMBOLS_CACHE_TTL)
+
+        # 주가 Parquet 캐시 (메모리 DB는 디스크 캐시와 수명이 맞지 않으므로 제외)
+        if price_cache is None:
+            price_cache = os.getenv("PRICE_CACHE_ENABLED", "false").lower() in ("1", "true", "yes")
+        if price_cache and not PYARROW_AVAILABLE:
+            logger.warning("pyarrow를 사용할 수 없어 주가 Parquet 캐시를 끕니다.")
+        self.price_cache_enabled = price_cache and PYARROW_AVAILABLE and ":memory:" not in db_url
+
+        # 디스크 캐시 하위 디렉터리 (캐시 디렉터리를 공유하는 DB끼리 서로의 캐시를 읽지 않도록 DB URL 로 구분)
+        self._cache_namespace = hashlib.sha256(db_url.encode('utf-8')).hexdigest()[:16]
+
+        logger.info(f"데이터베이스 초기화: {db_url}")
+
+    @classmethod
+    def _get_engine(cls, db_url: str, echo: bool = False, pool_pre_ping: bool = None):
+        """
+        같은 프로세스에서 같은 URL을 쓰는 Database 인스턴스끼리 엔진(커넥션 풀) 공유
+
+        SQLite 메모리 DB는 인스턴스마다 독립된 DB여야 하므로 공유하지 않는다.
+        fork 된 자식 프로세스는 부모의 커넥션을 재사용하지 않도록 새 엔진을 만든다.
+        """
+        if ":memory:" in db_url:
+            return cls._create_engine(db_url, echo)
+
+        key = (db_url, echo, pool_pre_ping)
+        with cls._engines_lock:
+            entry = cls._engines.get(key)
+            if entry is not None and entry[0] == os.getpid():
+                return entry[1]
+
+            engine = cls._create_engine(db_url, echo, pool_pre_ping)
+            cls._engines[key] = (os.getpid(), engine)
+            return engine
+
+    @classmethod
+    def _create_engine(cls, db_url: str, echo: bool = False, pool_pre_ping: bool = None):
+        """DB 종류별 엔진 생성"""
         # PostgreSQL 연결 처리
         if db_url.startswith("postgresql"):
-            self.engine = create_engine(db_url, echo=echo, pool_pre_ping=True)
+            engine = create_engine(
+                db_url,
+                echo=echo,
+                query_cache_size=cls.QUERY_CACHE_SIZE,
+                insertmanyvalues_page_size=cls.INSERTMANYVALUES_PAGE_SIZE,
+                **cls._get_pool_options_from_env(pool_pre_ping)
+            )
         # SQLite 메모리 DB의 경우 특별 처리
         elif ":memory:" in db_url:
-            self.engine = create_engine(
+            engine = create_engine(
                 db_url,
                 connect_args={"check_same_thread": False},
                 poolclass=StaticPool,
+                query_cache_size=cls.QUERY_CACHE_SIZE,
                 echo=echo
             )
         # SQLite 파일 DB
         else:
-            self.engine = create_engine(db_url, echo=echo)
+            engine = create_engine(db_url, echo=echo, query_cache_size=cls.QUERY_CACHE_SIZE)
 
-        self.SessionLocal = sessionmaker(bind=self.engine)
-        logger.info(f"데이터베이스 초기화: {db_url}")
+        if engine.dialect.name == 'sqlite':
+            cls._register_sqlite_pragmas(engine, in_memory=":memory:" in db_url)
+
+        return engine
+
+    @classmethod
+    def close_all(cls):
+        """공유 중인 모든 엔진의 커넥션 풀 정리 (프로세스 종료 전 등)"""
+        with cls._engines_lock:
+            for pid, engine in cls._engines.values():
+                if pid == os.getpid():
+                    engine.dispose()
+                else:
+                    # 부모 프로세스 소유의 커넥션은 닫지 않고 참조만 버린다
+                    engine.dispose(close=False)
+            cls._engines.clear()
 
     @staticmethod
     def _get_db_url_from_env() -> str:
@@ -77,400 +353,1289 @@ class Database:
             logger.info(f"SQLite 연결: {db_path}")
             return db_path
 
+    @classmethod
+    def _register_sqlite_pragmas(cls, engine, in_memory: bool = False):
+        """SQLite 커넥션 생성 시 PRAGMA 설정 (메모리 DB는 저널/mmap 설정 제외)"""
+        pragmas = cls.SQLITE_MEMORY_PRAGMAS if in_memory else cls.SQLITE_PRAGMAS
+
+        @event.listens_for(engine, "connect")
+        def _set_sqlite_pragmas(dbapi_conn, connection_record):
+            cursor = dbapi_conn.cursor()
+            try:
+                for pragma in pragmas:
+                    cursor.execute(pragma)
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _get_pool_options_from_env(pool_pre_ping: bool = None) -> Dict[str, Any]:
+        """환경변수에서 PostgreSQL 커넥션 풀 설정 구성 (pool_pre_ping 을 주면 환경변수 대신 사용)"""
+        if pool_pre_ping is None:
+            pool_pre_ping = os.getenv("DB_POOL_PRE_PING", "false").lower() in ("1", "true", "yes")
+        return {
+            'pool_size': int(os.getenv("DB_POOL_SIZE", "20")),
+            'max_overflow': int(os.getenv("DB_POOL_OVERFLOW", "30")),
+            'pool_recycle': int(os.getenv("DB_POOL_RECYCLE", "1800")),
+            'pool_timeout': int(os.getenv("DB_POOL_TIMEOUT", "30")),
+            # 기본은 체크아웃마다 SELECT 1 을 보내는 대신 pool_recycle 로 오래된 커넥션을 교체
+            # (오래 쉬는 배치 작업은 Database(pool_pre_ping=True) 로 켬)
+            'pool_pre_ping': pool_pre_ping,
+            # 최근 사용한 커넥션을 우선 재사용해 백엔드 캐시를 따뜻하게 유지
+            'pool_use_lifo': True,
+        }
+
     def create_tables(self):
         """테이블 생성"""
         Base.metadata.create_all(self.engine)
+        self._ensure_indexes()
         logger.info("데이터베이스 테이블 생성 완료")
 
+    def _ensure_indexes(self):
+        """
+        기존 테이블에 누락된 인덱스 생성
+
+        create_all 은 이미 존재하는 테이블에 새로 선언된 인덱스를 추가하지 않으므로
+        조회 경로에 필요한 인덱스를 개별적으로 확인 후 생성한다.
+        """
+        for model in (StockPrice, MarketData, Prediction, Trade, AICandidate, TradingSignal):
+            for index in model.__table__.indexes:
+                try:
+                    index.create(self.engine, checkfirst=True)
+                except Exception as e:
+                    if index.unique:
+                        # 기존 중복 행 때문에 유니크 인덱스를 만들지 못함 (ON CONFLICT 적재가 꺼지므로 error 로 알림)
+                        logger.error(
+                            f"유니크 인덱스 생성 실패: {index.name} - {e} "
+                            f"(scripts/migrate_{model.__tablename__}_unique.py 로 중복 행 정리 필요)"
+                        )
+                    else:
+                        logger.warning(f"인덱스 생성 실패: {index.name} - {e}")
+
+        # ON CONFLICT 적재 가능 여부를 인덱스 생성 결과로 다시 확인
+        self._price_unique_index = self._has_price_unique_index()
+        if not self._price_unique_index:
+            logger.error("stock_prices (stock_id, date) 유니크 인덱스가 없어 주가 적재 시 기존 날짜 조회로 중복을 거릅니다")
+
+        # KIS 시스템의 daily_ohlcv 테이블 (PostgreSQL 전용, 외부 테이블이므로 실패해도 계속 진행)
+        # OHLCV 컬럼을 INCLUDE 한 커버링 인덱스가 이전의 (symbol_code, trade_date) 인덱스를 대체
+        if self.engine.dialect.name == 'postgresql':
+            try:
+                with self.engine.begin() as conn:
+                    conn.execute(text(
+                        "CREATE INDEX IF NOT EXISTS ix_daily_ohlcv_symbol_date_covering "
+                        "ON daily_ohlcv (symbol_code, trade_date) "
+                        "INCLUDE (open_price, high_price, low_price, close_price, volume, trade_amount)"
+                    ))
+                    conn.execute(text("DROP INDEX IF EXISTS ix_daily_ohlcv_symbol_date"))
+            except Exception as e:
+                logger.warning(f"daily_ohlcv 인덱스 생성 실패: {e}")
+
     def drop_tables(self):
         """테이블 삭제"""
         Base.metadata.drop_all(self.engine)
+        self._ticker_id_cache.clear()
+        self._price_unique_index = None
+        self._stock_cache.clear()
+        self._portfolio_cache.clear()
         logger.info("데이터베이스 테이블 삭제 완료")
 
     def get_session(self) -> Session:
-        """세션 반환"""
+        """
+        세션 반환 (호출자가 직접 commit/close 하는 레거시 호출부용)
+
+        새 코드는 commit/rollback/close 를 자동으로 처리하는 transaction() 을 사용한다.
+        """
         return self.SessionLocal()
 
-    # ==================== Stock CRUD ====================
+    @contextmanager
+    def _session(self, session: Session = None):
+        """
+        트랜잭션 범위 세션
 
-    def add_stock(self, ticker: str, name: str, market: str = None, sector: str = None) -> Stock:
-        """종목 추가"""
-        session = self.get_session()
-        try:
-            # 기존 종목 확인
-            existing = session.query(Stock).filter(Stock.ticker == ticker).first()
-            if existing:
-                logger.info(f"종목이 이미 존재합니다: {ticker}")
-                return existing
+        블록이 정상 종료되면 commit, 예외 시 rollback 후 예외를 다시 던지고,
+        어느 경우든 세션을 닫는다. 반환할 엔티티는 블록 안에서 expunge 해야
+        commit 시 만료되지 않은 상태로 호출자에게 전달된다.
+
+        session 이 주어지면(transaction() 블록 안에서 호출된 경우) 그 세션을 그대로
+        사용하고 commit/rollback/close 는 바깥 트랜잭션에 맡긴다.
+        """
+        if session is not None:
+            yield session
+            return
 
-            stock = Stock(ticker=ticker, name=name, market=market, sector=sector)
-            session.add(stock)
+        session = self.SessionLocal()
+        try:
+            yield session
             session.commit()
-            session.refresh(stock)
-            logger.info(f"종목 추가: {ticker} - {name}")
-            return stock
-        except Exception as e:
+        except Exception:
             session.rollback()
-            logger.error(f"종목 추가 실패: {e}")
             raise
         finally:
             session.close()
 
-    def get_stock(self, ticker: str) -> Optional[Stock]:
-        """종목 조회"""
-        session = self.get_session()
+    @contextmanager
+    def transaction(self):
+        """
+        여러 쓰기 작업을 하나의 DB 트랜잭션으로 묶는 컨텍스트 매니저
+
+        블록 안의 add_* / update_portfolio 호출에 session 을 넘기면 호출마다
+        commit 하지 않고 블록 종료 시 한 번만 commit 한다 (fsync 1회).
+
+        Example:
+            with db.transaction() as session:
+                for ticker, df in price_data.items():
+                    db.add_stock_prices(ticker, df, session=session)
+        """
+        session = self.SessionLocal()
         try:
-            return session.query(Stock).filter(Stock.ticker == ticker).first()
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            # 롤백된 종목 id/조회 결과가 캐시에 남지 않도록 비움
+            self._ticker_id_cache.clear()
+            self._stock_cache.clear()
+            self._portfolio_cache.clear()
+            raise
         finally:
             session.close()
 
-    def get_all_stocks(self) -> List[Stock]:
-        """전체 종목 조회"""
-        session = self.get_session()
+    def _resolve_stock_id(self, session: Session, ticker: str) -> Optional[int]:
+        """
+        ticker로 stocks.id 조회 (프로세스 내 캐시 사용)
+
+        존재하지 않는 종목은 캐시하지 않으므로 이후 add_stock 으로 추가되면 바로 조회된다.
+        """
+        stock_id = self._ticker_id_cache.get(ticker)
+        if stock_id is None:
+            stock_id = session.query(Stock.id).filter(Stock.ticker == ticker).scalar()
+            if stock_id is not None:
+                self._ticker_id_cache[ticker] = stock_id
+        return stock_id
+
+    def get_stock_id(self, ticker: str) -> Optional[int]:
+        """
+        ticker로 stocks.id 조회
+
+        캐시에 있으면 세션을 열지 않고 바로 반환하고, 없을 때만 짧은 세션으로 한 번 조회한다.
+        """
+        stock_id = self._ticker_id_cache.get(ticker)
+        if stock_id is not None:
+            return stock_id
+
+        with self._session() as session:
+            return self._resolve_stock_id(session, ticker)
+
+    def get_stock_ids(self, tickers: List[str]) -> Dict[str, int]:
+        """
+        여러 ticker의 stocks.id 조회
+
+        Returns:
+            dict: {ticker: stock_id} (stocks 에 없는 ticker 는 제외)
+        """
+        with self._session() as session:
+            return self._resolve_stock_ids(session, tickers)
+
+    def _resolve_stock_ids(self, session: Session, tickers: List[str]) -> Dict[str, int]:
+        """여러 ticker의 stocks.id를 한 번에 조회 (캐시에 없는 ticker만 IN 조건으로 조회)"""
+        result = {}
+        missing = []
+        for ticker in dict.fromkeys(tickers):
+            stock_id = self._ticker_id_cache.get(ticker)
+            if stock_id is None:
+                missing.append(ticker)
+            else:
+                result[ticker] = stock_id
+
+        for i in range(0, len(missing), self.IN_CLAUSE_CHUNK_SIZE):
+            chunk = missing[i:i + self.IN_CLAUSE_CHUNK_SIZE]
+            for stock_id, ticker in session.query(Stock.id, Stock.ticker).filter(Stock.ticker.in_(chunk)):
+                self._ticker_id_cache[ticker] = stock_id
+                result[ticker] = stock_id
+
+        return result
+
+    def _require_stock_ids(self, session: Session, tickers: List[str]) -> Dict[str, int]:
+        """_resolve_stock_ids 와 같지만 없는 종목이 있으면 ValueError"""
+        stock_ids = self._resolve_stock_ids(session, tickers)
+        unknown = [ticker for ticker in dict.fromkeys(tickers) if ticker not in stock_ids]
+        if unknown:
+            raise ValueError(f"종목을 찾을 수 없습니다: {', '.join(unknown)}")
+        return stock_ids
+
+    @staticmethod
+    def _fetch_dtos(session: Session, dto_cls, query) -> list:
+        """Core SELECT 결과 행을 DTO 리스트로 변환 (ORM 엔티티 생성/identity map 생략)"""
+        return [dto_cls(**row._mapping) for row in session.execute(query)]
+
+    @staticmethod
+    def _parse_date(value):
+        """'YYYY-MM-DD' 문자열을 date 로 변환 (date/datetime 은 그대로 반환)"""
+        return date.fromisoformat(value) if isinstance(value, str) else value
+
+    @staticmethod
+    def _load_only(model, columns: Optional[List[str]]):
+        """
+        조회할 컬럼 이름 목록을 load_only 옵션으로 변환
+
+        None 이면 deferred 컬럼까지 전체를 읽는다 (세션 분리 후 반환하는 객체용).
+        목록을 주더라도 PK 와 __repr__ 가 읽는 컬럼(model.REPR_COLUMNS)은 항상 함께 로드해
+        세션 분리 후 로그/디버깅 출력에서 DetachedInstanceError 가 나지 않게 한다.
+        """
+        if not columns:
+            return [undefer('*')]
+        names = dict.fromkeys(
+            [column.key for column in model.__mapper__.primary_key]
+            + list(getattr(model, 'REPR_COLUMNS', ()))
+            + list(columns)
+        )
+        return [load_only(*(getattr(model, name) for name in names))]
+
+    # ==================== Stock CRUD ====================
+
+    def add_stock(self, ticker: str, name: str, market: str = None, sector: str = None,
+                  session: Session = None) -> Stock:
+        """종목 추가"""
         try:
-            return session.query(Stock).all()
-        finally:
-            session.close()
+            with self._session(session) as session:
+                # 기존 종목 확인
+                existing = session.query(Stock).filter(Stock.ticker == ticker).first()
+                if existing:
+                    logger.debug("종목이 이미 존재합니다: {}", ticker)
+                    self._ticker_id_cache[ticker] = existing.id
+                    session.expunge(existing)
+                    return existing
+
+                stock = Stock(ticker=ticker, name=name, market=market, sector=sector)
+                session.add(stock)
+                session.flush()
+                self._ticker_id_cache[ticker] = stock.id
+                self._stock_cache.clear()
+                session.expunge(stock)
+                logger.info(f"종목 추가: {ticker} - {name}")
+                return stock
+        except Exception as e:
+            logger.error(f"종목 추가 실패: {e}")
+            raise
+
+    def get_stock(self, ticker: str) -> Optional[StockDTO]:
+        """종목 조회 (STOCK_CACHE_TTL 동안 캐시)"""
+        stock = self._stock_cache.get(('stock', ticker))
+        if stock is not None:
+            return stock
+
+        with self._session() as session:
+            stocks = self._fetch_dtos(session, StockDTO, select(Stock.__table__).where(Stock.ticker == ticker))
+
+        stock = stocks[0] if stocks else None
+        if stock is not None:
+            self._ticker_id_cache[ticker] = stock.id
+            self._stock_cache.set(('stock', ticker), stock)
+        return stock
+
+    def get_all_stocks(self) -> List[StockDTO]:
+        """전체 종목 조회 (STOCK_CACHE_TTL 동안 캐시)"""
+        stocks = self._stock_cache.get('all')
+        if stocks is None:
+            with self._session() as session:
+                stocks = self._fetch_dtos(session, StockDTO, select(Stock.__table__))
+            self._stock_cache.set('all', stocks)
+        return list(stocks)
+
+    def get_stocks_with_recent_prices(self, days: int = 60, tickers: List[str] = None) -> List[Stock]:
+        """
+        종목과 최근 N일 종가를 함께 조회 (종목 수와 무관하게 쿼리 2번)
+
+        Stock.prices 를 종목마다 lazy 로드하면 종목 수만큼 쿼리가 나가므로(N+1)
+        selectinload 로 최근 구간의 (date, close) 만 IN 쿼리 한 번에 읽는다.
+        세션 분리 후에도 __repr__ 가 동작하도록 PK 와 stock_id 도 함께 로드한다.
+
+        Args:
+            days: 조회할 최근 일수
+            tickers: 종목코드 목록 (None이면 전체)
+
+        Returns:
+            List[Stock]: prices 가 로드된 종목 (세션 분리됨)
+        """
+        cutoff = date.today() - timedelta(days=days)
+        query = select(Stock).options(
+            selectinload(Stock.prices.and_(StockPrice.date >= cutoff)).options(
+                load_only(StockPrice.id, StockPrice.stock_id, StockPrice.date, StockPrice.close)
+            )
+        ).order_by(Stock.ticker)
+        if tickers:
+            query = query.where(Stock.ticker.in_(tickers))
+
+        with self._session() as session:
+            stocks = session.execute(query).scalars().all()
+            session.expunge_all()
+
+        logger.debug("최근 {}일 주가 포함 종목 조회: {}개", days, len(stocks))
+        return stocks
 
     # ==================== StockPrice CRUD ====================
 
-    def add_stock_prices(self, ticker: str, df: pd.DataFrame) -> int:
-        """주가 데이터 추가 (DataFrame)"""
-        session = self.get_session()
+    def add_stock_prices(self, ticker: str, df: pd.DataFrame, session: Session = None,
+                         chunksize: int = None) -> int:
+        """
+        주가 데이터 추가 (DataFrame)
+
+        Args:
+            chunksize: INSERT/COPY 한 번에 보낼 행 수 (None이면 INSERT_CHUNK_SIZE)
+        """
         try:
-            stock = session.query(Stock).filter(Stock.ticker == ticker).first()
-            if not stock:
-                logger.error(f"종목을 찾을 수 없습니다: {ticker}")
-                return 0
+            with self._session(session) as session:
+                stock_id = self._resolve_stock_id(session, ticker)
+                if stock_id is None:
+                    logger.error(f"종목을 찾을 수 없습니다: {ticker}")
+                    return 0
+
+                df = self._normalize_price_frame(df)
+                df = df[~df.index.duplicated(keep='first')]
+
+                # 청크 단위로 나눠 저장해 파라미터/버퍼 크기를 청크 크기로 제한
+                write_chunk = self._copy_stock_prices if self._supports_copy() else self._insert_stock_prices
+                chunksize = chunksize or self.INSERT_CHUNK_SIZE
+
+                count = 0
+                for i in range(0, len(df), chunksize):
+                    started = time.perf_counter()
+                    written = write_chunk(session, stock_id, df.iloc[i:i + chunksize])
+                    count += written
+                    logger.debug(
+                        "{} 주가 청크 저장: {}행 중 {}건, {:.1f}ms",
+                        ticker, min(chunksize, len(df) - i), written, (time.perf_counter() - started) * 1000
+                    )
+
+                if count:
+                    self._invalidate_price_cache(ticker, df.index)
+
+                logger.debug("{} 주가 데이터 {}건 추가", ticker, count)
+                return count
+        except Exception as e:
+            logger.error(f"주가 데이터 추가 실패: {e}")
+            raise
 
-            count = 0
-            for idx, row in df.iterrows():
-                date = idx if isinstance(idx, datetime) else pd.to_datetime(idx)
+    def _supports_copy(self) -> bool:
+        """PostgreSQL COPY 사용 가능 여부 (psycopg2 드라이버)"""
+        return self.engine.dialect.name == 'postgresql' and self.engine.dialect.driver == 'psycopg2'
 
-                # 중복 체크
-                existing = session.query(StockPrice).filter(
-                    and_(StockPrice.stock_id == stock.id, StockPrice.date == date)
-                ).first()
+    def _insert_stock_prices(self, session: Session, stock_id: int, df: pd.DataFrame) -> int:
+        """
+        정규화된 주가 DataFrame을 executemany INSERT 로 저장
 
-                if existing:
-                    continue
-
-                price = StockPrice(
-                    stock_id=stock.id,
-                    date=date,
-                    open=float(row.get('Open', row.get('시가', 0))),
-                    high=float(row.get('High', row.get('고가', 0))),
-                    low=float(row.get('Low', row.get('저가', 0))),
-                    close=float(row.get('Close', row.get('종가', 0))),
-                    volume=int(row.get('Volume', row.get('거래량', 0))),
-                    amount=float(row.get('Amount', row.get('거래대금', 0))) if 'Amount' in row or '거래대금' in row else None
+        SQLite/PostgreSQL은 (stock_id, date) 유니크 인덱스에 대해 ON CONFLICT DO NOTHING 으로
+        DB가 중복을 걸러내므로 기존 날짜를 미리 조회하지 않는다. 그 외 DB나 유니크 인덱스가
+        없는 DB는 기존 날짜를 IN 조건으로 한 번에 조회해 제외한다.
+        """
+        if df.empty:
+            return 0
+
+        if self._supports_on_conflict():
+            return self._insert_price_records(session, self._price_records(stock_id, df))
+
+        # 중복 체크: 행마다 SELECT 하지 않고 기존 날짜를 한 번에 조회
+        dates = df.index.date.tolist()
+
+        existing_dates = set()
+        for i in range(0, len(dates), self.IN_CLAUSE_CHUNK_SIZE):
+            chunk = dates[i:i + self.IN_CLAUSE_CHUNK_SIZE]
+            existing_dates.update(
+                d for (d,) in session.query(StockPrice.date).filter(
+                    and_(StockPrice.stock_id == stock_id, StockPrice.date.in_(chunk))
+                ).all()
+            )
+
+        records = self._price_records(stock_id, df[~df.index.isin(pd.to_datetime(list(existing_dates)))])
+        if records:
+            session.connection().execute(_STOCK_PRICE_INSERT_STMT, records)
+        return len(records)
+
+    def _exclude_existing_prices(self, session: Session, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        이미 저장된 (stock_id, date) 행과 묶음 안의 중복 행을 제외 (ON CONFLICT 를 쓸 수 없을 때)
+
+        종목별 기존 날짜를 IN 조건으로 한 번에 조회한다.
+        """
+        dates_by_stock: Dict[int, set] = {}
+        for row in rows:
+            dates_by_stock.setdefault(row['stock_id'], set()).add(pd.Timestamp(row['date']).date())
+
+        existing = set()
+        for stock_id, stock_dates in dates_by_stock.items():
+            stock_dates = sorted(stock_dates)
+            for i in range(0, len(stock_dates), self.IN_CLAUSE_CHUNK_SIZE):
+                chunk = stock_dates[i:i + self.IN_CLAUSE_CHUNK_SIZE]
+                existing.update(
+                    (stock_id, d) for (d,) in session.query(StockPrice.date).filter(
+                        and_(StockPrice.stock_id == stock_id, StockPrice.date.in_(chunk))
+                    ).all()
                 )
-                session.add(price)
-                count += 1
 
-            session.commit()
-            logger.info(f"{ticker} 주가 데이터 {count}건 추가")
-            return count
+        new_rows = []
+        for row in rows:
+            key = (row['stock_id'], pd.Timestamp(row['date']).date())
+            if key not in existing:
+                existing.add(key)
+                new_rows.append(row)
+        return new_rows
+
+    def _supports_on_conflict(self) -> bool:
+        """
+        INSERT ... ON CONFLICT (stock_id, date) DO NOTHING 사용 가능 여부
+
+        ON CONFLICT 대상인 유니크 인덱스가 있어야 하므로, 기존 중복 행 때문에 인덱스를 만들지 못한 DB
+        (scripts/migrate_stock_prices_unique.py 실행 전)는 기존 날짜를 조회해 거르는 방식으로 저장한다.
+        """
+        if self.engine.dialect.name not in ('sqlite', 'postgresql'):
+            return False
+        if self._price_unique_index is None:
+            self._price_unique_index = self._has_price_unique_index()
+        return self._price_unique_index
+
+    def _has_price_unique_index(self) -> bool:
+        """stock_prices 에 (stock_id, date) 유니크 인덱스/제약이 있는지 확인"""
+        try:
+            inspector = inspect(self.engine)
+            key = ['stock_id', 'date']
+            return (
+                any(index['unique'] and index['column_names'] == key
+                    for index in inspector.get_indexes(StockPrice.__tablename__))
+                or any(constraint['column_names'] == key
+                       for constraint in inspector.get_unique_constraints(StockPrice.__tablename__))
+            )
         except Exception as e:
-            session.rollback()
-            logger.error(f"주가 데이터 추가 실패: {e}")
+            logger.warning(f"stock_prices 유니크 인덱스 확인 실패: {e}")
+            return False
+
+    def _insert_price_records(self, session: Session, records: List[Dict[str, Any]]) -> int:
+        """stock_prices 행을 ON CONFLICT (stock_id, date) DO NOTHING executemany 로 저장 (저장 건수 반환)"""
+        stmt = _STOCK_PRICE_UPSERT_STMTS[self.engine.dialect.name]
+        result = session.connection().execute(stmt, records)
+        return result.rowcount if result.rowcount >= 0 else len(records)
+
+    def bulk_insert_prices(self, rows, chunksize: int = None, session: Session = None) -> int:
+        """
+        여러 종목의 주가 행을 종목 구분 없이 Core INSERT executemany 로 일괄 저장 (야간 적재용)
+
+        add_stock_prices 와 달리 ticker 조회/정규화 없이 stocks.id 가 채워진 행을 그대로 저장한다.
+        이미 있는 (stock_id, date)는 건너뛴다.
+
+        Args:
+            rows: stock_prices 컬럼명(stock_id, date, open, high, low, close, volume, amount)을 가진
+                DataFrame 또는 딕셔너리 리스트
+            chunksize: INSERT 한 번에 보낼 행 수 (None이면 BULK_INSERT_CHUNK_SIZE)
+
+        Returns:
+            int: 저장된 건수
+        """
+        if isinstance(rows, pd.DataFrame):
+            # 가격 컬럼은 INTEGER 라 원 단위로 반올림
+            frame = rows.assign(**{
+                column: rows[column].astype('float64').round().astype('int64')
+                for column in ('open', 'high', 'low', 'close') if column in rows.columns
+            }).astype(object)
+            rows = frame.where(frame.notna(), None).to_dict(orient='records')
+        if not rows:
+            return 0
+
+        chunksize = chunksize or self.BULK_INSERT_CHUNK_SIZE
+        try:
+            with self._session(session) as session:
+                count = 0
+                for i in range(0, len(rows), chunksize):
+                    chunk = rows[i:i + chunksize]
+                    if self._supports_on_conflict():
+                        count += self._insert_price_records(session, chunk)
+                    else:
+                        chunk = self._exclude_existing_prices(session, chunk)
+                        if chunk:
+                            session.connection().execute(_STOCK_PRICE_INSERT_STMT, chunk)
+                        count += len(chunk)
+
+                self._invalidate_price_cache_for_rows(session, rows)
+                logger.info(f"주가 일괄 저장: {len(rows)}행 중 {count}건")
+                return count
+        except Exception as e:
+            logger.error(f"주가 일괄 저장 실패: {e}")
             raise
-        finally:
-            session.close()
 
-    def get_stock_prices(self, ticker: str, start_date: datetime = None, end_date: datetime = None) -> pd.DataFrame:
-        """주가 데이터 조회"""
-        session = self.get_session()
+    @staticmethod
+    def _price_records(stock_id: int, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """정규화된 주가 DataFrame -> stock_prices INSERT 파라미터 리스트"""
+        return [{
+            'stock_id': stock_id,
+            'date': price_date,
+            'open': open_,
+            'high': high,
+            'low': low,
+            'close': close,
+            'volume': volume,
+            'amount': amount
+        } for price_date, open_, high, low, close, volume, amount in zip(
+            df.index.to_pydatetime(),
+            df['Open'].tolist(),
+            df['High'].tolist(),
+            df['Low'].tolist(),
+            df['Close'].tolist(),
+            df['Volume'].tolist(),
+            df['Amount'].tolist()
+        )]
+
+    def _copy_stock_prices(self, session: Session, stock_id: int, df: pd.DataFrame) -> int:
+        """
+        PostgreSQL COPY 로 주가 데이터 저장
+
+        DataFrame을 CSV 버퍼로 임시 테이블에 COPY 한 뒤 INSERT ... SELECT ...
+        ON CONFLICT DO NOTHING 으로 옮겨 이미 있는 (stock_id, date)는 건너뛴다.
+        유니크 인덱스가 없으면 ON CONFLICT 대신 NOT EXISTS 조건으로 거른다.
+        세션의 커넥션을 그대로 사용하므로 바깥 트랜잭션에 포함된다.
+        """
+        if df.empty:
+            return 0
+
+        buffer = io.StringIO()
+        df.assign(stock_id=stock_id)[
+            ['stock_id', 'Open', 'High', 'Low', 'Close', 'Volume', 'Amount']
+        ].to_csv(buffer, header=False, date_format='%Y-%m-%d')
+        buffer.seek(0)
+
+        cursor = session.connection().connection.cursor()
         try:
-            stock = session.query(Stock).filter(Stock.ticker == ticker).first()
-            if not stock:
+            cursor.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS _stock_prices_staging ("
+                "date DATE, stock_id INTEGER, open INTEGER, high INTEGER, "
+                "low INTEGER, close INTEGER, volume BIGINT, amount DOUBLE PRECISION"
+                ") ON COMMIT DELETE ROWS"
+            )
+            cursor.execute("TRUNCATE _stock_prices_staging")
+            cursor.copy_expert(
+                "COPY _stock_prices_staging (date, stock_id, open, high, low, close, volume, amount) "
+                "FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+            if self._supports_on_conflict():
+                cursor.execute(
+                    "INSERT INTO stock_prices (stock_id, date, open, high, low, close, volume, amount) "
+                    "SELECT stock_id, date, open, high, low, close, volume, amount "
+                    "FROM _stock_prices_staging "
+                    "ON CONFLICT (stock_id, date) DO NOTHING"
+                )
+            else:
+                cursor.execute(
+                    "INSERT INTO stock_prices (stock_id, date, open, high, low, close, volume, amount) "
+                    "SELECT s.stock_id, s.date, s.open, s.high, s.low, s.close, s.volume, s.amount "
+                    "FROM _stock_prices_staging s "
+                    "WHERE NOT EXISTS (SELECT 1 FROM stock_prices p WHERE p.stock_id = s.stock_id AND p.date = s.date)"
+                )
+            return max(cursor.rowcount, 0)
+        finally:
+            cursor.close()
+
+    def add_stock_prices_many(self, price_data: Dict[str, pd.DataFrame], max_workers: int = None) -> Dict[str, int]:
+        """
+        여러 종목의 주가 데이터를 스레드 풀로 병렬 추가
+
+        종목마다 별도 세션/커넥션으로 add_stock_prices 를 실행한다. SQLite는 쓰기 잠금이
+        DB 전체에 걸리므로 순차 실행하고, PostgreSQL은 커넥션 풀 크기만큼 동시에 처리한다.
+        한 종목이 실패해도 나머지는 계속 진행한다.
+
+        Args:
+            price_data: {ticker: 주가 DataFrame}
+            max_workers: 동시 작업 수 (None이면 커넥션 풀 크기)
+
+        Returns:
+            dict: {ticker: 추가된 건수} (실패한 종목은 0)
+        """
+        if not price_data:
+            return {}
+
+        if self.engine.dialect.name == 'sqlite':
+            max_workers = 1
+        elif max_workers is None:
+            pool_size = getattr(self.engine.pool, 'size', None)
+            max_workers = pool_size() if callable(pool_size) else 1
+        max_workers = max(1, min(max_workers, len(price_data)))
+
+        # 종목 id를 IN 조회 한 번으로 캐시에 올려 두어 스레드마다 SELECT 하지 않게 함
+        self.get_stock_ids(list(price_data))
+
+        def _add(ticker: str) -> int:
+            try:
+                return self.add_stock_prices(ticker, price_data[ticker])
+            except Exception as e:
+                logger.error(f"{ticker} 주가 데이터 추가 실패: {e}")
+                return 0
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            counts = dict(zip(price_data, executor.map(_add, price_data)))
+
+        logger.info(f"주가 데이터 일괄 추가: {len(counts)}개 종목, {sum(counts.values())}건 (workers={max_workers})")
+        return counts
+
+    @classmethod
+    def _normalize_price_frame(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        주가 DataFrame을 저장용 형식으로 정규화
+
+        한글 컬럼명(시가, 고가 ...)을 영문으로 바꾸고 인덱스를 datetime으로 변환한다.
+        영문 컬럼이 이미 있으면 영문 컬럼을 우선하며, 없는 OHLCV 컬럼은 0,
+        거래대금이 없으면 None 으로 채운다.
+        """
+        df = df.rename(columns={
+            ko: en for ko, en in cls.PRICE_COLUMN_MAP.items()
+            if ko in df.columns and en not in df.columns
+        })
+
+        result = pd.DataFrame(index=pd.to_datetime(df.index))
+        # 가격 컬럼은 INTEGER 라 원 단위로 반올림 (결측이 남아 있으면 여기서 오류)
+        for column in ('Open', 'High', 'Low', 'Close'):
+            result[column] = df[column].astype('float64').round().astype('int64').to_numpy() if column in df.columns else 0
+        result['Volume'] = df['Volume'].to_numpy(dtype='int64') if 'Volume' in df.columns else 0
+
+        if 'Amount' in df.columns:
+            amount = pd.Series(df['Amount'].to_numpy(dtype='float64'), index=result.index, dtype=object)
+            result['Amount'] = amount.where(amount.notna(), None)
+        else:
+            result['Amount'] = None
+
+        return result
+
+    def _stock_prices_query(self, stock_id: int, start_date: datetime = None, end_date: datetime = None):
+        """주가 조회용 SELECT 문 구성 (컬럼명은 get_stock_prices 반환 형식과 동일)"""
+        query = select(
+            StockPrice.date.label('Date'),
+            StockPrice.open.label('Open'),
+            StockPrice.high.label('High'),
+            StockPrice.low.label('Low'),
+            StockPrice.close.label('Close'),
+            StockPrice.volume.label('Volume'),
+            StockPrice.amount.label('Amount')
+        ).where(StockPrice.stock_id == stock_id)
+
+        # date 컬럼과 비교하므로 date 로 맞춤 (datetime 을 넘기면 SQLite에서 문자열 비교가 어긋남)
+        if start_date:
+            query = query.where(StockPrice.date >= pd.Timestamp(start_date).date())
+        if end_date:
+            query = query.where(StockPrice.date <= pd.Timestamp(end_date).date())
+
+        return query.order_by(StockPrice.date)
+
+    @staticmethod
+    def _price_column_dtypes(dtype: str = 'float64', dtype_backend: str = 'numpy') -> Dict[str, str]:
+        """주가 컬럼별 dtype (dtype_backend='pyarrow'면 Arrow 기반 dtype, 예: 'float64[pyarrow]')"""
+        column_dtypes = {column: dtype for column in ('Open', 'High', 'Low', 'Close', 'Amount')}
+        column_dtypes['Volume'] = 'int64'
+        if dtype_backend == 'pyarrow':
+            if not PYARROW_AVAILABLE:
+                raise ImportError("dtype_backend='pyarrow' 를 사용하려면 pyarrow 가 필요합니다.")
+            column_dtypes = {column: f"{value}[pyarrow]" for column, value in column_dtypes.items()}
+        return column_dtypes
+
+    def iter_stock_prices(self, ticker: str, start_date: datetime = None, end_date: datetime = None,
+                          chunksize: int = None, dtype: str = 'float64',
+                          dtype_backend: str = 'numpy') -> Iterator[pd.DataFrame]:
+        """
+        주가 데이터를 chunksize 행 단위 DataFrame으로 나눠 조회 (제너레이터)
+
+        서버 측 커서(stream_results)로 읽으므로 장기간 백필에서도 메모리 사용량이
+        전체 행 수가 아니라 청크 크기에 비례한다. 컬럼 dtype을 미리 지정해
+        pandas의 청크별 dtype 추론을 생략한다.
+
+        Args:
+            dtype: 가격/거래대금 컬럼 dtype ('float64' 또는 메모리를 절반으로 줄이는 'float32')
+            dtype_backend: 'numpy' (기본) 또는 'pyarrow' (Arrow 버퍼 기반 컬럼, pyarrow 필요)
+        """
+        chunksize = chunksize or self.PRICE_FETCH_CHUNK_SIZE
+        column_dtypes = self._price_column_dtypes(dtype, dtype_backend)
+
+        with self._session() as session:
+            stock_id = self._resolve_stock_id(session, ticker)
+            if stock_id is None:
                 logger.warning(f"종목을 찾을 수 없습니다: {ticker}")
-                return pd.DataFrame()
+                return
+
+            conn = session.connection(execution_options={'stream_results': True})
+            for chunk in pd.read_sql_query(
+                self._stock_prices_query(stock_id, start_date, end_date),
+                conn,
+                index_col='Date',
+                parse_dates=['Date'],
+                chunksize=chunksize,
+                dtype=column_dtypes
+            ):
+                yield chunk
+
+    def get_stock_prices(self, ticker: str, start_date: datetime = None, end_date: datetime = None,
+                         dtype: str = 'float64', dtype_backend: str = 'numpy') -> pd.DataFrame:
+        """
+        주가 데이터 조회
 
-            query = session.query(StockPrice).filter(StockPrice.stock_id == stock.id)
+        Args:
+            dtype: 가격/거래대금 컬럼 dtype ('float64' 기본, ML 입력 등에는 'float32')
+            dtype_backend: 'numpy' (기본) 또는 'pyarrow' (Arrow 기반 컬럼으로 메모리/변환 비용 절감)
+        """
+        if self.price_cache_enabled and start_date and end_date:
+            return self._get_cached_stock_prices(ticker, start_date, end_date, dtype, dtype_backend)
 
-            if start_date:
-                query = query.filter(StockPrice.date >= start_date)
-            if end_date:
-                query = query.filter(StockPrice.date <= end_date)
-
-            prices = query.order_by(StockPrice.date).all()
-
-            if not prices:
-                return pd.DataFrame()
-
-            data = [{
-                'Date': p.date,
-                'Open': p.open,
-                'High': p.high,
-                'Low': p.low,
-                'Close': p.close,
-                'Volume': p.volume,
-                'Amount': p.amount
-            } for p in prices]
-
-            df = pd.DataFrame(data)
-            df.set_index('Date', inplace=True)
-            return df
-        finally:
-            session.close()
+        return self._fetch_stock_prices(ticker, start_date, end_date, dtype, dtype_backend)
+
+    def _fetch_stock_prices(self, ticker: str, start_date: datetime = None, end_date: datetime = None,
+                            dtype: str = 'float64', dtype_backend: str = 'numpy') -> pd.DataFrame:
+        """DB에서 주가 데이터 조회 (캐시 미사용)"""
+        chunks = [
+            chunk for chunk in self.iter_stock_prices(ticker, start_date, end_date, dtype=dtype,
+                                                      dtype_backend=dtype_backend)
+            if not chunk.empty
+        ]
+
+        if not chunks:
+            return pd.DataFrame()
+
+        return chunks[0] if len(chunks) == 1 else pd.concat(chunks)
+
+    # ==================== 주가 Parquet 캐시 ====================
+    # 지난 달 데이터는 월 단위 Parquet 파일로 저장해 반복 조회(백테스트)를 로컬 디스크에서 처리한다.
+    # 이번 달 이후는 아직 바뀌므로 항상 DB에서 읽는다. add_stock_prices 가 저장한 달의 파일은 삭제한다.
+
+    def _price_cache_path(self, ticker: str, month: pd.Period) -> Path:
+        return Path(self.PRICE_CACHE_DIR) / self._cache_namespace / ticker / f"{month.year:04d}{month.month:02d}.parquet"
+
+    def _get_cached_stock_prices(self, ticker: str, start_date: datetime, end_date: datetime,
+                                 dtype: str = 'float64', dtype_backend: str = 'numpy') -> pd.DataFrame:
+        """월별 Parquet 캐시를 우선 사용하는 주가 조회 (없는 달만 DB에서 한 번에 조회 후 저장)"""
+        if self.get_stock_id(ticker) is None:
+            logger.warning(f"종목을 찾을 수 없습니다: {ticker}")
+            return pd.DataFrame()
+
+        start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+        current_month = pd.Period(date.today(), freq='M')
+
+        frames, missing = [], []
+        for month in pd.period_range(start, end, freq='M'):
+            cached = self._load_price_cache(ticker, month) if month < current_month else None
+            if cached is None:
+                missing.append(month)
+            else:
+                frames.append(cached)
+
+        if missing:
+            fetched = self._fetch_stock_prices(ticker, missing[0].start_time, missing[-1].end_time)
+            for month in missing:
+                part = fetched.loc[month.start_time:month.end_time] if not fetched.empty else fetched
+                if month < current_month:
+                    self._save_price_cache(ticker, month, part)
+                frames.append(part)
+
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame()
+
+        df = pd.concat(frames).sort_index().loc[start:end]
+        if dtype != 'float64' or dtype_backend != 'numpy':
+            df = df.astype(self._price_column_dtypes(dtype, dtype_backend))
+        return df
+
+    def _load_price_cache(self, ticker: str, month: pd.Period) -> Optional[pd.DataFrame]:
+        """월별 주가 캐시 읽기 (없거나 손상되면 None)"""
+        path = self._price_cache_path(ticker, month)
+        if not path.exists():
+            return None
+        try:
+            return pd.read_parquet(path)
+        except Exception as e:
+            logger.warning(f"주가 캐시 파일 읽기 실패: {path} - {e}")
+            return None
+
+    def _save_price_cache(self, ticker: str, month: pd.Period, df: pd.DataFrame):
+        """월별 주가 캐시 저장 (실패해도 조회 결과에는 영향 없음)"""
+        path = self._price_cache_path(ticker, month)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            df.to_parquet(tmp_path, compression='zstd')
+            tmp_path.replace(path)
+        except Exception as e:
+            logger.warning(f"주가 캐시 파일 저장 실패: {path} - {e}")
+
+    def _invalidate_price_cache_for_rows(self, session: Session, rows: List[Dict[str, Any]]):
+        """stock_id 기준 주가 행이 저장된 종목/달의 캐시 파일 삭제"""
+        if not self.price_cache_enabled:
+            return
+        frame = pd.DataFrame({
+            'stock_id': [row['stock_id'] for row in rows],
+            'date': pd.to_datetime([row['date'] for row in rows])
+        })
+        tickers = dict(session.query(Stock.id, Stock.ticker).filter(
+            Stock.id.in_(frame['stock_id'].unique().tolist())
+        ).all())
+        for stock_id, group in frame.groupby('stock_id'):
+            if stock_id in tickers:
+                self._invalidate_price_cache(tickers[stock_id], pd.DatetimeIndex(group['date']))
+
+    def _invalidate_price_cache(self, ticker: str, dates: pd.DatetimeIndex):
+        """주가가 추가된 달의 캐시 파일 삭제"""
+        if not self.price_cache_enabled:
+            return
+        for month in dates.to_period('M').unique():
+            try:
+                self._price_cache_path(ticker, month).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"주가 캐시 파일 삭제 실패: {ticker} {month} - {e}")
+
+    # ==================== 주가 Parquet 데이터셋 (DuckDB 조회) ====================
+    # stock_prices 를 연/월 파티션 Parquet 데이터셋으로 내보내고, 백테스트·지표 계산처럼
+    # 필요한 컬럼만 대량으로 스캔하는 조회는 DuckDB SQL로 처리한다 (거래/포트폴리오는 ORM 그대로).
+
+    def export_prices_to_parquet(self, out_dir: str = None, partition: str = 'year') -> int:
+        """
+        stock_prices 전체를 Parquet 데이터셋으로 내보내기 (기존 데이터셋은 교체)
+
+        Args:
+            out_dir: 데이터셋 경로 (None이면 PRICE_LAKE_DIR)
+            partition: 'year' 또는 'month' (year/month 디렉터리로 파티션)
+
+        Returns:
+            int: 내보낸 행 수
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("export_prices_to_parquet 를 사용하려면 pyarrow 가 필요합니다.")
+        if partition not in ('year', 'month'):
+            raise ValueError(f"지원하지 않는 파티션: {partition}")
+
+        out_path = Path(out_dir or self.PRICE_LAKE_DIR)
+        partition_cols = ['year'] if partition == 'year' else ['year', 'month']
+
+        query = select(
+            Stock.ticker, StockPrice.stock_id, StockPrice.date,
+            StockPrice.open, StockPrice.high, StockPrice.low, StockPrice.close,
+            StockPrice.volume, StockPrice.amount
+        ).join(Stock, Stock.id == StockPrice.stock_id).order_by(StockPrice.date, StockPrice.stock_id)
+
+        # 새 데이터셋을 임시 경로에 만든 뒤 교체 (내보내는 중에도 기존 데이터셋 조회 가능)
+        tmp_path = out_path.with_name(out_path.name + '.tmp')
+        if tmp_path.exists():
+            shutil.rmtree(tmp_path)
+
+        count = 0
+        with self._session() as session:
+            conn = session.connection(execution_options={'stream_results': True})
+            for chunk in pd.read_sql_query(query, conn, parse_dates=['date'], chunksize=self.PRICE_FETCH_CHUNK_SIZE * 10):
+                chunk['year'] = chunk['date'].dt.year.astype('int16')
+                if partition == 'month':
+                    chunk['month'] = chunk['date'].dt.month.astype('int8')
+                pq.write_to_dataset(
+                    pa.Table.from_pandas(chunk, preserve_index=False),
+                    root_path=str(tmp_path),
+                    partition_cols=partition_cols,
+                    compression='zstd'
+                )
+                count += len(chunk)
+
+        if out_path.exists():
+            shutil.rmtree(out_path)
+        if count:
+            tmp_path.replace(out_path)
+
+        logger.info(f"주가 Parquet 데이터셋 내보내기: {count}행 -> {out_path}")
+        return count
+
+    def query_prices(self, sql: str, params: list = None, lake_dir: str = None) -> pd.DataFrame:
+        """
+        주가 Parquet 데이터셋을 DuckDB SQL로 조회
+
+        데이터셋은 prices 뷰로 노출된다 (컬럼: ticker, stock_id, date, open, high, low, close,
+        volume, amount, year[, month]). year/month 조건은 파티션 디렉터리 단위로 걸러진다.
+
+            db.query_prices("SELECT ticker, date, close FROM prices WHERE year >= ? ORDER BY ticker, date", [2023])
+
+        Args:
+            sql: DuckDB SQL
+            params: ? 자리 파라미터
+            lake_dir: 데이터셋 경로 (None이면 PRICE_LAKE_DIR)
+        """
+        if not DUCKDB_AVAILABLE:
+            raise ImportError("query_prices 를 사용하려면 duckdb 가 필요합니다.")
+
+        pattern = (Path(lake_dir or self.PRICE_LAKE_DIR) / '**' / '*.parquet').as_posix().replace("'", "''")
+        with duckdb.connect() as conn:
+            conn.execute(
+                f"CREATE VIEW prices AS SELECT * FROM read_parquet('{pattern}', hive_partitioning = true)"
+            )
+            return conn.execute(sql, params or []).df()
 
     # ==================== Prediction CRUD ====================
 
     def add_prediction(self, ticker: str, target_date: datetime, model_name: str,
-                      predicted_price: float, confidence: float = None) -> Prediction:
+                      predicted_price: float, confidence: float = None, session: Session = None) -> Prediction:
         """예측 결과 추가"""
-        session = self.get_session()
-        try:
-            stock = session.query(Stock).filter(Stock.ticker == ticker).first()
-            if not stock:
-                raise ValueError(f"종목을 찾을 수 없습니다: {ticker}")
-
-            prediction = Prediction(
-                stock_id=stock.id,
-                prediction_date=datetime.now(),
-                target_date=target_date,
-                model_name=model_name,
-                predicted_price=predicted_price,
-                confidence=confidence
-            )
-            session.add(prediction)
-            session.commit()
-            session.refresh(prediction)
-            logger.info(f"예측 추가: {ticker}, 모델: {model_name}, 가격: {predicted_price}")
-            return prediction
+        try:
+            with self._session(session) as session:
+                stock_id = self._resolve_stock_id(session, ticker)
+                if stock_id is None:
+                    raise ValueError(f"종목을 찾을 수 없습니다: {ticker}")
+
+                prediction = Prediction(
+                    stock_id=stock_id,
+                    prediction_date=datetime.now(),
+                    target_date=target_date,
+                    model_name=model_name,
+                    predicted_price=predicted_price,
+                    confidence=confidence
+                )
+                session.add(prediction)
+                session.flush()
+                session.expunge(prediction)
+                logger.debug("예측 추가: {}, 모델: {}, 가격: {}", ticker, model_name, predicted_price)
+                return prediction
         except Exception as e:
-            session.rollback()
             logger.error(f"예측 추가 실패: {e}")
             raise
-        finally:
-            session.close()
 
-    def get_predictions(self, ticker: str, model_name: str = None) -> List[Prediction]:
-        """예측 결과 조회"""
-        session = self.get_session()
+    def add_predictions_bulk(self, rows: List[Dict[str, Any]], session: Session = None) -> int:
+        """
+        예측 결과 일괄 추가 (단일 트랜잭션, 단일 INSERT 배치)
+
+        Args:
+            rows: 예측 딕셔너리 리스트
+                - ticker, target_date, model_name, predicted_price (필수)
+                - confidence (선택)
+
+        Returns:
+            int: 추가된 건수
+        """
+        if not rows:
+            return 0
+
         try:
-            stock = session.query(Stock).filter(Stock.ticker == ticker).first()
-            if not stock:
+            with self._session(session) as session:
+                stock_ids = self._require_stock_ids(session, [row['ticker'] for row in rows])
+
+                prediction_date = datetime.now()
+                mappings = [{
+                    'stock_id': stock_ids[row['ticker']],
+                    'prediction_date': prediction_date,
+                    'target_date': row['target_date'],
+                    'model_name': row['model_name'],
+                    'predicted_price': row['predicted_price'],
+                    'confidence': row.get('confidence')
+                } for row in rows]
+
+                Prediction.bulk_insert(session, mappings)
+                logger.info(f"예측 일괄 추가: {len(mappings)}건")
+                return len(mappings)
+        except Exception as e:
+            logger.error(f"예측 일괄 추가 실패: {e}")
+            raise
+
+    def get_predictions(self, ticker: str, model_name: str = None) -> List[PredictionDTO]:
+        """예측 결과 조회"""
+        with self._session() as session:
+            stock_id = self._resolve_stock_id(session, ticker)
+            if stock_id is None:
                 return []
 
-            query = session.query(Prediction).filter(Prediction.stock_id == stock.id)
+            query = select(Prediction.__table__).where(Prediction.stock_id == stock_id)
             if model_name:
-                query = query.filter(Prediction.model_name == model_name)
+                query = query.where(Prediction.model_name == model_name)
 
-            return query.order_by(Prediction.prediction_date.desc()).all()
-        finally:
-            session.close()
+            return self._fetch_dtos(session, PredictionDTO, query.order_by(Prediction.prediction_date.desc()))
 
     # ==================== Trade CRUD ====================
 
     def add_trade(self, ticker: str, trade_type: str, quantity: int, price: float,
-                  strategy: str = None, signal_strength: float = None) -> Trade:
+                  strategy: str = None, signal_strength: float = None, session: Session = None) -> Trade:
         """거래 추가"""
-        session = self.get_session()
-        try:
-            stock = session.query(Stock).filter(Stock.ticker == ticker).first()
-            if not stock:
-                raise ValueError(f"종목을 찾을 수 없습니다: {ticker}")
-
-            amount = quantity * price
-            commission = amount * 0.00015  # 0.015% 수수료 가정
-
-            trade = Trade(
-                stock_id=stock.id,
-                trade_date=datetime.now(),
-                trade_type=trade_type.upper(),
-                quantity=quantity,
-                price=price,
-                amount=amount,
-                commission=commission,
-                strategy=strategy,
-                signal_strength=signal_strength
-            )
-            session.add(trade)
-            session.commit()
-            session.refresh(trade)
-            logger.info(f"거래 추가: {ticker} {trade_type} {quantity}주 @ {price}원")
-            return trade
+        try:
+            with self._session(session) as session:
+                stock_id = self._resolve_stock_id(session, ticker)
+                if stock_id is None:
+                    raise ValueError(f"종목을 찾을 수 없습니다: {ticker}")
+
+                trade = Trade(
+                    stock_id=stock_id,
+                    trade_date=datetime.now(),
+                    trade_type=trade_type.upper(),
+                    quantity=quantity,
+                    price=price,
+                    strategy=strategy,
+                    signal_strength=signal_strength
+                )
+                session.add(trade)
+                session.flush()
+                session.expunge(trade)
+                logger.debug("거래 추가: {} {} {}주 @ {}원", ticker, trade_type, quantity, price)
+                return trade
         except Exception as e:
-            session.rollback()
             logger.error(f"거래 추가 실패: {e}")
             raise
-        finally:
-            session.close()
 
-    def get_trades(self, ticker: str = None, start_date: datetime = None, end_date: datetime = None) -> List[Trade]:
-        """거래 내역 조회"""
-        session = self.get_session()
+    def add_trades_bulk(self, rows: List[Dict[str, Any]], session: Session = None) -> int:
+        """
+        거래 일괄 추가 (단일 트랜잭션, 단일 INSERT 배치)
+
+        Args:
+            rows: 거래 딕셔너리 리스트
+                - ticker, trade_type, quantity, price (필수)
+                - strategy, signal_strength (선택)
+
+        Returns:
+            int: 추가된 건수
+        """
+        if not rows:
+            return 0
+
         try:
-            query = session.query(Trade)
+            with self._session(session) as session:
+                stock_ids = self._require_stock_ids(session, [row['ticker'] for row in rows])
+
+                trade_date = datetime.now()
+                mappings = [{
+                    'stock_id': stock_ids[row['ticker']],
+                    'trade_date': trade_date,
+                    'trade_type': row['trade_type'].upper(),
+                    'quantity': row['quantity'],
+                    'price': row['price'],
+                    'strategy': row.get('strategy'),
+                    'signal_strength': row.get('signal_strength')
+                } for row in rows]
+
+                Trade.bulk_insert(session, mappings)
+                logger.info(f"거래 일괄 추가: {len(mappings)}건")
+                return len(mappings)
+        except Exception as e:
+            logger.error(f"거래 일괄 추가 실패: {e}")
+            raise
+
+    def get_trades(self, ticker: str = None, start_date: datetime = None, end_date: datetime = None) -> List[TradeDTO]:
+        """거래 내역 조회"""
+        with self._session() as session:
+            query = select(Trade.__table__)
 
             if ticker:
-                stock = session.query(Stock).filter(Stock.ticker == ticker).first()
-                if stock:
-                    query = query.filter(Trade.stock_id == stock.id)
+                stock_id = self._resolve_stock_id(session, ticker)
+                if stock_id is not None:
+                    query = query.where(Trade.stock_id == stock_id)
 
             if start_date:
-                query = query.filter(Trade.trade_date >= start_date)
+                query = query.where(Trade.trade_date >= start_date)
             if end_date:
-                query = query.filter(Trade.trade_date <= end_date)
+                query = query.where(Trade.trade_date <= end_date)
 
-            return query.order_by(Trade.trade_date.desc()).all()
-        finally:
-            session.close()
+            return self._fetch_dtos(session, TradeDTO, query.order_by(Trade.trade_date.desc()))
 
     # ==================== Portfolio CRUD ====================
 
-    def update_portfolio(self, ticker: str, quantity: int, avg_buy_price: float) -> Portfolio:
+    def update_portfolio(self, ticker: str, quantity: int, avg_buy_price: float,
+                         session: Session = None) -> Portfolio:
         """포트폴리오 업데이트"""
-        session = self.get_session()
         try:
-            stock = session.query(Stock).filter(Stock.ticker == ticker).first()
-            if not stock:
-                raise ValueError(f"종목을 찾을 수 없습니다: {ticker}")
-
-            portfolio = session.query(Portfolio).filter(Portfolio.stock_id == stock.id).first()
+            with self._session(session) as session:
+                stock_id = self._resolve_stock_id(session, ticker)
+                if stock_id is None:
+                    raise ValueError(f"종목을 찾을 수 없습니다: {ticker}")
 
-            if portfolio:
-                portfolio.quantity = quantity
-                portfolio.avg_buy_price = avg_buy_price
-                portfolio.updated_at = datetime.now()
-            else:
-                portfolio = Portfolio(
-                    stock_id=stock.id,
-                    quantity=quantity,
-                    avg_buy_price=avg_buy_price
-                )
-                session.add(portfolio)
+                portfolio = session.query(Portfolio).filter(Portfolio.stock_id == stock_id).first()
 
-            session.commit()
-            session.refresh(portfolio)
-            logger.info(f"포트폴리오 업데이트: {ticker}")
-            return portfolio
+                if portfolio:
+                    portfolio.quantity = quantity
+                    portfolio.avg_buy_price = avg_buy_price
+                else:
+                    portfolio = Portfolio(
+                        stock_id=stock_id,
+                        quantity=quantity,
+                        avg_buy_price=avg_buy_price
+                    )
+                    session.add(portfolio)
+
+                session.flush()
+                session.expunge(portfolio)
+                self._portfolio_cache.clear()
+                logger.info(f"포트폴리오 업데이트: {ticker}")
+                return portfolio
         except Exception as e:
-            session.rollback()
             logger.error(f"포트폴리오 업데이트 실패: {e}")
             raise
-        finally:
-            session.close()
 
-    def get_portfolio(self) -> List[Portfolio]:
-        """현재 포트폴리오 조회"""
-        session = self.get_session()
-        try:
-            return session.query(Portfolio).filter(Portfolio.quantity > 0).all()
-        finally:
-            session.close()
+    def get_portfolio(self) -> List[PortfolioDTO]:
+        """현재 포트폴리오 조회 (STOCK_CACHE_TTL 동안 캐시, update_portfolio 시 무효화)"""
+        holdings = self._portfolio_cache.get('holdings')
+        if holdings is None:
+            with self._session() as session:
+                holdings = self._fetch_dtos(
+                    session, PortfolioDTO, select(Portfolio.__table__).where(Portfolio.quantity > 0)
+                )
+            self._portfolio_cache.set('holdings', holdings)
+        return list(holdings)
 
     # ==================== BacktestResult CRUD ====================
 
     def add_backtest_result(self, strategy_name: str, start_date: datetime, end_date: datetime,
-                           initial_capital: float, final_capital: float, metrics: Dict[str, Any]) -> BacktestResult:
+                           initial_capital: float, final_capital: float, metrics: Dict[str, Any],
+                           session: Session = None) -> BacktestResult:
         """백테스트 결과 추가"""
-        session = self.get_session()
-        try:
-            result = BacktestResult(
-                strategy_name=strategy_name,
-                start_date=start_date,
-                end_date=end_date,
-                initial_capital=initial_capital,
-                final_capital=final_capital,
-                total_return=metrics.get('total_return'),
-                annual_return=metrics.get('annual_return'),
-                sharpe_ratio=metrics.get('sharpe_ratio'),
-                max_drawdown=metrics.get('max_drawdown'),
-                win_rate=metrics.get('win_rate'),
-                total_trades=metrics.get('total_trades'),
-                profitable_trades=metrics.get('profitable_trades'),
-                parameters=str(metrics.get('parameters', {}))
-            )
-            session.add(result)
-            session.commit()
-            session.refresh(result)
-            logger.info(f"백테스트 결과 추가: {strategy_name}")
-            return result
+        try:
+            with self._session(session) as session:
+                result = BacktestResult(**self._backtest_mapping(
+                    strategy_name, start_date, end_date, initial_capital, final_capital, metrics
+                ))
+                session.add(result)
+                session.flush()
+                session.expunge(result)
+                logger.info(f"백테스트 결과 추가: {strategy_name}")
+                return result
         except Exception as e:
-            session.rollback()
             logger.error(f"백테스트 결과 추가 실패: {e}")
             raise
-        finally:
-            session.close()
 
-    def get_backtest_results(self, strategy_name: str = None) -> List[BacktestResult]:
-        """백테스트 결과 조회"""
-        session = self.get_session()
+    def add_backtest_results_bulk(self, rows: List[Dict[str, Any]], session: Session = None) -> int:
+        """
+        백테스트 결과 일괄 추가 (단일 INSERT executemany)
+
+        Args:
+            rows: 백테스트 결과 딕셔너리 리스트
+                - strategy_name, start_date, end_date, initial_capital, final_capital (필수)
+                - metrics (선택, add_backtest_result 와 동일한 키)
+
+        Returns:
+            int: 추가된 건수
+        """
+        if not rows:
+            return 0
+
         try:
-            query = session.query(BacktestResult)
+            with self._session(session) as session:
+                mappings = [self._backtest_mapping(
+                    row['strategy_name'], row['start_date'], row['end_date'],
+                    row['initial_capital'], row['final_capital'], row.get('metrics', {})
+                ) for row in rows]
+
+                BacktestResult.bulk_insert(session, mappings)
+                logger.info(f"백테스트 결과 일괄 추가: {len(mappings)}건")
+                return len(mappings)
+        except Exception as e:
+            logger.error(f"백테스트 결과 일괄 추가 실패: {e}")
+            raise
+
+    @staticmethod
+    def _backtest_mapping(strategy_name: str, start_date: datetime, end_date: datetime,
+                          initial_capital: float, final_capital: float,
+                          metrics: Dict[str, Any]) -> Dict[str, Any]:
+        """백테스트 결과 → backtest_results 행 딕셔너리"""
+        return {
+            'strategy_name': strategy_name,
+            'start_date': start_date,
+            'end_date': end_date,
+            'initial_capital': initial_capital,
+            'final_capital': final_capital,
+            'total_return': metrics.get('total_return'),
+            'annual_return': metrics.get('annual_return'),
+            'sharpe_ratio': metrics.get('sharpe_ratio'),
+            'max_drawdown': metrics.get('max_drawdown'),
+            'win_rate': metrics.get('win_rate'),
+            'total_trades': metrics.get('total_trades'),
+            'profitable_trades': metrics.get('profitable_trades'),
+            'parameters': str(metrics.get('parameters', {}))
+        }
+
+    def get_backtest_results(self, strategy_name: str = None) -> List[BacktestResultDTO]:
+        """백테스트 결과 조회"""
+        with self._session() as session:
+            query = select(BacktestResult.__table__)
             if strategy_name:
-                query = query.filter(BacktestResult.strategy_name == strategy_name)
-            return query.order_by(BacktestResult.created_at.desc()).all()
-        finally:
-            session.close()
+                query = query.where(BacktestResult.strategy_name == strategy_name)
+            return self._fetch_dtos(session, BacktestResultDTO, query.order_by(BacktestResult.created_at.desc()))
 
     # ==================== KIS Daily OHLCV Data ====================
     # PostgreSQL의 daily_ohlcv 테이블에서 직접 데이터 조회
 
+    @staticmethod
+    def _kis_ohlcv_dtypes(dtype: str) -> Dict[str, str]:
+        """daily_ohlcv 가격/거래대금 컬럼 dtype (NUMERIC → Decimal 객체 대신 읽을 때 바로 float 로 변환)"""
+        return {column: dtype for column in ('open', 'high', 'low', 'close', 'amount')}
+
+    def _iter_kis_ohlcv(self, session: Session, stmt, params: Dict[str, Any], index_col: str = None,
+                        chunksize: int = None, dtype: str = 'float64') -> Iterator[pd.DataFrame]:
+        """
+        daily_ohlcv 조회 결과를 서버 측 커서로 chunksize 행씩 읽어 DataFrame으로 반환 (제너레이터)
+
+        결과가 없어도 컬럼만 있는 빈 DataFrame 하나는 반환된다.
+        """
+        conn = session.connection(execution_options={'stream_results': True})
+        yield from pd.read_sql_query(
+            stmt,
+            conn,
+            params=params,
+            index_col=index_col,
+            parse_dates=['trade_date'],
+            chunksize=chunksize or self.KIS_FETCH_CHUNK_SIZE,
+            dtype=self._kis_ohlcv_dtypes(dtype)
+        )
+
+    @staticmethod
+    def _concat_chunks(chunks) -> pd.DataFrame:
+        """청크 DataFrame들을 하나로 합침 (청크가 하나면 복사 없이 그대로 반환)"""
+        chunks = list(chunks)
+        if not chunks:
+            return pd.DataFrame()
+        if len(chunks) == 1:
+            return chunks[0]
+        return pd.concat(chunks, ignore_index=chunks[0].index.name is None)
+
+    def iter_daily_ohlcv_from_kis(self, symbol_code: str, start_date: datetime = None, end_date: datetime = None,
+                                  chunksize: int = None, dtype: str = 'float64') -> Iterator[pd.DataFrame]:
+        """
+        KIS daily_ohlcv 일봉 데이터를 chunksize 행 단위 DataFrame으로 나눠 조회 (개별 종목, 제너레이터)
+
+        장기간 조회에서도 메모리 사용량이 청크 크기로 제한된다.
+        각 청크는 get_daily_ohlcv_from_kis 와 같은 형식 (trade_date 인덱스)이다.
+        """
+        params = {
+            'symbol_code': symbol_code,
+            'start_date': start_date or None,
+            'end_date': end_date or None
+        }
+        with self._session() as session:
+            yield from self._iter_kis_ohlcv(
+                session, _KIS_OHLCV_SYMBOL_STMT, params, index_col='trade_date', chunksize=chunksize, dtype=dtype
+            )
+
     def get_daily_ohlcv_batch_from_kis(self, start_date: datetime = None,
-                                       end_date: datetime = None) -> pd.DataFrame:
+                                       end_date: datetime = None, dtype: str = 'float64') -> pd.DataFrame:
         """
         KIS 시스템의 daily_ohlcv 테이블에서 전체 종목의 일봉 데이터를 한 번에 조회 (배치)
 
         Args:
             start_date: 시작 날짜
             end_date: 종료 날짜
+            dtype: 가격/거래대금 컬럼 dtype ('float64' 기본, 전 종목 지표 계산 등에는 메모리가 절반인 'float32')
 
         Returns:
             pandas.DataFrame: 전체 종목 OHLCV 데이터 (symbol_code 컬럼 포함)
         """
-        from sqlalchemy import text
-
-        session = self.get_session()
         try:
-            query = """
-                SELECT
-                    symbol_code,
-                    trade_date,
-                    open_price as open,
-                    high_price as high,
-                    low_price as low,
-                    close_price as close,
-                    volume,
-                    trade_amount as amount
-                FROM daily_ohlcv
-                WHERE 1=1
-            """
-
-            params = {}
-
-            if start_date:
-                query += " AND trade_date >= :start_date"
-                params['start_date'] = start_date
-
-            if end_date:
-                query += " AND trade_date <= :end_date"
-                params['end_date'] = end_date
-
-            query += " ORDER BY symbol_code, trade_date ASC"
+            with self._session() as session:
+                params = {'start_date': start_date or None, 'end_date': end_date or None}
 
-            df = pd.read_sql_query(text(query), session.bind, params=params)
+                df = self._concat_chunks(self._iter_kis_ohlcv(session, _KIS_OHLCV_BATCH_STMT, params, dtype=dtype))
 
-            if not df.empty and 'trade_date' in df.columns:
-                df['trade_date'] = pd.to_datetime(df['trade_date'])
-
-            record_count = len(df)
-            unique_stocks = df['symbol_code'].nunique() if not df.empty else 0
-            logger.info(f"KIS daily_ohlcv 배치 조회 성공: {unique_stocks}개 종목, {record_count}건")
+                # 종목 수 집계는 INFO 로그가 실제로 출력될 때만 계산
+                logger.opt(lazy=True).info(
+                    "KIS daily_ohlcv 배치 조회 성공: {}개 종목, {}건",
+                    lambda: df['symbol_code'].nunique() if not df.empty else 0,
+                    lambda: len(df)
+                )
 
-            return df
+                return df
 
         except Exception as e:
             logger.error(f"KIS daily_ohlcv 배치 조회 실패: {e}")
             return pd.DataFrame()
-        finally:
-            session.close()
 
     def get_daily_ohlcv_from_kis(self, symbol_code: str, start_date: datetime = None,
-                                 end_date: datetime = None) -> pd.DataFrame:
+                                 end_date: datetime = None, dtype: str = 'float64') -> pd.DataFrame:
         """
         KIS 시스템의 daily_ohlcv 테이블에서 일봉 데이터 조회 (개별 종목)
 
@@ -478,96 +1643,173 @@ class Database:
             symbol_code: 종목코드 (예: '005930' - 삼성전자)
             start_date: 시작 날짜
             end_date: 종료 날짜
+            dtype: 가격/거래대금 컬럼 dtype ('float64' 기본 또는 'float32')
 
         Returns:
             pandas.DataFrame: OHLCV 데이터
         """
-        from sqlalchemy import text
-
-        session = self.get_session()
         try:
-            query = """
-                SELECT
-                    trade_date,
-                    open_price as open,
-                    high_price as high,
-                    low_price as low,
-                    close_price as close,
-                    volume,
-                    trade_amount as amount
-                FROM daily_ohlcv
-                WHERE symbol_code = :symbol_code
-            """
+            with self._session() as session:
+                params = {
+                    'symbol_code': symbol_code,
+                    'start_date': start_date or None,
+                    'end_date': end_date or None
+                }
+
+                df = self._concat_chunks(
+                    self._iter_kis_ohlcv(session, _KIS_OHLCV_SYMBOL_STMT, params, index_col='trade_date', dtype=dtype)
+                )
 
-            params = {'symbol_code': symbol_code}
+                if not df.empty:
+                    logger.debug("KIS daily_ohlcv 조회 성공: {}, {}건", symbol_code, len(df))
+                else:
+                    logger.warning(f"KIS daily_ohlcv 데이터 없음: {symbol_code}")
 
-            if start_date:
-                query += " AND trade_date >= :start_date"
-                params['start_date'] = start_date
+                return df
 
-            if end_date:
-                query += " AND trade_date <= :end_date"
-                params['end_date'] = end_date
+        except Exception as e:
+            logger.error(f"KIS daily_ohlcv 조회 실패: {symbol_code} - {e}")
+            return pd.DataFrame()
 
-            query += " ORDER BY trade_date ASC"
+    def get_daily_ohlcv_bulk_from_kis(self, symbols: List[str], start_date: datetime = None,
+                                      end_date: datetime = None, dtype: str = 'float64') -> Dict[str, pd.DataFrame]:
+        """
+        KIS 시스템의 daily_ohlcv 테이블에서 여러 종목의 일봉 데이터를 한 번의 쿼리로 조회
 
-            result = session.execute(text(query), params)
-            df = pd.DataFrame(result.fetchall(), columns=result.keys())
+        종목마다 get_daily_ohlcv_from_kis 를 호출하는 대신 IN 조건 하나로 조회한 뒤
+        pandas에서 종목별로 나눈다.
 
-            if not df.empty:
-                df['trade_date'] = pd.to_datetime(df['trade_date'])
-                df.set_index('trade_date', inplace=True)
-                logger.info(f"KIS daily_ohlcv 조회 성공: {symbol_code}, {len(df)}건")
-            else:
-                logger.warning(f"KIS daily_ohlcv 데이터 없음: {symbol_code}")
+        Args:
+            symbols: 종목코드 리스트
+            start_date: 시작 날짜
+            end_date: 종료 날짜
+            dtype: 가격/거래대금 컬럼 dtype ('float64' 기본 또는 'float32')
 
-            return df
+        Returns:
+            dict: {종목코드: OHLCV DataFrame (get_daily_ohlcv_from_kis 와 동일한 형식)}
+                  데이터가 없는 종목은 포함되지 않음
+        """
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return {}
+
+        try:
+            with self._session() as session:
+                conn = session.connection()
+
+                frames = []
+                for i in range(0, len(symbols), self.IN_CLAUSE_CHUNK_SIZE):
+                    params = {
+                        'symbols': symbols[i:i + self.IN_CLAUSE_CHUNK_SIZE],
+                        'start_date': start_date or None,
+                        'end_date': end_date or None
+                    }
+                    frames.append(pd.read_sql_query(
+                        _KIS_OHLCV_SYMBOLS_STMT, conn, params=params, parse_dates=['trade_date'],
+                        dtype=self._kis_ohlcv_dtypes(dtype)
+                    ))
+
+                df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+                result = {
+                    symbol_code: group.drop(columns='symbol_code').set_index('trade_date')
+                    for symbol_code, group in df.groupby('symbol_code', sort=False)
+                }
+
+                logger.info(f"KIS daily_ohlcv 다종목 조회 성공: {len(result)}/{len(symbols)}개 종목, {len(df)}건")
+                return result
 
         except Exception as e:
-            logger.error(f"KIS daily_ohlcv 조회 실패: {symbol_code} - {e}")
-            return pd.DataFrame()
-        finally:
-            session.close()
+            logger.error(f"KIS daily_ohlcv 다종목 조회 실패: {e}")
+            return {}
 
     def get_available_symbols_from_kis(self) -> list:
         """
         KIS 시스템에서 사용 가능한 종목 목록 조회
 
+        당일 기준으로 메모리(KIS_SYMBOLS_CACHE_TTL)와 디스크(KIS_SYMBOLS_CACHE_DIR)에 캐시하므로
+        같은 날 재실행된 프로세스도 DB를 조회하지 않는다. 날짜가 바뀌면 자동으로 새로 조회한다.
+
         Returns:
             list: 종목코드 리스트
         """
-        from sqlalchemy import text
+        cache_key = ('symbols', date.today())
+        symbols = self._kis_symbols_cache.get(cache_key)
+        if symbols is not None:
+            return list(symbols)
 
-        session = self.get_session()
-        try:
-            query = """
-                SELECT DISTINCT symbol_code
-                FROM daily_ohlcv
-                WHERE trade_date >= CURRENT_DATE - INTERVAL '30 days'
-                ORDER BY symbol_code
-            """
+        symbols = self._load_kis_symbols_disk_cache(cache_key[1])
+        if symbols is not None:
+            self._kis_symbols_cache.set(cache_key, symbols)
+            return list(symbols)
 
-            result = session.execute(text(query))
-            symbols = [row[0] for row in result.fetchall()]
+        try:
+            with self._session() as session:
+                result = session.execute(_KIS_AVAILABLE_SYMBOLS_STMT)
+                symbols = [row[0] for row in result.fetchall()]
 
-            logger.info(f"KIS 사용 가능 종목 조회: {len(symbols)}개")
-            return symbols
+                self._kis_symbols_cache.set(cache_key, symbols)
+                self._save_kis_symbols_disk_cache(cache_key[1], symbols)
+                logger.info(f"KIS 사용 가능 종목 조회: {len(symbols)}개")
+                return list(symbols)
 
         except Exception as e:
             logger.error(f"KIS 사용 가능 종목 조회 실패: {e}")
             return []
-        finally:
-            session.close()
 
     def get_available_symbols_count_from_kis(self) -> int:
         """
         KIS 시스템에서 사용 가능한 종목 수 조회
 
+        종목 목록이 캐시돼 있으면 그 길이를, 아니면 COUNT(DISTINCT) 한 번으로 집계한다.
+
         Returns:
             int: 종목 수
         """
-        symbols = self.get_available_symbols_from_kis()
-        return len(symbols)
+        symbols = self._kis_symbols_cache.get(('symbols', date.today()))
+        if symbols is not None:
+            return len(symbols)
+
+        try:
+            with self._session() as session:
+                return session.execute(_KIS_AVAILABLE_SYMBOLS_COUNT_STMT).scalar() or 0
+        except Exception as e:
+            logger.error(f"KIS 사용 가능 종목 수 조회 실패: {e}")
+            return 0
+
+    def _kis_symbols_cache_path(self, day: date) -> Path:
+        return Path(self.KIS_SYMBOLS_CACHE_DIR) / "kis_symbols" / self._cache_namespace / f"{day:%Y%m%d}.json"
+
+    def _load_kis_symbols_disk_cache(self, day: date) -> Optional[List[str]]:
+        """당일 종목 목록 디스크 캐시 읽기 (없거나 손상되면 None)"""
+        path = self._kis_symbols_cache_path(day)
+        if not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            logger.warning(f"KIS 종목 캐시 파일 읽기 실패: {path} - {e}")
+            return None
+
+    def _save_kis_symbols_disk_cache(self, day: date, symbols: List[str]):
+        """당일 종목 목록을 디스크 캐시에 저장 (실패해도 조회 결과에는 영향 없음)"""
+        path = self._kis_symbols_cache_path(day)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps(symbols), encoding='utf-8')
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"KIS 종목 캐시 파일 저장 실패: {path} - {e}")
+            return
+
+        # 지난 날짜 파일 정리 (당일 파일만 읽으므로 더 이상 쓰이지 않음)
+        for old_path in path.parent.glob("*.json"):
+            if old_path.stem < path.stem:
+                try:
+                    old_path.unlink()
+                except OSError as e:
+                    logger.warning(f"지난 KIS 종목 캐시 파일 삭제 실패: {old_path} - {e}")
 
     def get_available_symbols_dataframe_from_kis(self) -> pd.DataFrame:
         """
@@ -576,31 +1818,22 @@ class Database:
         Returns:
             pandas.DataFrame: 종목코드, 마지막 거래일, 데이터 건수
         """
-        from sqlalchemy import text
-
-        session = self.get_session()
         try:
-            query = """
-                SELECT DISTINCT
-                    symbol_code,
-                    MAX(trade_date) as last_trade_date,
-                    COUNT(*) as data_count
-                FROM daily_ohlcv
-                GROUP BY symbol_code
-                ORDER BY last_trade_date DESC
-            """
-
-            result = session.execute(text(query))
-            df = pd.DataFrame(result.fetchall(), columns=['symbol_code', 'last_trade_date', 'data_count'])
+            with self._session() as session:
+                # 커서에서 바로 컬럼을 구성 (Python 행 리스트를 거치지 않음)
+                df = pd.read_sql_query(
+                    _KIS_SYMBOLS_SUMMARY_STMT,
+                    session.connection(),
+                    parse_dates=['last_trade_date'],
+                    dtype={'data_count': 'int32'},
+                )
 
-            logger.info(f"KIS 사용 가능 종목 정보 조회: {len(df)}개")
-            return df
+                logger.info(f"KIS 사용 가능 종목 정보 조회: {len(df)}개")
+                return df
 
         except Exception as e:
             logger.error(f"KIS 사용 가능 종목 정보 조회 실패: {e}")
             return pd.DataFrame()
-        finally:
-            session.close()
 
     # ==================== TradingSignal CRUD ====================
 
@@ -621,49 +1854,73 @@ class Database:
         Returns:
             TradingSignal: 생성된 거래 신호
         """
-        session = self.get_session()
         try:
-            signal = TradingSignal(**signal_data)
-            session.add(signal)
-            session.commit()
-            logger.info(f"거래 신호 생성: stock_id={signal.stock_id}, date={signal.analysis_date}")
-            return signal
+            with self._session() as session:
+                signal = TradingSignal(**signal_data)
+                session.add(signal)
+                session.flush()
+                session.expunge(signal)
+                logger.info(f"거래 신호 생성: stock_id={signal.stock_id}, date={signal.analysis_date}")
+                return signal
         except Exception as e:
-            session.rollback()
             logger.error(f"거래 신호 생성 실패: {e}")
             raise
-        finally:
-            session.close()
 
-    def get_trading_signals_by_date(self, date_str: str) -> List[TradingSignal]:
+    def create_trading_signals_bulk(self, signals: List[Dict[str, Any]], session: Session = None) -> int:
+        """
+        거래 신호 일괄 생성 (단일 트랜잭션, 단일 INSERT 배치)
+
+        하루치 신호를 create_trading_signal 로 하나씩 만들면 신호마다 세션/commit 이
+        발생하므로, 분석 배치에서는 이 메서드로 한 번에 저장한다.
+
+        Args:
+            signals: 신호 데이터 딕셔너리 리스트 (create_trading_signal 과 동일한 키)
+
+        Returns:
+            int: 생성된 신호 수
+        """
+        if not signals:
+            return 0
+
+        try:
+            with self._session(session) as session:
+                TradingSignal.bulk_insert(session, signals)
+                logger.info(f"거래 신호 일괄 생성: {len(signals)}개")
+                return len(signals)
+        except Exception as e:
+            logger.error(f"거래 신호 일괄 생성 실패: {e}")
+            raise
+
+    def get_trading_signals_by_date(self, date_str: str,
+                                    columns: Optional[List[str]] = None) -> List[TradingSignal]:
         """
         특정 날짜의 거래 신호 조회
 
         Args:
             date_str: 분석 날짜 (YYYY-MM-DD 형식)
+            columns: 로드할 컬럼 이름 목록 (None이면 deferred 컬럼 포함 전체).
+                ai_reasoning, calculation_details 같은 큰 컬럼을 건너뛸 때 사용한다.
+                PK 와 repr() 에 쓰이는 컬럼은 항상 로드되지만, 그 외 로드하지 않은 속성에
+                세션이 닫힌 뒤 접근하면 DetachedInstanceError 가 발생한다.
 
         Returns:
             List[TradingSignal]: 거래 신호 리스트
         """
-        from datetime import date as date_type
-        session = self.get_session()
         try:
-            # 문자열을 date 객체로 변환
-            if isinstance(date_str, str):
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-            else:
-                date_obj = date_str
-
-            signals = session.query(TradingSignal).filter(
-                TradingSignal.analysis_date == date_obj
-            ).all()
-            logger.info(f"거래 신호 조회: {date_str}, {len(signals)}개")
-            return signals
+            with self._session() as session:
+                date_obj = self._parse_date(date_str)
+
+                signals = session.query(TradingSignal).options(
+                    *self._load_only(TradingSignal, columns)
+                ).filter(
+                    TradingSignal.analysis_date == date_obj
+                ).all()
+                session.expunge_all()
+                logger.info(f"거래 신호 조회: {date_str}, {len(signals)}개")
+                return signals
         except Exception as e:
             logger.error(f"거래 신호 조회 실패: {e}")
             return []
-        finally:
-            session.close()
 
     def get_trading_signal_by_id(self, signal_id: int) -> Optional[TradingSignal]:
         """
@@ -675,20 +1932,22 @@ class Database:
         Returns:
             TradingSignal: 거래 신호
         """
-        session = self.get_session()
         try:
-            signal = session.query(TradingSignal).filter(TradingSignal.id == signal_id).first()
-            return signal
+            with self._session() as session:
+                signal = session.query(TradingSignal).options(undefer('*')).filter(TradingSignal.id == signal_id).first()
+                session.expunge_all()
+                return signal
         except Exception as e:
             logger.error(f"거래 신호 조회 실패: {e}")
             return None
-        finally:
-            session.close()
 
     def update_trading_signal(self, signal_id: int, update_data: Dict[str, Any]) -> Optional[TradingSignal]:
         """
         거래 신호 수정 (매매 후 상태 업데이트용)
 
+        행을 먼저 읽지 않고 UPDATE 한 번으로 수정한다. RETURNING 을 지원하는 DB
+        (PostgreSQL, SQLite 3.35+)에서는 수정된 행도 같은 문장에서 받아온다.
+
         Args:
             signal_id: 신호 ID
             update_data: 수정할 데이터
@@ -700,56 +1959,64 @@ class Database:
         Returns:
             TradingSignal: 수정된 거래 신호
         """
-        session = self.get_session()
         try:
-            signal = session.query(TradingSignal).filter(TradingSignal.id == signal_id).first()
-            if signal:
-                for key, value in update_data.items():
-                    setattr(signal, key, value)
-                signal.updated_at = datetime.now()
-                session.commit()
-                logger.info(f"거래 신호 수정: signal_id={signal_id}, status={signal.status}")
-                return signal
-            else:
-                logger.warning(f"거래 신호 찾을 수 없음: {signal_id}")
-                return None
+            with self._session() as session:
+                stmt = update(TradingSignal).where(TradingSignal.id == signal_id).values(**update_data)
+                if self.engine.dialect.update_returning:
+                    signal = session.execute(stmt.returning(TradingSignal).options(undefer('*'))).scalar_one_or_none()
+                elif session.execute(stmt).rowcount:
+                    signal = session.get(TradingSignal, signal_id, options=[undefer('*')])
+                else:
+                    signal = None
+
+                if signal:
+                    session.expunge(signal)
+                    logger.info(f"거래 신호 수정: signal_id={signal_id}, status={signal.status}")
+                    return signal
+                else:
+                    logger.warning(f"거래 신호 찾을 수 없음: {signal_id}")
+                    return None
         except Exception as e:
-            session.rollback()
             logger.error(f"거래 신호 수정 실패: {e}")
             return None
-        finally:
-            session.close()
 
-    def get_pending_trading_signals(self, date_str: str = None) -> List[TradingSignal]:
+    def get_pending_trading_signals(self, date_str: str = None,
+                                    columns: Optional[List[str]] = None,
+                                    limit: int = None) -> List[TradingSignal]:
         """
-        대기 중인 거래 신호 조회
+        대기 중인 거래 신호 조회 (신뢰도 높은 순)
+
+        ix_trading_signals_pending_confidence 부분 인덱스 순서대로 읽으므로
+        limit 을 주면 정렬 없이 상위 N개만 읽는다.
 
         Args:
             date_str: 대상 거래 날짜 (None이면 전체)
+            columns: 로드할 컬럼 이름 목록 (None이면 전체, get_trading_signals_by_date 참고)
+            limit: 최대 조회 건수 (None이면 전체)
 
         Returns:
             List[TradingSignal]: 대기 중인 거래 신호
         """
-        from datetime import date as date_type
-        session = self.get_session()
         try:
-            query = session.query(TradingSignal).filter(TradingSignal.status == 'pending')
-
-            if date_str:
-                if isinstance(date_str, str):
-                    date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-                else:
-                    date_obj = date_str
-                query = query.filter(TradingSignal.target_trade_date == date_obj)
-
-            signals = query.order_by(TradingSignal.ai_confidence.desc()).all()
-            logger.info(f"대기 중인 신호 조회: {len(signals)}개")
-            return signals
+            with self._session() as session:
+                query = session.query(TradingSignal).options(
+                    *self._load_only(TradingSignal, columns)
+                ).filter(TradingSignal.status == 'pending')
+
+                if date_str:
+                    query = query.filter(TradingSignal.target_trade_date == self._parse_date(date_str))
+
+                query = query.order_by(TradingSignal.ai_confidence.desc())
+                if limit:
+                    query = query.limit(limit)
+
+                signals = query.all()
+                session.expunge_all()
+                logger.info(f"대기 중인 신호 조회: {len(signals)}개")
+                return signals
         except Exception as e:
             logger.error(f"대기 신호 조회 실패: {e}")
             return []
-        finally:
-            session.close()
 
     # ==================== MarketSnapshot CRUD ====================
 
@@ -762,25 +2029,58 @@ class Database:
                 - snapshot_date: 스냅샷 날짜
                 - kospi_close, kosdaq_close: 지수 종가
                 - foreign_flow, institution_flow, retail_flow: 투자자 매매동향
-                - sector_performance: 섹터별 수익률 (JSON)
+                - sector_performance: 섹터별 수익률 (JSON, sector_performances 행도 함께 생성)
                 - ... (기타 필드)
 
         Returns:
             MarketSnapshot: 생성된 시장 스냅샷
         """
-        session = self.get_session()
         try:
-            snapshot = MarketSnapshot(**snapshot_data)
-            session.add(snapshot)
-            session.commit()
-            logger.info(f"시장 스냅샷 생성: {snapshot.snapshot_date}, KOSPI={snapshot.kospi_close}")
-            return snapshot
+            with self._session() as session:
+                snapshot = MarketSnapshot(**snapshot_data)
+                snapshot.sector_rows = [
+                    SectorPerformance(**row)
+                    for row in SectorPerformance.rows_from_json(snapshot_data.get('sector_performance'))
+                ]
+                session.add(snapshot)
+                session.flush()
+                session.expunge(snapshot)
+                logger.info(f"시장 스냅샷 생성: {snapshot.snapshot_date}, KOSPI={snapshot.kospi_close}")
+                return snapshot
         except Exception as e:
-            session.rollback()
             logger.error(f"시장 스냅샷 생성 실패: {e}")
             raise
-        finally:
-            session.close()
+
+    def create_market_snapshots_bulk(self, snapshots: List[Dict[str, Any]], session: Session = None) -> int:
+        """
+        시장 스냅샷 일괄 생성 (단일 트랜잭션, 단일 INSERT 배치)
+
+        Args:
+            snapshots: 스냅샷 데이터 딕셔너리 리스트 (create_market_snapshot 과 동일한 키)
+
+        Returns:
+            int: 생성된 스냅샷 수
+        """
+        if not snapshots:
+            return 0
+
+        try:
+            with self._session(session) as session:
+                snapshot_ids = MarketSnapshot.bulk_insert(session, snapshots, return_ids=True)
+
+                sector_rows = [
+                    {'snapshot_id': snapshot_id, **row}
+                    for snapshot_id, data in zip(snapshot_ids, snapshots)
+                    for row in SectorPerformance.rows_from_json(data.get('sector_performance'))
+                ]
+                if sector_rows:
+                    SectorPerformance.bulk_insert(session, sector_rows)
+
+                logger.info(f"시장 스냅샷 일괄 생성: {len(snapshots)}개")
+                return len(snapshots)
+        except Exception as e:
+            logger.error(f"시장 스냅샷 일괄 생성 실패: {e}")
+            raise
 
     def get_market_snapshot(self, date_str: str) -> Optional[MarketSnapshot]:
         """
@@ -792,23 +2092,18 @@ class Database:
         Returns:
             MarketSnapshot: 시장 스냅샷
         """
-        from datetime import date as date_type
-        session = self.get_session()
         try:
-            if isinstance(date_str, str):
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-            else:
-                date_obj = date_str
+            with self._session() as session:
+                date_obj = self._parse_date(date_str)
 
-            snapshot = session.query(MarketSnapshot).filter(
-                MarketSnapshot.snapshot_date == date_obj
-            ).first()
-            return snapshot
+                snapshot = session.query(MarketSnapshot).filter(
+                    MarketSnapshot.snapshot_date == date_obj
+                ).first()
+                session.expunge_all()
+                return snapshot
         except Exception as e:
             logger.error(f"시장 스냅샷 조회 실패: {e}")
             return None
-        finally:
-            session.close()
 
     def get_latest_market_snapshot(self) -> Optional[MarketSnapshot]:
         """
@@ -817,17 +2112,17 @@ class Database:
         Returns:
             MarketSnapshot: 최신 시장 스냅샷
         """
-        session = self.get_session()
         try:
-            snapshot = session.query(MarketSnapshot).order_by(
-                MarketSnapshot.snapshot_date.desc()
-            ).first()
-            return snapshot
+            with self._session() as session:
+                # snapshot_date 인덱스를 역방향으로 스캔해 1건만 읽음
+                snapshot = session.execute(
+                    select(MarketSnapshot).order_by(MarketSnapshot.snapshot_date.desc()).limit(1)
+                ).scalar_one_or_none()
+                session.expunge_all()
+                return snapshot
         except Exception as e:
             logger.error(f"최신 시장 스냅샷 조회 실패: {e}")
             return None
-        finally:
-            session.close()
 
     def update_market_snapshot(self, date_str: str, update_data: Dict[str, Any]) -> Optional[MarketSnapshot]:
         """
@@ -840,33 +2135,32 @@ class Database:
         Returns:
             MarketSnapshot: 수정된 시장 스냅샷
         """
-        from datetime import date as date_type
-        session = self.get_session()
         try:
-            if isinstance(date_str, str):
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-            else:
-                date_obj = date_str
+            with self._session() as session:
+                date_obj = self._parse_date(date_str)
 
-            snapshot = session.query(MarketSnapshot).filter(
-                MarketSnapshot.snapshot_date == date_obj
-            ).first()
+                snapshot = session.query(MarketSnapshot).filter(
+                    MarketSnapshot.snapshot_date == date_obj
+                ).first()
 
-            if snapshot:
-                for key, value in update_data.items():
-                    setattr(snapshot, key, value)
-                session.commit()
-                logger.info(f"시장 스냅샷 수정: {date_obj}")
-                return snapshot
-            else:
-                logger.warning(f"시장 스냅샷 찾을 수 없음: {date_obj}")
-                return None
+                if snapshot:
+                    for key, value in update_data.items():
+                        setattr(snapshot, key, value)
+                    if 'sector_performance' in update_data:
+                        snapshot.sector_rows = [
+                            SectorPerformance(**row)
+                            for row in SectorPerformance.rows_from_json(update_data['sector_performance'])
+                        ]
+                    session.flush()
+                    session.expunge(snapshot)
+                    logger.info(f"시장 스냅샷 수정: {date_obj}")
+                    return snapshot
+                else:
+                    logger.warning(f"시장 스냅샷 찾을 수 없음: {date_obj}")
+                    return None
         except Exception as e:
-            session.rollback()
             logger.error(f"시장 스냅샷 수정 실패: {e}")
             return None
-        finally:
-            session.close()
 
     def get_market_snapshots_range(self, start_date_str: str, end_date_str: str) -> List[MarketSnapshot]:
         """
@@ -879,30 +2173,54 @@ class Database:
         Returns:
             List[MarketSnapshot]: 시장 스냅샷 리스트
         """
-        from datetime import date as date_type
-        session = self.get_session()
         try:
-            if isinstance(start_date_str, str):
-                start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
-            else:
-                start_date = start_date_str
+            with self._session() as session:
+                start_date = self._parse_date(start_date_str)
+                end_date = self._parse_date(end_date_str)
+
+                snapshots = session.query(MarketSnapshot).filter(
+                    and_(
+                        MarketSnapshot.snapshot_date >= start_date,
+                        MarketSnapshot.snapshot_date <= end_date
+                    )
+                ).order_by(MarketSnapshot.snapshot_date.asc()).all()
+                session.expunge_all()
+
+                logger.info(f"시장 스냅샷 조회: {start_date} ~ {end_date}, {len(snapshots)}개")
+                return snapshots
+        except Exception as e:
+            logger.error(f"시장 스냅샷 범위 조회 실패: {e}")
+            return []
 
-            if isinstance(end_date_str, str):
-                end_date = datetime.strptime(end_date_str, "%Y-%m-%d").date()
-            else:
-                end_date = end_date_str
+    # ==================== AnalysisRun 리포트 ====================
 
-            snapshots = session.query(MarketSnapshot).filter(
-                and_(
-                    MarketSnapshot.snapshot_date >= start_date,
-                    MarketSnapshot.snapshot_date <= end_date
-                )
-            ).order_by(MarketSnapshot.snapshot_date.asc()).all()
+    def get_analysis_run_report(self, run_id: int) -> Optional[AnalysisRun]:
+        """
+        분석 실행 전체 결과 조회 (리포트용)
+
+        시장 스냅샷(+섹터), AI 후보, 기술적 선정, 거래 신호를 selectinload 로 함께 읽어
+        후보/신호 수와 무관하게 고정된 쿼리 수(관계당 1번)로 끝난다.
+        반환된 객체는 세션이 분리되어 있으므로 리포트 렌더링은 lazy 관계 대신
+        이 메서드가 로드한 속성만 사용한다 (AI 프롬프트 원문 payload 는 포함하지 않음).
+
+        Args:
+            run_id: analysis_runs.id
+
+        Returns:
+            AnalysisRun: 관계가 로드된 분석 실행 (없으면 None)
+        """
+        query = select(AnalysisRun).where(AnalysisRun.id == run_id).options(
+            selectinload(AnalysisRun.market_snapshot).selectinload(MarketSnapshot.sector_rows),
+            selectinload(AnalysisRun.ai_screening).selectinload(AIScreeningResult.candidates),
+            selectinload(AnalysisRun.technical_screening).selectinload(TechnicalScreeningResult.selections),
+            selectinload(AnalysisRun.trading_signals).undefer('*'),
+        )
 
-            logger.info(f"시장 스냅샷 조회: {start_date} ~ {end_date}, {len(snapshots)}개")
-            return snapshots
+        try:
+            with self._session() as session:
+                run = session.execute(query).scalar_one_or_none()
+                session.expunge_all()
+                return run
         except Exception as e:
-            logger.error(f"시장 스냅샷 범위 조회 실패: {e}")
-            return []
-        finally:
-            session.close()
+            logger.error(f"분석 실행 리포트 조회 실패: run_id={run_id} - {e}")
+            return None
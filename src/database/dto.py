@@ -0,0 +1,87 @@
+"""
+조회 결과 DTO 정의
+
+Database 조회 메서드가 ORM 엔티티 대신 반환하는 읽기 전용 값 객체.
+세션과 무관하므로 세션이 닫힌 뒤에도 안전하게 속성에 접근할 수 있다.
+필드명은 models.py 의 컬럼명과 동일하다.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class StockDTO:
+    """종목 정보"""
+    id: int
+    ticker: str
+    name: str
+    market: Optional[str] = None
+    sector: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+@dataclass(frozen=True)
+class PredictionDTO:
+    """주가 예측 결과"""
+    id: int
+    stock_id: int
+    prediction_date: datetime
+    target_date: date
+    model_name: str
+    predicted_price: float
+    confidence: Optional[float] = None
+    actual_price: Optional[float] = None
+    created_at: Optional[datetime] = None
+
+
+@dataclass(frozen=True)
+class TradeDTO:
+    """거래 내역"""
+    id: int
+    stock_id: int
+    trade_date: datetime
+    trade_type: str
+    quantity: int
+    price: float
+    amount: Optional[float] = None
+    commission: Optional[float] = None
+    strategy: Optional[str] = None
+    signal_strength: Optional[float] = None
+    notes: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+
+@dataclass(frozen=True)
+class PortfolioDTO:
+    """포트폴리오 (현재 보유 종목)"""
+    id: int
+    stock_id: int
+    quantity: int
+    avg_buy_price: float
+    current_price: Optional[float] = None
+    profit_loss: Optional[float] = None
+    profit_loss_rate: Optional[float] = None
+    updated_at: Optional[datetime] = None
+
+
+@dataclass(frozen=True)
+class BacktestResultDTO:
+    """백테스팅 결과"""
+    id: int
+    strategy_name: str
+    start_date: datetime
+    end_date: datetime
+    initial_capital: float
+    final_capital: float
+    total_return: Optional[float] = None
+    annual_return: Optional[float] = None
+    sharpe_ratio: Optional[float] = None
+    max_drawdown: Optional[float] = None
+    win_rate: Optional[float] = None
+    total_trades: Optional[int] = None
+    profitable_trades: Optional[int] = None
+    parameters: Optional[str] = None
+    created_at: Optional[datetime] = None
@@ -2,12 +2,173 @@
 데이터베이스 모델 정의
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Boolean, Date, JSON, BigInteger
+import enum
+
+from typing import Any, Dict, List
+
+from sqlalchemy import insert, Enum, Column, Integer, String, Float, DateTime, ForeignKey, Text, Boolean, Date, JSON, BigInteger, SmallInteger, Index, Computed
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy.sql.expression import FunctionElement
+
+
+class ModelBase:
+    """모든 모델의 공통 베이스"""
+
+    BULK_INSERT_CHUNK_SIZE = 5000
+
+    @classmethod
+    def bulk_insert(cls, session, mappings: List[Dict[str, Any]], chunksize: int = None,
+                    return_ids: bool = False) -> List[int]:
+        """
+        dict 목록을 ORM bulk INSERT (executemany) 로 저장
+
+        행마다 ORM 객체를 만들고 session.add() 하는 unit-of-work 비용 없이
+        청크 단위 INSERT 로 저장한다. 값이 None 인 키도 NULL 로 그대로 렌더링해(render_nulls)
+        None 이 섞인 행들이 컬럼 구성별로 쪼개지지 않고 한 배치로 묶이게 한다.
+        server_default 컬럼(created_at 등)은 키를 생략하면 DB 기본값이 채워진다.
+
+        Args:
+            session: 세션
+            mappings: 컬럼명 → 값 딕셔너리 리스트
+            chunksize: 한 번에 보낼 행 수 (None이면 BULK_INSERT_CHUNK_SIZE)
+            return_ids: True면 생성된 id 를 mappings 순서대로 반환 (INSERT ... RETURNING)
+
+        Returns:
+            List[int]: 생성된 id 목록 (return_ids=False면 빈 리스트)
+        """
+        chunksize = chunksize or cls.BULK_INSERT_CHUNK_SIZE
+        stmt = insert(cls).execution_options(render_nulls=True)
+        if return_ids:
+            stmt = stmt.returning(cls.id, sort_by_parameter_order=True)
+
+        ids = []
+        for i in range(0, len(mappings), chunksize):
+            chunk = mappings[i:i + chunksize]
+            if return_ids:
+                ids.extend(session.scalars(stmt, chunk).all())
+            else:
+                session.execute(stmt, chunk)
+        return ids
+
+    if not __debug__:
+        # python -O 실행 시 모델별 __repr__ (속성 조회 + f-string) 대신 기본 repr 사용
+        def __init_subclass__(cls, **kwargs):
+            super().__init_subclass__(**kwargs)
+            cls.__repr__ = object.__repr__
+
+
+Base = declarative_base(cls=ModelBase)
+
+# 거래 수수료율 (0.015%), trades.commission 계산 컬럼에 사용
+TRADE_COMMISSION_RATE = 0.00015
+
+# PostgreSQL에서는 JSONB (파싱된 바이너리 저장 + GIN 인덱스 가능), 그 외 DB는 JSON
+JSONVariant = JSON().with_variant(JSONB(), 'postgresql')
+
+# 대용량 테이블의 id: PostgreSQL은 BIGINT (21억 행 한도 회피), SQLite는 rowid 별칭(자동 증가)이 되도록 INTEGER
+BigIntegerVariant = BigInteger().with_variant(Integer(), 'sqlite')
+
+
+class local_now(FunctionElement):
+    """
+    DB 서버의 현재 로컬 시각 (created_at/updated_at 기본값)
+
+    timezone 없는 DateTime 컬럼에 DB가 직접 시각을 채우므로
+    Python에서 행마다 값을 만들지 않고 executemany INSERT 파라미터도 줄어든다.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(local_now)
+def _compile_local_now(element, compiler, **kw):
+    return "LOCALTIMESTAMP"
+
+
+@compiles(local_now, 'sqlite')
+def _compile_local_now_sqlite(element, compiler, **kw):
+    return "(datetime('now', 'localtime'))"
+
+
+# ==================== 코드값 Enum ====================
+# PostgreSQL 은 네이티브 ENUM (4바이트), 그 외 DB는 VARCHAR + CHECK 제약으로 저장한다.
+# 저장값은 기존 문자열 그대로이므로 외부 프로그램의 조회/수정 쿼리('pending' 등)는 바뀌지 않는다.
+
+class StrEnum(str, enum.Enum):
+    """문자열 코드 Enum (== 'pending' 비교, f-string, JSON 직렬화 모두 문자열 값으로 동작)"""
+
+    def __str__(self):
+        return self.value
+
+
+class MarketType(StrEnum):
+    """상장 시장"""
+    KOSPI = 'KOSPI'
+    KOSDAQ = 'KOSDAQ'
+    KONEX = 'KONEX'
+
+
+class TradeType(StrEnum):
+    """매매 구분"""
+    BUY = 'BUY'
+    SELL = 'SELL'
+
+
+class MarketTrend(StrEnum):
+    """시장 추세"""
+    UPTREND = 'UPTREND'
+    DOWNTREND = 'DOWNTREND'
+    RANGE = 'RANGE'
+    NEUTRAL = 'NEUTRAL'
+
+
+class MarketSentiment(StrEnum):
+    """시장 심리"""
+    BULLISH = 'BULLISH'
+    BEARISH = 'BEARISH'
+    NEUTRAL = 'NEUTRAL'
+
+
+class VolatilityRank(StrEnum):
+    """변동성 등급"""
+    LOW = 'LOW'
+    MEDIUM = 'MEDIUM'
+    HIGH = 'HIGH'
+
+
+class RunStatus(StrEnum):
+    """분석 실행 상태"""
+    RUNNING = 'running'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+
+
+class SignalStatus(StrEnum):
+    """매매 신호 상태"""
+    PENDING = 'pending'
+    EXECUTED = 'executed'
+    MISSED = 'missed'  # 외부 매매 프로그램이 체결 못 한 신호에 기록
+    CANCELLED = 'cancelled'
+    EXPIRED = 'expired'
+
 
-Base = declarative_base()
+def _enum_column_type(enum_class, name: str, length: int = 20) -> Enum:
+    """Enum 컬럼 타입 (멤버 이름이 아니라 값을 저장, 허용되지 않는 문자열은 INSERT 전에 거부)"""
+    return Enum(
+        enum_class,
+        name=name,
+        values_callable=lambda members: [member.value for member in members],
+        length=length,
+        create_constraint=True,
+        validate_strings=True,
+    )
+
+
+# kospi_trend / kosdaq_trend 가 같은 PostgreSQL ENUM 타입을 공유
+MARKET_TREND_TYPE = _enum_column_type(MarketTrend, 'market_trend')
 
 
 class Stock(Base):
@@ -17,38 +178,61 @@ class Stock(Base):
     id = Column(Integer, primary_key=True)
     ticker = Column(String(20), unique=True, nullable=False, index=True)
     name = Column(String(100), nullable=False)
-    market = Column(String(20))  # KOSPI, KOSDAQ, KONEX
+    market = Column(_enum_column_type(MarketType, 'market_type'))  # KOSPI, KOSDAQ, KONEX
     sector = Column(String(50))
-    created_at = Column(DateTime, default=datetime.now)
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+    created_at = Column(DateTime, server_default=local_now())
+    updated_at = Column(DateTime, server_default=local_now(), onupdate=local_now())
+    # INSERT/UPDATE 후 DB가 채운 시각을 RETURNING 으로 바로 받아옴 (세션 분리 후에도 접근 가능)
+    __mapper_args__ = {'eager_defaults': True}
 
     # Relationships
-    prices = relationship("StockPrice", back_populates="stock", cascade="all, delete-orphan")
-    market_data = relationship("MarketData", back_populates="stock", cascade="all, delete-orphan")
-    predictions = relationship("Prediction", back_populates="stock", cascade="all, delete-orphan")
-    trades = relationship("Trade", back_populates="stock", cascade="all, delete-orphan")
+    # 컬렉션은 수천 행이 될 수 있어 기본은 lazy='select', 여러 종목을 함께 읽을 때는
+    # Database.get_stocks_with_recent_prices 처럼 selectinload 로 IN 쿼리 한 번에 로드
+    # 종목 삭제 시 하위 행은 FK 의 ON DELETE CASCADE 로 DB가 지움 (passive_deletes: 하위 행을 읽어오지 않음)
+    prices = relationship("StockPrice", back_populates="stock", cascade="all, delete-orphan",
+                          passive_deletes=True, order_by="StockPrice.date")
+    market_data = relationship("MarketData", back_populates="stock", cascade="all, delete-orphan", passive_deletes=True)
+    predictions = relationship("Prediction", back_populates="stock", cascade="all, delete-orphan", passive_deletes=True)
+    trades = relationship("Trade", back_populates="stock", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<Stock(ticker='{self.ticker}', name='{self.name}')>"
 
 
 class StockPrice(Base):
-    """주가 데이터"""
+    """
+    주가 데이터
+
+    PostgreSQL 에서는 scripts/partition_tables.py 가 date 기준 월별 파티션으로 관리한다
+    (테이블 PK 는 (id, date), ORM 은 id 로 식별).
+    """
     __tablename__ = 'stock_prices'
 
-    id = Column(Integer, primary_key=True)
-    stock_id = Column(Integer, ForeignKey('stocks.id'), nullable=False, index=True)
-    date = Column(DateTime, nullable=False, index=True)
-    open = Column(Float, nullable=False)
-    high = Column(Float, nullable=False)
-    low = Column(Float, nullable=False)
-    close = Column(Float, nullable=False)
-    volume = Column(Integer, nullable=False)
+    id = Column(BigIntegerVariant, primary_key=True)
+    stock_id = Column(Integer, ForeignKey('stocks.id', ondelete='CASCADE'), nullable=False)  # ix_stock_prices_stock_date 가 선두 컬럼으로 커버
+    date = Column(Date, nullable=False)  # 거래일 (ix_stock_prices_date)
+    # KRX 가격은 원 단위 정수라 4바이트 INTEGER 로 저장 (double 대비 행 폭 절반, 비교 시 반올림 오차 없음)
+    open = Column(Integer, nullable=False)
+    high = Column(Integer, nullable=False)
+    low = Column(Integer, nullable=False)
+    close = Column(Integer, nullable=False)
+    volume = Column(BigInteger, nullable=False)  # 대형주 거래량은 int32 범위를 넘을 수 있음
     amount = Column(Float)
-    created_at = Column(DateTime, default=datetime.now)
+    created_at = Column(DateTime, server_default=local_now())
 
     # Relationships
-    stock = relationship("Stock", back_populates="prices")
+    stock = relationship("Stock", back_populates="prices", lazy='raise_on_sql')  # 배치 작업 중 종목별 추가 쿼리(N+1) 방지
+
+    __table_args__ = (
+        # 종목별 기간 조회/중복 체크용 복합 인덱스 (종목당 하루 1건)
+        # PostgreSQL은 OHLCV 컬럼을 INCLUDE 해 테이블 접근 없는 index-only scan 가능
+        Index(
+            'ix_stock_prices_stock_date', 'stock_id', 'date', unique=True,
+            postgresql_include=['open', 'high', 'low', 'close', 'volume', 'amount']
+        ),
+        # 전 종목 날짜 범위 조회용, PostgreSQL은 날짜순으로 쌓이는 테이블에 맞는 BRIN (B-tree 대비 수백분의 1 크기)
+        Index('ix_stock_prices_date', 'date', postgresql_using='brin'),
+    )
 
     def __repr__(self):
         return f"<StockPrice(stock_id={self.stock_id}, date='{self.date}', close={self.close})>"
@@ -58,9 +242,9 @@ class MarketData(Base):
     """시장 데이터 (시가총액, 재무지표 등)"""
     __tablename__ = 'market_data'
 
-    id = Column(Integer, primary_key=True)
-    stock_id = Column(Integer, ForeignKey('stocks.id'), nullable=False, index=True)
-    date = Column(DateTime, nullable=False, index=True)
+    id = Column(BigIntegerVariant, primary_key=True)
+    stock_id = Column(Integer, ForeignKey('stocks.id', ondelete='CASCADE'), nullable=False)  # ix_market_data_stock_date 가 선두 컬럼으로 커버
+    date = Column(Date, nullable=False, index=True)
     market_cap = Column(Float)  # 시가총액
     per = Column(Float)  # 주가수익비율
     pbr = Column(Float)  # 주가순자산비율
@@ -68,10 +252,15 @@ class MarketData(Base):
     eps = Column(Float)  # 주당순이익
     bps = Column(Float)  # 주당순자산
     div_yield = Column(Float)  # 배당수익률
-    created_at = Column(DateTime, default=datetime.now)
+    created_at = Column(DateTime, server_default=local_now())
 
     # Relationships
-    stock = relationship("Stock", back_populates="market_data")
+    stock = relationship("Stock", back_populates="market_data", lazy='raise_on_sql')  # 배치 작업 중 종목별 추가 쿼리(N+1) 방지
+
+    __table_args__ = (
+        # 종목별 기간 조회/중복 방지용 복합 인덱스 (종목당 하루 1건, ON CONFLICT 대상)
+        Index('ix_market_data_stock_date', 'stock_id', 'date', unique=True),
+    )
 
     def __repr__(self):
         return f"<MarketData(stock_id={self.stock_id}, date='{self.date}')>"
@@ -81,18 +270,23 @@ class Prediction(Base):
     """주가 예측 결과"""
     __tablename__ = 'predictions'
 
-    id = Column(Integer, primary_key=True)
-    stock_id = Column(Integer, ForeignKey('stocks.id'), nullable=False, index=True)
+    id = Column(BigIntegerVariant, primary_key=True)
+    stock_id = Column(Integer, ForeignKey('stocks.id', ondelete='CASCADE'), nullable=False)  # ix_predictions_stock_prediction_date 가 선두 컬럼으로 커버
     prediction_date = Column(DateTime, nullable=False, index=True)  # 예측한 날짜
-    target_date = Column(DateTime, nullable=False, index=True)  # 예측 목표 날짜
+    target_date = Column(Date, nullable=False, index=True)  # 예측 목표 날짜
     model_name = Column(String(50), nullable=False)  # LSTM, XGBoost 등
     predicted_price = Column(Float, nullable=False)
     confidence = Column(Float)  # 신뢰도
     actual_price = Column(Float)  # 실제 가격 (나중에 업데이트)
-    created_at = Column(DateTime, default=datetime.now)
+    created_at = Column(DateTime, server_default=local_now())
 
     # Relationships
-    stock = relationship("Stock", back_populates="predictions")
+    stock = relationship("Stock", back_populates="predictions", lazy='raise_on_sql')  # 배치 작업 중 종목별 추가 쿼리(N+1) 방지
+
+    __table_args__ = (
+        # 종목별 최신 예측 조회용 (stock_id 필터 + prediction_date DESC 정렬을 인덱스 역방향 스캔으로 처리)
+        Index('ix_predictions_stock_prediction_date', 'stock_id', 'prediction_date'),
+    )
 
     def __repr__(self):
         return f"<Prediction(stock_id={self.stock_id}, model='{self.model_name}', price={self.predicted_price})>"
@@ -102,21 +296,26 @@ class Trade(Base):
     """거래 내역"""
     __tablename__ = 'trades'
 
-    id = Column(Integer, primary_key=True)
-    stock_id = Column(Integer, ForeignKey('stocks.id'), nullable=False, index=True)
+    id = Column(BigIntegerVariant, primary_key=True)
+    stock_id = Column(Integer, ForeignKey('stocks.id', ondelete='CASCADE'), nullable=False)  # ix_trades_stock_trade_date 가 선두 컬럼으로 커버
     trade_date = Column(DateTime, nullable=False, index=True)
-    trade_type = Column(String(10), nullable=False)  # BUY, SELL
-    quantity = Column(Integer, nullable=False)
+    trade_type = Column(_enum_column_type(TradeType, 'trade_type', length=10), nullable=False)  # BUY, SELL
+    quantity = Column(BigInteger, nullable=False)
     price = Column(Float, nullable=False)
-    amount = Column(Float, nullable=False)  # 거래금액
-    commission = Column(Float, default=0)  # 수수료
+    amount = Column(Float, Computed('quantity * price', persisted=True))  # 거래금액 (DB 계산 컬럼)
+    commission = Column(Float, Computed(f'quantity * price * {TRADE_COMMISSION_RATE}', persisted=True))  # 수수료 (DB 계산 컬럼)
     strategy = Column(String(50))  # 전략명
     signal_strength = Column(Float)  # 시그널 강도
     notes = Column(Text)
-    created_at = Column(DateTime, default=datetime.now)
+    created_at = Column(DateTime, server_default=local_now())
 
     # Relationships
-    stock = relationship("Stock", back_populates="trades")
+    stock = relationship("Stock", back_populates="trades", lazy='raise_on_sql')  # 배치 작업 중 종목별 추가 쿼리(N+1) 방지
+
+    __table_args__ = (
+        # 종목별 최근 거래 조회용
+        Index('ix_trades_stock_trade_date', 'stock_id', 'trade_date'),
+    )
 
     def __repr__(self):
         return f"<Trade(stock_id={self.stock_id}, type='{self.trade_type}', price={self.price})>"
@@ -127,13 +326,15 @@ class Portfolio(Base):
     __tablename__ = 'portfolio'
 
     id = Column(Integer, primary_key=True)
-    stock_id = Column(Integer, ForeignKey('stocks.id'), nullable=False, unique=True, index=True)
+    stock_id = Column(Integer, ForeignKey('stocks.id', ondelete='CASCADE'), nullable=False, unique=True, index=True)
     quantity = Column(Integer, nullable=False)
     avg_buy_price = Column(Float, nullable=False)  # 평균 매수가
     current_price = Column(Float)  # 현재가
     profit_loss = Column(Float)  # 손익
     profit_loss_rate = Column(Float)  # 손익률
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+    updated_at = Column(DateTime, server_default=local_now(), onupdate=local_now())
+    # INSERT/UPDATE 후 DB가 채운 시각을 RETURNING 으로 바로 받아옴 (세션 분리 후에도 접근 가능)
+    __mapper_args__ = {'eager_defaults': True}
 
     def __repr__(self):
         return f"<Portfolio(stock_id={self.stock_id}, quantity={self.quantity}, avg_price={self.avg_buy_price})>"
@@ -157,7 +358,7 @@ class BacktestResult(Base):
     total_trades = Column(Integer)  # 총 거래 횟수
     profitable_trades = Column(Integer)  # 수익 거래 수
     parameters = Column(Text)  # JSON 형태의 전략 파라미터
-    created_at = Column(DateTime, default=datetime.now)
+    created_at = Column(DateTime, server_default=local_now())
 
     def __repr__(self):
         return f"<BacktestResult(strategy='{self.strategy_name}', return={self.total_return}%)>"
@@ -170,7 +371,7 @@ class AnalysisRun(Base):
     id = Column(Integer, primary_key=True)
     run_date = Column(Date, nullable=False, index=True)  # 분석 실행 날짜
     target_trade_date = Column(Date, nullable=False)  # 매매 대상 날짜
-    status = Column(String(20), nullable=False, default='running', index=True)  # running, completed, failed
+    status = Column(_enum_column_type(RunStatus, 'run_status'), nullable=False, default=RunStatus.RUNNING, index=True)  # running, completed, failed
     start_time = Column(DateTime, nullable=False)
     end_time = Column(DateTime)
     total_duration_seconds = Column(Float)
@@ -187,19 +388,21 @@ class AnalysisRun(Base):
     error_phase = Column(String(50))  # Increased from 20 to accommodate longer phase names
 
     # Summary metrics
-    total_stocks_analyzed = Column(Integer)
-    ai_candidates_count = Column(Integer)
-    technical_selections_count = Column(Integer)
-    final_signals_count = Column(Integer)
+    total_stocks_analyzed = Column(SmallInteger)
+    ai_candidates_count = Column(SmallInteger)
+    technical_selections_count = Column(SmallInteger)
+    final_signals_count = Column(SmallInteger)
 
-    created_at = Column(DateTime, default=datetime.now)
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+    created_at = Column(DateTime, server_default=local_now())
+    updated_at = Column(DateTime, server_default=local_now(), onupdate=local_now())
+    # INSERT/UPDATE 후 DB가 채운 시각을 RETURNING 으로 바로 받아옴 (세션 분리 후에도 접근 가능)
+    __mapper_args__ = {'eager_defaults': True}
 
     # Relationships
-    market_snapshot = relationship("MarketSnapshot", back_populates="analysis_run", uselist=False, cascade="all, delete-orphan")
-    ai_screening = relationship("AIScreeningResult", back_populates="analysis_run", uselist=False, cascade="all, delete-orphan")
-    technical_screening = relationship("TechnicalScreeningResult", back_populates="analysis_run", uselist=False, cascade="all, delete-orphan")
-    trading_signals = relationship("TradingSignal", back_populates="analysis_run", cascade="all, delete-orphan")
+    market_snapshot = relationship("MarketSnapshot", back_populates="analysis_run", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    ai_screening = relationship("AIScreeningResult", back_populates="analysis_run", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    technical_screening = relationship("TechnicalScreeningResult", back_populates="analysis_run", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    trading_signals = relationship("TradingSignal", back_populates="analysis_run", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<AnalysisRun(date={self.run_date}, status='{self.status}', signals={self.final_signals_count})>"
@@ -217,12 +420,12 @@ class MarketSnapshot(Base):
     kospi_close = Column(Float, nullable=False)
     kospi_change_pct = Column(Float, nullable=False)
     kospi_volume = Column(BigInteger)
-    kospi_trend = Column(String(20))  # UPTREND, DOWNTREND, NEUTRAL
+    kospi_trend = Column(MARKET_TREND_TYPE)  # UPTREND, DOWNTREND, RANGE, NEUTRAL
 
     kosdaq_close = Column(Float, nullable=False)
     kosdaq_change_pct = Column(Float, nullable=False)
     kosdaq_volume = Column(BigInteger)
-    kosdaq_trend = Column(String(20))
+    kosdaq_trend = Column(MARKET_TREND_TYPE)
 
     # Investor flows (KRW)
     foreign_net_buy = Column(BigInteger)
@@ -241,20 +444,61 @@ class MarketSnapshot(Base):
 
     # Momentum & Sentiment
     momentum_score = Column(Float)  # 0-100
-    market_sentiment = Column(String(20))  # BULLISH, BEARISH, NEUTRAL
+    market_sentiment = Column(_enum_column_type(MarketSentiment, 'market_sentiment'))  # BULLISH, BEARISH, NEUTRAL
 
-    # Sector performance (JSON)
-    sector_performance = Column(JSON)  # [{sector, change_pct, volume_ratio}, ...]
+    # Sector performance (PostgreSQL은 JSONB, 섹터별 조회/정렬은 sector_rows 사용)
+    sector_performance = Column(JSONVariant)  # {sector: change_pct} 또는 [{sector, change_pct, volume_ratio}, ...]
 
-    created_at = Column(DateTime, default=datetime.now)
+    created_at = Column(DateTime, server_default=local_now())
 
     # Relationships
     analysis_run = relationship("AnalysisRun", back_populates="market_snapshot")
+    sector_rows = relationship("SectorPerformance", back_populates="snapshot", cascade="all, delete-orphan", passive_deletes=True)
+
+    __table_args__ = (
+        # sector_performance @> '{"IT": 1.2}' 같은 포함 조회용 (jsonb_path_ops: @> 전용, 기본 GIN 보다 작음)
+        Index(
+            'ix_market_snapshots_sector_performance', 'sector_performance',
+            postgresql_using='gin', postgresql_ops={'sector_performance': 'jsonb_path_ops'}
+        ).ddl_if(dialect='postgresql'),
+    )
 
     def __repr__(self):
         return f"<MarketSnapshot(date={self.snapshot_date}, kospi={self.kospi_close}, sentiment='{self.market_sentiment}')>"
 
 
+class SectorPerformance(Base):
+    """시장 스냅샷의 섹터별 성과 (MarketSnapshot.sector_performance 정규화)"""
+    __tablename__ = 'sector_performances'
+
+    id = Column(Integer, primary_key=True)
+    snapshot_id = Column(Integer, ForeignKey('market_snapshots.id', ondelete='CASCADE'), nullable=False)
+    sector = Column(String(50), nullable=False)
+    change_pct = Column(Float)  # 섹터 수익률 (%)
+    volume_ratio = Column(Float)  # 거래량 비율
+
+    # Relationships
+    snapshot = relationship("MarketSnapshot", back_populates="sector_rows")
+
+    __table_args__ = (
+        Index('ix_sector_performances_snapshot_sector', 'snapshot_id', 'sector'),
+    )
+
+    @staticmethod
+    def rows_from_json(sector_performance) -> list:
+        """sector_performance JSON ({sector: change_pct} 또는 딕셔너리 리스트) -> 행 딕셔너리 리스트"""
+        if not sector_performance:
+            return []
+        if isinstance(sector_performance, dict):
+            return [{'sector': sector, 'change_pct': change_pct, 'volume_ratio': None}
+                    for sector, change_pct in sector_performance.items()]
+        return [{'sector': item['sector'], 'change_pct': item.get('change_pct'), 'volume_ratio': item.get('volume_ratio')}
+                for item in sector_performance]
+
+    def __repr__(self):
+        return f"<SectorPerformance(sector='{self.sector}', change_pct={self.change_pct})>"
+
+
 class AIScreeningResult(Base):
     """AI 스크리닝 결과 (Phase 3)"""
     __tablename__ = 'ai_screening_results'
@@ -268,34 +512,54 @@ class AIScreeningResult(Base):
     ai_model = Column(String(50))     # gpt-4, claude-3, gemini-pro
 
     # Execution metrics
-    total_input_stocks = Column(Integer, nullable=False)
-    selected_count = Column(Integer, nullable=False)
+    total_input_stocks = Column(SmallInteger, nullable=False)
+    selected_count = Column(SmallInteger, nullable=False)
     execution_time_seconds = Column(Float)
     api_cost_usd = Column(Float)
 
-    # Prompt & Response
-    prompt_text = Column(Text)
-    response_text = Column(Text)
+    # Response summary (전체 프롬프트/응답은 payload)
     response_summary = Column(Text)
 
-    created_at = Column(DateTime, default=datetime.now)
+    created_at = Column(DateTime, server_default=local_now())
 
     # Relationships
     analysis_run = relationship("AnalysisRun", back_populates="ai_screening")
-    candidates = relationship("AICandidate", back_populates="ai_screening", cascade="all, delete-orphan")
+    candidates = relationship("AICandidate", back_populates="ai_screening", cascade="all, delete-orphan", passive_deletes=True)
+    payload = relationship("AIScreeningPayload", back_populates="ai_screening", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<AIScreeningResult(date={self.screening_date}, provider='{self.ai_provider}', selected={self.selected_count})>"
 
 
+class AIScreeningPayload(Base):
+    """
+    AI 스크리닝 프롬프트/응답 원문 (Phase 3)
+
+    수 KB 단위 LLM 텍스트를 별도 테이블에 두어 ai_screening_results 행을 작게 유지한다.
+    payload 관계에 접근할 때만 로드된다.
+    """
+    __tablename__ = 'ai_screening_payloads'
+
+    id = Column(Integer, ForeignKey('ai_screening_results.id', ondelete='CASCADE'), primary_key=True)
+    prompt_text = Column(Text)
+    response_text = Column(Text)
+
+    # Relationships
+    ai_screening = relationship("AIScreeningResult", back_populates="payload")
+
+    def __repr__(self):
+        return f"<AIScreeningPayload(screening_id={self.id})>"
+
+
 class AICandidate(Base):
     """AI 선정 종목 상세 (Phase 3)"""
     __tablename__ = 'ai_candidates'
 
     id = Column(Integer, primary_key=True)
-    ai_screening_id = Column(Integer, ForeignKey('ai_screening_results.id', ondelete='CASCADE'), nullable=False, index=True)
+    ai_screening_id = Column(Integer, ForeignKey('ai_screening_results.id', ondelete='CASCADE'), nullable=False)  # 복합 인덱스가 커버
 
-    stock_code = Column(String(10), nullable=False, index=True)
+    stock_id = Column(Integer, ForeignKey('stocks.id', ondelete='SET NULL'), index=True)  # stocks 에 없는 KIS 종목은 NULL
+    stock_code = Column(String(10), nullable=False)  # ix_ai_candidates_screening_stock 가 커버
     company_name = Column(String(100))
 
     # AI evaluation
@@ -312,11 +576,18 @@ class AICandidate(Base):
     volume = Column(BigInteger)
     sector = Column(String(50))
 
-    created_at = Column(DateTime, default=datetime.now)
+    created_at = Column(DateTime, server_default=local_now())
 
     # Relationships
     ai_screening = relationship("AIScreeningResult", back_populates="candidates")
 
+    __table_args__ = (
+        # 스크리닝 결과별 순위순 조회용
+        Index('ix_ai_candidates_screening_rank', 'ai_screening_id', 'rank_in_batch'),
+        # 스크리닝 결과 내 종목 조회 (Phase 4 이름 조회, 대시보드 신호-후보 조인)
+        Index('ix_ai_candidates_screening_stock', 'ai_screening_id', 'stock_code'),
+    )
+
     def __repr__(self):
         return f"<AICandidate(code={self.stock_code}, score={self.ai_score}, rank={self.rank_in_batch})>"
 
@@ -329,19 +600,19 @@ class TechnicalScreeningResult(Base):
     analysis_run_id = Column(Integer, ForeignKey('analysis_runs.id', ondelete='CASCADE'), nullable=False, index=True)
     screening_date = Column(Date, nullable=False)
 
-    input_candidates_count = Column(Integer, nullable=False)
-    final_selections_count = Column(Integer, nullable=False)
+    input_candidates_count = Column(SmallInteger, nullable=False)
+    final_selections_count = Column(SmallInteger, nullable=False)
     execution_time_seconds = Column(Float)
 
     # Scoring thresholds used
     min_final_score = Column(Float)  # Minimum score to pass (e.g., 50)
-    max_selections = Column(Integer)   # Maximum stocks to select (e.g., 5)
+    max_selections = Column(SmallInteger)   # Maximum stocks to select (e.g., 5)
 
-    created_at = Column(DateTime, default=datetime.now)
+    created_at = Column(DateTime, server_default=local_now())
 
     # Relationships
     analysis_run = relationship("AnalysisRun", back_populates="technical_screening")
-    selections = relationship("TechnicalSelection", back_populates="tech_screening", cascade="all, delete-orphan")
+    selections = relationship("TechnicalSelection", back_populates="tech_screening", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<TechnicalScreeningResult(date={self.screening_date}, input={self.input_candidates_count}, selected={self.final_selections_count})>"
@@ -354,7 +625,8 @@ class TechnicalSelection(Base):
     id = Column(Integer, primary_key=True)
     tech_screening_id = Column(Integer, ForeignKey('technical_screening_results.id', ondelete='CASCADE'), nullable=False, index=True)
 
-    stock_code = Column(String(10), nullable=False, index=True)
+    stock_id = Column(Integer, ForeignKey('stocks.id', ondelete='SET NULL'), index=True)  # stocks 에 없는 KIS 종목은 NULL
+    stock_code = Column(String(10), nullable=False)  # 표시용 (스크리닝 결과별로 tech_screening_id 로 조회)
     company_name = Column(String(100))
     current_price = Column(Float, nullable=False)
 
@@ -366,29 +638,47 @@ class TechnicalSelection(Base):
     volume_score = Column(Float)   # out of 10
     final_score = Column(Float)    # out of 70
 
-    # Technical indicators (JSON for all 16 indicators)
-    indicators = Column(JSON)  # {SMA_5, SMA_20, RSI_14, MACD, ...}
+    # Key indicators (필터/정렬용 컬럼, 나머지 지표는 indicators JSON)
+    sma_5 = Column(Float)
+    sma_20 = Column(Float)
+    rsi_14 = Column(Float)
+    macd = Column(Float)
+    macd_signal = Column(Float)
+    bb_upper = Column(Float)
+    bb_lower = Column(Float)
+
+    # Technical indicators (JSON for all 16 indicators, PostgreSQL은 JSONB + GIN 인덱스)
+    indicators = Column(JSONVariant)  # {SMA_5, SMA_20, RSI_14, MACD, ...}
 
     rank_in_batch = Column(Integer)
     selection_reason = Column(Text)
 
-    created_at = Column(DateTime, default=datetime.now)
+    created_at = Column(DateTime, server_default=local_now())
 
     # Relationships
     tech_screening = relationship("TechnicalScreeningResult", back_populates="selections")
 
+    __table_args__ = (
+        Index('ix_technical_selections_indicators', 'indicators', postgresql_using='gin').ddl_if(dialect='postgresql'),
+    )
+
     def __repr__(self):
         return f"<TechnicalSelection(code={self.stock_code}, score={self.final_score}, rank={self.rank_in_batch})>"
 
 
 class TradingSignal(Base):
-    """AI 기반 매매 신호 (Phase 5 - 최종 결과)"""
+    """
+    AI 기반 매매 신호 (Phase 5 - 최종 결과)
+
+    PostgreSQL 에서는 scripts/partition_tables.py 가 analysis_date 기준 월별 파티션으로 관리한다
+    (테이블 PK 는 (id, analysis_date), ORM 은 id 로 식별).
+    """
     __tablename__ = 'trading_signals'
 
     id = Column(Integer, primary_key=True)
-    analysis_run_id = Column(Integer, ForeignKey('analysis_runs.id', ondelete='CASCADE'), nullable=False, index=True)
+    analysis_run_id = Column(Integer, ForeignKey('analysis_runs.id', ondelete='CASCADE'), nullable=False)  # ix_trading_signals_run_target_status 가 커버
     tech_selection_id = Column(Integer, ForeignKey('technical_selections.id'))  # Link to technical selection
-    stock_id = Column(Integer, ForeignKey('stocks.id'), nullable=True, index=True)
+    stock_id = Column(Integer, ForeignKey('stocks.id', ondelete='SET NULL'), nullable=True)  # ix_trading_signals_stock_date 가 선두 컬럼으로 커버
 
     stock_code = Column(String(10), nullable=False, index=True)
     company_name = Column(String(100))
@@ -406,7 +696,7 @@ class TradingSignal(Base):
     # Performance metrics
     predicted_return = Column(Float, nullable=False)  # 예상 수익률
     risk_reward_ratio = Column(Float)  # Target profit / Stop loss
-    ai_confidence = Column(Integer, nullable=False)  # AI 신뢰도 (0-100)
+    ai_confidence = Column(SmallInteger, nullable=False)  # AI 신뢰도 (0-100)
 
     # Support/Resistance levels
     support_level = Column(Float)
@@ -420,7 +710,7 @@ class TradingSignal(Base):
     # Volatility
     atr = Column(Float)
     atr_percent = Column(Float)
-    volatility_rank = Column(String(20))  # LOW, MEDIUM, HIGH
+    volatility_rank = Column(_enum_column_type(VolatilityRank, 'volatility_rank'))  # LOW, MEDIUM, HIGH
 
     # Technical indicators (key ones)
     current_rsi = Column(Float)
@@ -433,13 +723,14 @@ class TradingSignal(Base):
     sector_momentum = Column(String(20))  # 섹터 모멘텀
 
     # AI reasoning
-    ai_reasoning = Column(Text)  # AI가 선택한 이유
+    # 목록 조회에서는 읽지 않는 큰 컬럼 (deferred 'details' 그룹, 접근하거나 undefer 할 때 로드)
+    ai_reasoning = deferred(Column(Text), group='details')  # AI가 선택한 이유
 
     # Calculation details (JSON)
-    calculation_details = Column(JSON)  # {buy_premium_pct, target_method, stop_method, ...}
+    calculation_details = deferred(Column(JSON), group='details')  # {buy_premium_pct, target_method, stop_method, ...}
 
     # Execution tracking
-    status = Column(String(20), default='pending', index=True)  # pending, executed, cancelled, expired
+    status = Column(_enum_column_type(SignalStatus, 'signal_status'), default=SignalStatus.PENDING)  # pending, executed, missed, cancelled, expired
     executed_price = Column(Float)  # 실제 체결가
     executed_date = Column(DateTime)  # 실제 체결 날짜
 
@@ -449,12 +740,55 @@ class TradingSignal(Base):
     exit_time = Column(DateTime)
     exit_reason = Column(String(50))  # target_hit, stop_hit, manual, timeout
 
-    created_at = Column(DateTime, default=datetime.now, index=True)
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+    created_at = Column(DateTime, server_default=local_now(), index=True)
+    updated_at = Column(DateTime, server_default=local_now(), onupdate=local_now())
+    # INSERT/UPDATE 후 DB가 채운 시각을 RETURNING 으로 바로 받아옴 (세션 분리 후에도 접근 가능)
+    __mapper_args__ = {'eager_defaults': True}
 
     # Relationships
     analysis_run = relationship("AnalysisRun", back_populates="trading_signals")
     stock = relationship("Stock", foreign_keys=[stock_id])
 
+    __table_args__ = (
+        # 날짜별/대기 신호 조회용 복합 인덱스
+        Index('ix_trading_signals_date_status', 'analysis_date', 'status'),
+        # 분석 실행별 매매 예정일/상태 조회용 ("오늘 실행분 중 대기 신호")
+        Index('ix_trading_signals_run_target_status', 'analysis_run_id', 'target_trade_date', 'status'),
+        # 대시보드 신호 목록 (analysis_run_id 로 필터, 표시 컬럼을 INCLUDE 해 힙 접근 없이 index-only scan)
+        # SQLite 는 INCLUDE 가 없고 위 인덱스가 analysis_run_id 선두 조회를 커버하므로 PostgreSQL 에만 생성
+        Index(
+            'ix_trading_signals_run_covering', 'analysis_run_id',
+            postgresql_include=['stock_code', 'company_name', 'tech_selection_id', 'buy_price', 'target_price',
+                                'stop_loss_price', 'predicted_return', 'risk_reward_ratio', 'ai_confidence', 'status']
+        ).ddl_if(dialect='postgresql'),
+        # 종목별 신호 이력 (SQLite 에서는 INCLUDE 없이 복합 인덱스로 생성)
+        Index(
+            'ix_trading_signals_stock_date', 'stock_id', 'analysis_date',
+            postgresql_include=['buy_price', 'target_price', 'actual_return']
+        ),
+    )
+
+    # __repr__ 가 읽는 컬럼 (Database 가 컬럼 일부만 로드할 때도 항상 함께 로드)
+    REPR_COLUMNS = ('stock_code', 'analysis_date', 'buy_price', 'target_price')
+
     def __repr__(self):
         return f"<TradingSignal(code={self.stock_code}, date={self.analysis_date}, buy={self.buy_price}, target={self.target_price})>"
+
+
+# 대기 신호 조회용 부분 인덱스 (status='pending' 행만 ai_confidence 내림차순으로 저장)
+# 실행/만료된 신호가 쌓여도 인덱스 크기는 대기 신호 수에 비례하고, ORDER BY 정렬이 생략된다
+Index(
+    'ix_trading_signals_pending_confidence',
+    TradingSignal.ai_confidence.desc(),
+    postgresql_where=(TradingSignal.status == 'pending'),
+    sqlite_where=(TradingSignal.status == 'pending'),
+)
+
+# 매매 예정일별 대기 신호 조회용 부분 인덱스 (status + target_trade_date 전체 복합 인덱스 대체)
+# 실행 프로그램의 "status='pending' AND target_trade_date <= 오늘" 조회가 대기 신호 행만 훑는다
+Index(
+    'ix_trading_signals_pending_target_date',
+    TradingSignal.target_trade_date,
+    postgresql_where=(TradingSignal.status == 'pending'),
+    sqlite_where=(TradingSignal.status == 'pending'),
+)
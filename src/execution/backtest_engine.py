@@ -4,17 +4,85 @@
 
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from loguru import logger
 
 from src.portfolio.portfolio_manager import PortfolioManager
 from src.strategy.base_strategy import BaseStrategy
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _equity_stats_loop(values: np.ndarray) -> Tuple[float, float]:
+    """
+    자산 곡선을 한 번 순회하며 (일간 수익률 평균/표준편차, 최대 낙폭 %) 계산
+
+    표준편차는 pandas 와 같은 표본 표준편차(ddof=1)이며 Welford 방식으로 누적한다.
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    running_max = values[0]
+    max_drawdown = 0.0
+
+    for i in range(1, values.shape[0]):
+        value = values[i]
+        ret = value / values[i - 1] - 1.0
+        count += 1
+        delta = ret - mean
+        mean += delta / count
+        m2 += delta * (ret - mean)
+
+        if value > running_max:
+            running_max = value
+        drawdown = (value - running_max) / running_max * 100.0
+        if drawdown < max_drawdown:
+            max_drawdown = drawdown
+
+    ratio = 0.0
+    if count > 1 and m2 > 0.0:
+        ratio = mean / np.sqrt(m2 / (count - 1))
+    return ratio, max_drawdown
+
+
+def _equity_stats_numpy(values: np.ndarray) -> Tuple[float, float]:
+    """_equity_stats_loop 와 같은 결과를 NumPy 배열 연산으로 계산 (numba 미설치 시)"""
+    returns = values[1:] / values[:-1] - 1.0
+    std = returns.std(ddof=1) if len(returns) > 1 else 0.0
+    ratio = returns.mean() / std if std > 0 else 0.0
+
+    running_max = np.maximum.accumulate(values)
+    max_drawdown = ((values - running_max) / running_max * 100.0).min()
+    return float(ratio), float(max_drawdown)
+
+
+# numba 가 있으면 단일 패스 루프를 JIT 컴파일해 사용 (중간 배열 할당 없음)
+_equity_stats_kernel = njit(cache=True)(_equity_stats_loop) if NUMBA_AVAILABLE else _equity_stats_numpy
+
+
+def _equity_stats(values: np.ndarray) -> Tuple[float, float]:
+    """자산 곡선 통계 (기간 내 거래일이 2일 미만이면 수익률이 없으므로 (0.0, 0.0))"""
+    if len(values) < 2:
+        return 0.0, 0.0
+    return _equity_stats_kernel(values)
+
 
 class BacktestEngine:
     """백테스팅 엔진"""
 
+    # Signal 컬럼 값 -> int8 코드 (그 외 값/결측은 HOLD = 0)
+    SIGNAL_CODES = {'BUY': 1, 'SELL': -1}
+
+    # generate_signals 결과 LRU 캐시 (엔진 인스턴스 간 공유, 같은 전략/파라미터/데이터 재실행 시 재계산 생략)
+    SIGNAL_CACHE_SIZE = 1024
+    _signal_cache: "OrderedDict[tuple, pd.DataFrame]" = OrderedDict()
+
     def __init__(self, initial_capital: float = 10000000):
         self.initial_capital = initial_capital
         self.results = {}
@@ -35,38 +103,48 @@ class BacktestEngine:
         """
         logger.info(f"백테스팅 시작: 전략={strategy.name}, 종목={len(data)}개")
 
-        portfolio = PortfolioManager(self.initial_capital)
-        equity_curve = []
         all_trades = []
 
-        # 각 종목별 시그널 생성
-        signals = {}
+        # 종목별 기간 필터
+        frames = {}
         for ticker, df in data.items():
             if start_date:
                 df = df[df.index >= start_date]
             if end_date:
                 df = df[df.index <= end_date]
-
-            signals[ticker] = strategy.generate_signals(df)
-
-        # 날짜별로 시뮬레이션
-        all_dates = sorted(set().union(*[df.index for df in signals.values()]))
-
-        for date in all_dates:
-            current_prices = {}
-
-            # 각 종목 처리
-            for ticker, df in signals.items():
-                if date not in df.index:
-                    continue
-
-                row = df.loc[date]
-                price = row['Close']
-                signal = row.get('Signal', 'HOLD')
-                current_prices[ticker] = price
+            frames[ticker] = df
+
+        # 날짜별로 시뮬레이션 (포트폴리오 보유 배열도 tickers 순서로 맞춰 종가 행을 그대로 평가에 사용)
+        tickers = tuple(frames)
+        portfolio = PortfolioManager(self.initial_capital, tickers=tickers)
+        # 날짜 합집합: Timestamp 객체를 set 에 넣지 않고 datetime64 배열을 합쳐 정렬/중복 제거
+        index_values = [df.index.to_numpy() for df in frames.values()]
+        all_dates = pd.Index(np.unique(np.concatenate(index_values)) if index_values else [])
+
+        # 날짜×종목 배열로 한 번에 정렬해 두고, 날짜 루프에서는 해당 행만 읽음 (셀마다 df.loc 조회 없음)
+        # 전략이 일괄 계산을 지원하면 전 종목 시그널을 한 번에, 아니면 종목별 generate_signals (캐시 사용)
+        close_mat, signal_mat = self._batch_signal_matrices(strategy, frames, all_dates)
+        if close_mat is None:
+            signals = {
+                ticker: self._generate_signals_cached(strategy, ticker, df)
+                for ticker, df in frames.items()
+            }
+            close_mat, signal_mat = self._build_signal_matrices(signals, all_dates)
+
+        # 날짜별 자산/현금은 미리 할당한 배열에 기록 (날짜마다 dict 를 만들지 않음)
+        values = np.empty(len(all_dates), dtype=np.float64)
+        cash = np.empty(len(all_dates), dtype=np.float64)
+
+        for i, date in enumerate(all_dates):
+            close_row = close_mat[i]
+
+            # 시그널이 있는 종목만 종목 순서대로 처리
+            for j in np.flatnonzero(signal_mat[i]):
+                ticker = tickers[j]
+                price = float(close_row[j])
 
                 # 매매 실행
-                if signal == 'BUY':
+                if signal_mat[i, j] == 1:
                     # 가용 자금의 20%로 매수
                     max_buy_amount = portfolio.cash * 0.2
                     quantity = int(max_buy_amount / price)
@@ -81,9 +159,9 @@ class BacktestEngine:
                                 'price': price
                             })
 
-                elif signal == 'SELL':
-                    if ticker in portfolio.holdings:
-                        quantity = portfolio.holdings[ticker]['quantity']
+                else:  # SELL
+                    quantity = portfolio.get_quantity(ticker)
+                    if quantity > 0:
                         success = portfolio.sell(ticker, quantity, price)
                         if success:
                             all_trades.append({
@@ -95,31 +173,19 @@ class BacktestEngine:
                             })
 
             # 자산 추적
-            portfolio_value = portfolio.get_portfolio_value(current_prices)
-            equity_curve.append({
-                'date': date,
-                'value': portfolio_value,
-                'cash': portfolio.cash
-            })
+            values[i] = portfolio.get_portfolio_value(close_row)
+            cash[i] = portfolio.cash
 
         # 최종 결과 계산
-        final_value = equity_curve[-1]['value'] if equity_curve else self.initial_capital
+        final_value = float(values[-1]) if len(values) else self.initial_capital
         total_return = ((final_value - self.initial_capital) / self.initial_capital) * 100
 
         # 성능 지표 계산
-        equity_df = pd.DataFrame(equity_curve)
-        equity_df.set_index('date', inplace=True)
-
-        # 수익률 계산
-        returns = equity_df['value'].pct_change().dropna()
-
-        # 샤프 비율
-        sharpe_ratio = (returns.mean() / returns.std()) * np.sqrt(252) if returns.std() > 0 else 0
+        equity_df = pd.DataFrame({'value': values, 'cash': cash}, index=all_dates.rename('date'))
 
-        # 최대 낙폭 (MDD)
-        cummax = equity_df['value'].cummax()
-        drawdown = (equity_df['value'] - cummax) / cummax * 100
-        max_drawdown = drawdown.min()
+        # 샤프 비율 (일간 수익률 기준 연율화), 최대 낙폭 (MDD)
+        ratio, max_drawdown = _equity_stats(values)
+        sharpe_ratio = ratio * np.sqrt(252)
 
         # 승률
         profitable_trades = sum(1 for t in all_trades if t['type'] == 'SELL')
@@ -143,6 +209,90 @@ class BacktestEngine:
 
         return result
 
+    @classmethod
+    def _generate_signals_cached(cls, strategy: BaseStrategy, ticker: str, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        strategy.generate_signals 결과를 (전략 클래스, 파라미터, 종목, 데이터 해시) 키로 캐시
+
+        데이터 해시는 인덱스와 값 전체로 계산하므로 기간이나 값이 바뀌면 다시 계산한다.
+        반환된 DataFrame 은 캐시와 공유되므로 호출자가 수정하면 안 된다.
+        """
+        key = (
+            type(strategy).__qualname__,
+            repr(sorted(strategy.get_params().items())),
+            ticker,
+            tuple(df.columns),
+            len(df),
+            int(pd.util.hash_pandas_object(df, index=True).sum()),
+        )
+
+        cached = cls._signal_cache.get(key)
+        if cached is not None:
+            cls._signal_cache.move_to_end(key)
+            return cached
+
+        result = strategy.generate_signals(df)
+        cls._signal_cache[key] = result
+        if len(cls._signal_cache) > cls.SIGNAL_CACHE_SIZE:
+            cls._signal_cache.popitem(last=False)
+        return result
+
+    @classmethod
+    def clear_signal_cache(cls):
+        """시그널 캐시 비우기 (전략 구현을 바꾼 뒤 같은 프로세스에서 다시 실행할 때)"""
+        cls._signal_cache.clear()
+
+    @staticmethod
+    def _batch_signal_matrices(strategy: BaseStrategy, frames: Dict[str, pd.DataFrame],
+                               all_dates: pd.Index) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        strategy.generate_signal_codes 로 날짜×종목 배열을 한 번에 계산
+
+        종목별 롤링 계산과 결과가 같도록 각 종목 데이터가 all_dates 위에서 빠진 날짜/결측 종가 없이
+        연속일 때만 사용한다. 조건이 맞지 않거나 전략이 지원하지 않으면 (None, None).
+        """
+        close = {}
+        for ticker, df in frames.items():
+            if not (df.index.is_monotonic_increasing and df.index.is_unique) or df['Close'].isna().any():
+                return None, None
+            rows = all_dates.get_indexer(df.index)
+            if len(rows) and rows[-1] - rows[0] + 1 != len(rows):
+                return None, None
+            close[ticker] = df['Close']
+
+        close_frame = pd.DataFrame(close, index=all_dates, columns=list(frames), dtype=np.float64)
+        codes = strategy.generate_signal_codes(close_frame)
+        if codes is None:
+            return None, None
+
+        close_mat = close_frame.to_numpy()
+        signal_mat = np.array(codes, dtype=np.int8)
+        # 종가가 없는 날은 매매하지 않음
+        signal_mat[np.isnan(close_mat)] = 0
+        return close_mat, signal_mat
+
+    @classmethod
+    def _build_signal_matrices(cls, signals: Dict[str, pd.DataFrame], all_dates: pd.Index) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        종목별 시그널 DataFrame을 날짜×종목 2차원 배열로 변환
+
+        Returns:
+            (close_mat, signal_mat): 종가 (해당 날짜에 데이터가 없으면 NaN),
+            시그널 코드 (BUY=1, SELL=-1, HOLD/데이터 없음=0)
+        """
+        close_mat = np.full((len(all_dates), len(signals)), np.nan)
+        signal_mat = np.zeros((len(all_dates), len(signals)), dtype=np.int8)
+
+        for j, df in enumerate(signals.values()):
+            rows = all_dates.get_indexer(df.index)
+            close_mat[rows, j] = df['Close'].to_numpy(dtype=np.float64)
+            if 'Signal' in df.columns:
+                signal_mat[rows, j] = df['Signal'].map(cls.SIGNAL_CODES).fillna(0).to_numpy(dtype=np.int8)
+
+        # 종가가 없는 날은 매매하지 않음
+        signal_mat[np.isnan(close_mat)] = 0
+        return close_mat, signal_mat
+
     def generate_report(self, result: Dict) -> str:
         """백테스팅 결과 리포트 생성"""
         report = f"""
@@ -9,21 +9,34 @@ This orchestrator:
 5. Provides rollback on failure
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, date, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 import time
+import numpy as np
 from loguru import logger
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from src.database import Database
 from src.database.models import (
-    AnalysisRun, MarketSnapshot, AIScreeningResult, AICandidate,
+    AnalysisRun, MarketSnapshot, SectorPerformance, AIScreeningResult, AIScreeningPayload, AICandidate,
     TechnicalScreeningResult, TechnicalSelection, TradingSignal
 )
 from src.screening.market_analyzer import MarketAnalyzer
 from src.screening.ai_screener import AIScreener
 from src.analysis.technical_screener import TechnicalScreener
+from src.analysis.technical_indicators import TechnicalIndicators
 from src.pricing.price_calculator import PriceCalculator
+from src.utils import SectorMapper
+
+
+def to_python_type(value):
+    """Convert numpy types to Python native types for database storage"""
+    if isinstance(value, (np.integer, np.floating)):
+        return float(value)
+    return value
 
 
 class AnalysisOrchestrator:
@@ -31,17 +44,23 @@ class AnalysisOrchestrator:
     Orchestrates complete daily analysis workflow with database persistence
     """
 
+    # Concurrent Phase 5 workers (indicator + price calculation per selected stock)
+    PHASE5_MAX_WORKERS = 8
+
     def __init__(self, db: Optional[Database] = None):
         """
         Initialize orchestrator
 
         Args:
-            db: Database instance (creates new if not provided)
+            db: Database instance (creates new if not provided). Pass one created with
+                pool_pre_ping=True: the run idles for minutes during the AI call
         """
-        self.db = db or Database()
+        self.db = db or Database(pool_pre_ping=True)
         self.market_analyzer = MarketAnalyzer()
         self.ai_screener = AIScreener()
         self.technical_screener = TechnicalScreener()
+        self.tech_indicators = TechnicalIndicators()
+        self.sector_mapper = SectorMapper()  # memoized sector names, reused across runs
         self.price_calculator = PriceCalculator(db=self.db)
 
     def run_daily_analysis(
@@ -65,8 +84,6 @@ class AnalysisOrchestrator:
         logger.info(f"🚀 Starting daily analysis for {analysis_date}")
         logger.info(f"   Target trade date: {target_trade_date}")
 
-        # Create analysis run record
-        session = self.db.get_session()
         analysis_run = None
 
         try:
@@ -77,8 +94,8 @@ class AnalysisOrchestrator:
                 status='running',
                 start_time=datetime.now()
             )
-            session.add(analysis_run)
-            session.commit()
+            with self._phase_session(analysis_run):
+                pass  # INSERT on commit
             logger.info(f"✅ Created analysis_run (ID: {analysis_run.id})")
 
             # Phase 1: Data Collection (already done by KIS DB)
@@ -86,20 +103,26 @@ class AnalysisOrchestrator:
             logger.info("PHASE 1: DATA COLLECTION")
             logger.info(f"{'='*80}")
             stocks_count = self.db.get_available_symbols_count_from_kis()
-            analysis_run.total_stocks_analyzed = stocks_count
-            analysis_run.phase1_completed = True
-            session.commit()
+            with self._phase_session(analysis_run):
+                analysis_run.total_stocks_analyzed = stocks_count
+                analysis_run.phase1_completed = True
             logger.info(f"✅ Phase 1 complete: {stocks_count} stocks available")
 
+            # Phase 3 data loading (KIS stock info + OHLCV) does not depend on Phase 2,
+            # so start it on a background thread and let it overlap the market analysis
+            preload_executor = ThreadPoolExecutor(max_workers=1)
+            phase3_preload = preload_executor.submit(self._preload_phase3_data, analysis_date)
+            preload_executor.shutdown(wait=False)
+
             # Phase 2: Market Analysis
             logger.info(f"\n{'='*80}")
             logger.info("PHASE 2: MARKET ANALYSIS")
             logger.info(f"{'='*80}")
             phase2_start = time.time()
-            market_data = self._run_phase2_market_analysis(session, analysis_run, analysis_date)
+            with self._phase_session(analysis_run) as session:
+                market_data = self._run_phase2_market_analysis(session, analysis_run, analysis_date)
+                analysis_run.phase2_completed = True
             phase2_duration = time.time() - phase2_start
-            analysis_run.phase2_completed = True
-            session.commit()
             logger.info(f"✅ Phase 2 complete ({phase2_duration:.2f}s)")
 
             # Phase 3: AI Screening
@@ -107,11 +130,14 @@ class AnalysisOrchestrator:
             logger.info("PHASE 3: AI SCREENING")
             logger.info(f"{'='*80}")
             phase3_start = time.time()
-            ai_data = self._run_phase3_ai_screening(session, analysis_run, analysis_date, market_data)
+            # The session checks out its (pre-pinged) connection at the first flush, after the AI call returns
+            with self._phase_session(analysis_run) as session:
+                ai_data = self._run_phase3_ai_screening(
+                    session, analysis_run, analysis_date, market_data, phase3_preload.result()
+                )
+                analysis_run.ai_candidates_count = len(ai_data['candidates'])
+                analysis_run.phase3_completed = True
             phase3_duration = time.time() - phase3_start
-            analysis_run.ai_candidates_count = len(ai_data['candidates'])
-            analysis_run.phase3_completed = True
-            session.commit()
             logger.info(f"✅ Phase 3 complete ({phase3_duration:.2f}s): {len(ai_data['candidates'])} candidates")
 
             # Phase 4: Technical Screening
@@ -119,11 +145,13 @@ class AnalysisOrchestrator:
             logger.info("PHASE 4: TECHNICAL SCREENING")
             logger.info(f"{'='*80}")
             phase4_start = time.time()
-            tech_data = self._run_phase4_technical_screening(session, analysis_run, analysis_date, ai_data['candidates'])
+            with self._phase_session(analysis_run) as session:
+                tech_data = self._run_phase4_technical_screening(
+                    session, analysis_run, analysis_date, ai_data['candidates'], ai_data.get('candidate_names')
+                )
+                analysis_run.technical_selections_count = len(tech_data['selections'])
+                analysis_run.phase4_completed = True
             phase4_duration = time.time() - phase4_start
-            analysis_run.technical_selections_count = len(tech_data['selections'])
-            analysis_run.phase4_completed = True
-            session.commit()
             logger.info(f"✅ Phase 4 complete ({phase4_duration:.2f}s): {len(tech_data['selections'])} selections")
 
             # Phase 5: Price Calculation & Signal Generation
@@ -131,22 +159,21 @@ class AnalysisOrchestrator:
             logger.info("PHASE 5: PRICE CALCULATION")
             logger.info(f"{'='*80}")
             phase5_start = time.time()
-            signals = self._run_phase5_price_calculation(
-                session, analysis_run, analysis_date, target_trade_date,
-                tech_data['selections'], tech_data['selection_records']
-            )
+            with self._phase_session(analysis_run) as session:
+                signals = self._run_phase5_price_calculation(
+                    session, analysis_run, analysis_date, target_trade_date,
+                    tech_data['selections'], tech_data['selection_records']
+                )
+                analysis_run.final_signals_count = len(signals)
+                analysis_run.phase5_completed = True
+
+                # Complete analysis run (same commit as the Phase 5 signals)
+                analysis_run.status = 'completed'
+                analysis_run.end_time = datetime.now()
+                analysis_run.total_duration_seconds = (analysis_run.end_time - analysis_run.start_time).total_seconds()
             phase5_duration = time.time() - phase5_start
-            analysis_run.final_signals_count = len(signals)
-            analysis_run.phase5_completed = True
-            session.commit()
             logger.info(f"✅ Phase 5 complete ({phase5_duration:.2f}s): {len(signals)} signals")
 
-            # Complete analysis run
-            analysis_run.status = 'completed'
-            analysis_run.end_time = datetime.now()
-            analysis_run.total_duration_seconds = (analysis_run.end_time - analysis_run.start_time).total_seconds()
-            session.commit()
-
             logger.info(f"\n{'='*80}")
             logger.info("✅ ANALYSIS COMPLETED SUCCESSFULLY")
             logger.info(f"{'='*80}")
@@ -176,13 +203,14 @@ class AnalysisOrchestrator:
             traceback.print_exc()
 
             if analysis_run:
-                analysis_run.status = 'failed'
-                analysis_run.error_message = str(e)
-                analysis_run.error_phase = self._get_current_phase(analysis_run)
-                analysis_run.end_time = datetime.now()
-                if analysis_run.start_time:
-                    analysis_run.total_duration_seconds = (analysis_run.end_time - analysis_run.start_time).total_seconds()
-                session.commit()
+                # A failed phase rolled back and expired analysis_run; attributes reload in the new session
+                with self._phase_session(analysis_run):
+                    analysis_run.status = 'failed'
+                    analysis_run.error_message = str(e)
+                    analysis_run.error_phase = self._get_current_phase(analysis_run)
+                    analysis_run.end_time = datetime.now()
+                    if analysis_run.start_time:
+                        analysis_run.total_duration_seconds = (analysis_run.end_time - analysis_run.start_time).total_seconds()
 
             return {
                 'success': False,
@@ -190,6 +218,23 @@ class AnalysisOrchestrator:
                 'analysis_run_id': analysis_run.id if analysis_run else None
             }
 
+    @contextmanager
+    def _phase_session(self, analysis_run: AnalysisRun) -> Iterator[Session]:
+        """
+        Short-lived session for one phase: commits on exit, rolls back on error
+
+        No session (or pooled connection) is held across phases, so the long AI call never
+        leaves a checked-out connection idle. analysis_run is re-attached to each session;
+        expire_on_commit=False keeps its attributes readable without a reload after commit.
+        """
+        session = self.db.SessionLocal(expire_on_commit=False)
+        try:
+            session.add(analysis_run)
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
         finally:
             session.close()
 
@@ -221,10 +266,14 @@ class AnalysisOrchestrator:
             retail_net_buy=market_data.get('retail_flow'),
             momentum_score=market_data.get('momentum_score', 50.0),
             market_sentiment=market_data.get('market_sentiment', 'NEUTRAL'),
-            sector_performance=market_data.get('sector_performance', {})
+            sector_performance=market_data.get('sector_performance', {}),
+            sector_rows=[
+                SectorPerformance(**row)
+                for row in SectorPerformance.rows_from_json(market_data.get('sector_performance'))
+            ]
         )
         session.add(snapshot)
-        session.commit()
+        session.flush()  # Get ID (committed with the phase)
 
         logger.info(f"   💾 Saved market snapshot (ID: {snapshot.id})")
         logger.info(f"   KOSPI: {snapshot.kospi_close} ({snapshot.kospi_change_pct:+.2f}%)")
@@ -232,68 +281,46 @@ class AnalysisOrchestrator:
 
         return market_data
 
-    def _run_phase3_ai_screening(
-        self,
-        session: Session,
-        analysis_run: AnalysisRun,
-        analysis_date: date,
-        market_data: Dict
-    ) -> Dict:
-        """Phase 3: AI Screening with persistence - OPTIMIZED with sector info and korean names"""
+    def _preload_phase3_data(self, analysis_date: date) -> Dict:
+        """
+        Load Phase 3 inputs that do not depend on Phase 2 (stock info + latest-day OHLCV)
 
-        phase_start = time.time()
+        Runs on a background thread while Phase 2 is in progress, so it uses its own session.
+
+        Returns:
+            Dict with 'stock_info' ({code: korean_name/sector codes}) and 'ohlcv' (batch DataFrame)
+        """
+        from sqlalchemy import text
 
         # Get available stocks from KIS DB
         available_stock_codes = self.db.get_available_symbols_from_kis()
         logger.info(f"   Total stocks from KIS DB: {len(available_stock_codes)}")
 
-        # Prepare stock data DataFrame for AIScreener
-        import pandas as pd
-        import os
-        from src.utils import SectorMapper
-        from sqlalchemy import text
-
-        # Initialize sector mapper
-        sector_mapper = SectorMapper()
-
-        # Build comprehensive stock data with OPTIMIZED query (2 days only, no RSI)
-        stocks_data = []
-
-        # Get stock info (korean_name, sector) in batch
-        logger.info(f"   📋 Loading stock info (korean_name, sector) from stock_info tables...")
-
-        # Query KOSPI stock info
-        kospi_info_query = text("""
-            SELECT short_code, korean_name, index_sector_large_code, index_sector_medium_code
-            FROM kospi_stock_info
-        """)
-        kospi_info_result = session.execute(kospi_info_query)
-        kospi_info_dict = {
-            row[0]: {
-                'korean_name': row[1],
-                'sector_large': row[2],
-                'sector_medium': row[3]
-            }
-            for row in kospi_info_result
-        }
-
-        # Query KOSDAQ stock info
-        kosdaq_info_query = text("""
-            SELECT short_code, korean_name, index_sector_large_code, index_sector_medium_code
-            FROM kosdaq_stock_info
-        """)
-        kosdaq_info_result = session.execute(kosdaq_info_query)
-        kosdaq_info_dict = {
-            row[0]: {
-                'korean_name': row[1],
-                'sector_large': row[2],
-                'sector_medium': row[3]
-            }
-            for row in kosdaq_info_result
-        }
+        session = self.db.get_session()
+        try:
+            # Get stock info (korean_name, sector) in batch
+            logger.info(f"   📋 Loading stock info (korean_name, sector) from stock_info tables...")
+
+            # Query KOSPI + KOSDAQ stock info in one round trip
+            stock_info_query = text("""
+                SELECT short_code, korean_name, index_sector_large_code, index_sector_medium_code, 'KOSPI' AS market
+                FROM kospi_stock_info
+                UNION ALL
+                SELECT short_code, korean_name, index_sector_large_code, index_sector_medium_code, 'KOSDAQ' AS market
+                FROM kosdaq_stock_info
+            """)
+            all_stock_info = {}
+            for row in session.execute(stock_info_query):
+                # UNION ALL row order is not guaranteed; KOSDAQ wins for a code listed in both as before
+                if row[4] == 'KOSDAQ' or row[0] not in all_stock_info:
+                    all_stock_info[row[0]] = {
+                        'korean_name': row[1],
+                        'sector_large': row[2],
+                        'sector_medium': row[3]
+                    }
+        finally:
+            session.close()
 
-        # Merge KOSPI and KOSDAQ info
-        all_stock_info = {**kospi_info_dict, **kosdaq_info_dict}
         logger.info(f"   ✅ Loaded stock info for {len(all_stock_info)} stocks")
 
         # FULLY OPTIMIZED: Batch query for ONLY latest day (2760개 쿼리 → 1개 쿼리)
@@ -304,41 +331,61 @@ class AnalysisOrchestrator:
             start_date=analysis_date,
             end_date=analysis_date
         )
+        if not all_ohlcv_df.empty:
+            logger.info(f"   ✅ Retrieved {len(all_ohlcv_df)} records from batch query")
+
+        return {
+            'stock_info': all_stock_info,
+            'ohlcv': all_ohlcv_df
+        }
+
+    def _run_phase3_ai_screening(
+        self,
+        session: Session,
+        analysis_run: AnalysisRun,
+        analysis_date: date,
+        market_data: Dict,
+        preloaded: Optional[Dict] = None
+    ) -> Dict:
+        """Phase 3: AI Screening with persistence - OPTIMIZED with sector info and korean names"""
+
+        phase_start = time.time()
+
+        # Prepare stock data DataFrame for AIScreener
+        import pandas as pd
+        import os
+
+        preloaded = preloaded or self._preload_phase3_data(analysis_date)
+        all_stock_info = preloaded['stock_info']
+        all_ohlcv_df = preloaded['ohlcv']
 
         if all_ohlcv_df.empty:
             logger.error("   ❌ No OHLCV data retrieved from batch query!")
             return {'ai_result_id': None, 'candidates': []}
 
-        logger.info(f"   ✅ Retrieved {len(all_ohlcv_df)} records from batch query")
-
-        # Process each stock from batch results
-        for _, row in all_ohlcv_df.iterrows():
-            try:
-                stock_code = row['symbol_code']
-
-                # Get korean_name and sector from stock_info
-                stock_info = all_stock_info.get(stock_code, {})
-                korean_name = stock_info.get('korean_name', f'종목_{stock_code}')
-                sector_large = stock_info.get('sector_large')
-                sector_medium = stock_info.get('sector_medium')
-                sector_display = sector_mapper.format_sector_display(sector_large, sector_medium)
-
-                # Build stock record (NO RSI - that's for Phase 4 technical screening)
-                # AI doesn't need change_pct - it analyzes absolute values
-                stocks_data.append({
-                    'code': stock_code,
-                    'name': korean_name,
-                    'sector': sector_display,
-                    'close': float(row['close']),
-                    'market_cap': float(row['close'] * row['volume']),  # Approximate
-                    'volume': int(row['volume'])
-                })
-
-            except Exception as e:
-                logger.debug(f"Skipping {row.get('symbol_code', 'unknown')}: {e}")
-                continue
-
-        all_stocks_df = pd.DataFrame(stocks_data)
+        # Build comprehensive stock data with OPTIMIZED query (2 days only, no RSI)
+        # One merge with stock_info + column operations instead of a per-row loop
+        info_df = pd.DataFrame.from_dict(
+            all_stock_info, orient='index', columns=['korean_name', 'sector_large', 'sector_medium']
+        )
+        stocks = all_ohlcv_df[['symbol_code', 'close', 'volume']].merge(
+            info_df, left_on='symbol_code', right_index=True, how='left'
+        )
+        # Rows without a volume cannot be converted to int (skipped as before)
+        stocks = stocks.dropna(subset=['volume'])
+
+        # Stock records (NO RSI - that's for Phase 4 technical screening)
+        # AI doesn't need change_pct - it analyzes absolute values
+        all_stocks_df = pd.DataFrame({
+            'code': stocks['symbol_code'].to_numpy(),
+            'name': stocks['korean_name'].fillna('종목_' + stocks['symbol_code']).to_numpy(),
+            'sector': self.sector_mapper.format_sector_display_series(
+                stocks['sector_large'], stocks['sector_medium']
+            ).to_numpy(),
+            'close': stocks['close'].astype('float64').to_numpy(),
+            'market_cap': (stocks['close'] * stocks['volume']).astype('float64').to_numpy(),  # Approximate
+            'volume': stocks['volume'].astype('int64').to_numpy()
+        })
         logger.info(f"   ✅ Prepared stock data: {len(all_stocks_df)} stocks with korean_name + sector (배치 조회)")
 
         # Initialize AIScreener with provider from environment
@@ -365,32 +412,37 @@ class AnalysisOrchestrator:
             selected_count=len(candidates_list),
             execution_time_seconds=metadata.get('screening_duration_sec', time.time() - phase_start),
             api_cost_usd=metadata.get('api_cost', 0.0),
-            prompt_text='Full prompt saved in debug_actual_prompt.txt',  # Saved by AIScreener
-            response_text=f"AI selected {len(candidates_list)} stocks based on market conditions",
-            response_summary=f"{metadata.get('sentiment', 'UNKNOWN')} market - selected {len(candidates_list)} candidates"
+            response_summary=f"{metadata.get('sentiment', 'UNKNOWN')} market - selected {len(candidates_list)} candidates",
+            payload=AIScreeningPayload(
+                prompt_text='Full prompt saved in debug_actual_prompt.txt',  # Saved by AIScreener
+                response_text=f"AI selected {len(candidates_list)} stocks based on market conditions"
+            )
         )
         session.add(ai_result)
         session.flush()  # Get ID
 
         logger.info(f"   💾 Saved AI screening result (ID: {ai_result.id})")
 
-        # Save individual candidates from AI response
+        # Save individual candidates from AI response in one bulk INSERT (no per-row ORM objects)
+        # KIS symbols missing from the stocks table keep stock_id NULL
+        stock_ids = self.db.get_stock_ids([c.get('code', '') for c in candidates_list])
+        stock_rows = {stock['code']: stock for stock in all_stocks_df.to_dict(orient='records')}
+        candidate_mappings = []
         candidate_records = []
         for candidate_dict in candidates_list:
             stock_code = candidate_dict.get('code', '')
             confidence = candidate_dict.get('confidence', 50)
             reason = candidate_dict.get('reason', 'AI selected')
 
-            # Get stock details from all_stocks_df
-            stock_row = all_stocks_df[all_stocks_df['code'] == stock_code]
-            if stock_row.empty:
+            # Get stock details from the prepared stock data
+            stock_info = stock_rows.get(stock_code)
+            if stock_info is None:
                 logger.warning(f"   Candidate {stock_code} not in stock data, skipping")
                 continue
 
-            stock_info = stock_row.iloc[0]
-
-            candidate = AICandidate(
+            candidate_mappings.append(dict(
                 ai_screening_id=ai_result.id,
+                stock_id=stock_ids.get(stock_code),
                 stock_code=stock_code,
                 company_name=stock_info.get('name', f"Stock_{stock_code}"),
                 ai_score=float(confidence),
@@ -399,16 +451,16 @@ class AnalysisOrchestrator:
                 mentioned_factors=candidate_dict.get('key_indicators', []),
                 current_price=float(stock_info['close']),
                 sector=stock_info.get('sector', 'Unknown')
-            )
-            session.add(candidate)
+            ))
             candidate_records.append(stock_code)
 
-        session.commit()
+        AICandidate.bulk_insert(session, candidate_mappings)
         logger.info(f"   💾 Saved {len(candidate_records)} AI candidates to database")
 
         return {
             'ai_result_id': ai_result.id,
-            'candidates': candidate_records
+            'candidates': candidate_records,
+            'candidate_names': {mapping['stock_code']: mapping['company_name'] for mapping in candidate_mappings}
         }
 
     def _run_phase4_technical_screening(
@@ -416,31 +468,30 @@ class AnalysisOrchestrator:
         session: Session,
         analysis_run: AnalysisRun,
         analysis_date: date,
-        ai_candidates: List[str]
+        ai_candidates: List[str],
+        candidate_names: Optional[Dict[str, str]] = None
     ) -> Dict:
         """Phase 4: Technical Screening with persistence"""
 
         phase_start = time.time()
 
-        # Get korean names from AI candidates in DB (Phase 3 saved them)
-        from sqlalchemy import text
-        ai_candidates_data = {}
-        if ai_candidates:
+        # Korean names of the AI candidates: handed over by Phase 3, otherwise read back from the DB
+        ai_candidates_data = candidate_names or {}
+        if ai_candidates and candidate_names is None:
             # Get AI screening result ID for this analysis run
             ai_result = session.query(AIScreeningResult).filter(
                 AIScreeningResult.analysis_run_id == analysis_run.id
             ).first()
 
             if ai_result:
-                placeholders = ','.join([f"'{code}'" for code in ai_candidates])
-                query = text(f"""
-                    SELECT stock_code, company_name
-                    FROM ai_candidates
-                    WHERE ai_screening_id = :screening_id
-                    AND stock_code IN ({placeholders})
-                """)
-                result = session.execute(query, {'screening_id': ai_result.id})
-                ai_candidates_data = {row[0]: row[1] for row in result}
+                # Codes come from the AI response, so they are bound as parameters
+                result = session.execute(
+                    select(AICandidate.stock_code, AICandidate.company_name).where(
+                        AICandidate.ai_screening_id == ai_result.id,
+                        AICandidate.stock_code.in_(ai_candidates)
+                    )
+                )
+                ai_candidates_data = dict(result.all())
 
         # Run technical screening
         # Convert stock codes to DataFrame with korean names
@@ -470,11 +521,23 @@ class AnalysisOrchestrator:
 
         logger.info(f"   💾 Saved technical screening result (ID: {tech_result.id})")
 
-        # Save individual selections
+        # Save individual selections in one bulk INSERT (no per-row ORM objects)
+        stock_ids = self.db.get_stock_ids(list(selected_stocks['stock_code'])) if not selected_stocks.empty else {}
         selection_records = []
         for _, row in selected_stocks.iterrows():
-            selection = TechnicalSelection(
+            # Key indicators go to typed columns; the JSON keeps them too during the transition
+            key_indicators = {
+                column: None if pd.isna(row.get(column)) else float(row.get(column))
+                for column in TechnicalScreener.KEY_INDICATORS
+            }
+            indicators = row.get('indicators') or {
+                TechnicalScreener.KEY_INDICATORS[column]: value
+                for column, value in key_indicators.items()
+            }
+
+            selection_records.append(dict(
                 tech_screening_id=tech_result.id,
+                stock_id=stock_ids.get(row['stock_code']),
                 stock_code=row['stock_code'],
                 company_name=row.get('company_name', f"Company {row['stock_code']}"),
                 current_price=row['current_price'],
@@ -484,14 +547,17 @@ class AnalysisOrchestrator:
                 bb_score=row['bb_score'],
                 volume_score=row['volume_score'],
                 final_score=row['final_score'],
-                indicators=row.get('indicators', {}),
+                indicators=indicators,
+                **key_indicators,
                 rank_in_batch=row.get('rank', 0),
                 selection_reason=f"Technical score: {row['final_score']:.1f}/70"
-            )
-            session.add(selection)
-            selection_records.append(selection)
+            ))
+
+        # Phase 5 links signals to these rows by id
+        selection_ids = TechnicalSelection.bulk_insert(session, selection_records, return_ids=True)
+        for record, selection_id in zip(selection_records, selection_ids):
+            record['id'] = selection_id
 
-        session.commit()
         logger.info(f"   💾 Saved {len(selection_records)} technical selections")
 
         return {
@@ -507,118 +573,122 @@ class AnalysisOrchestrator:
         analysis_date: date,
         target_trade_date: date,
         selected_stocks: 'DataFrame',
-        tech_selection_records: List[TechnicalSelection]
+        tech_selection_records: List[Dict]
     ) -> List[Dict]:
         """Phase 5: Price Calculation with persistence"""
 
-        # Calculate prices for all selected stocks
+        tech_selection_ids = {selection['stock_code']: selection['id'] for selection in tech_selection_records}
+        stock_ids = {selection['stock_code']: selection['stock_id'] for selection in tech_selection_records}
+        rows = [row for _, row in selected_stocks.iterrows()]
+
+        results = []
+        if rows:
+            # Get OHLCV data for all selected stocks in one query (one per stock before)
+            ohlcv_by_code = self.db.get_daily_ohlcv_bulk_from_kis(
+                [row['stock_code'] for row in rows],
+                start_date=datetime.now() - timedelta(days=200),
+                end_date=datetime.now()
+            )
+            ohlcv_frames = [ohlcv_by_code.get(row['stock_code']) for row in rows]
+
+            # Indicator/price calculation is independent per stock, so run them concurrently;
+            # map() keeps the selection order and ORM objects stay on this thread
+            max_workers = min(self.PHASE5_MAX_WORKERS, len(rows))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(self._compute_signal_for_stock, rows, ohlcv_frames))
+
+        signal_mappings = []
         signals_data = []
+        for row, prices in zip(rows, results):
+            if prices is None:
+                continue
 
-        for idx, row in selected_stocks.iterrows():
-            try:
-                stock_code = row['stock_code']
-                current_price = row['current_price']
+            stock_code = row['stock_code']
 
-                # Get OHLCV data for price calculation
-                ohlcv_df = self.db.get_daily_ohlcv_from_kis(
-                    stock_code,
-                    start_date=datetime.now() - timedelta(days=200),
-                    end_date=datetime.now()
-                )
+            # Trading signal row (convert numpy types to Python floats), saved below in one bulk INSERT
+            signal = dict(
+                analysis_run_id=analysis_run.id,
+                tech_selection_id=tech_selection_ids.get(stock_code),
+                stock_id=stock_ids.get(stock_code),  # NULL when the KIS symbol is not in stocks
+                stock_code=stock_code,
+                company_name=row.get('company_name', f"Company {stock_code}"),
+                analysis_date=analysis_date,
+                target_trade_date=target_trade_date,
+                current_price=to_python_type(prices['current_price']),
+                buy_price=to_python_type(prices['buy_price']),
+                target_price=to_python_type(prices['target_price']),
+                stop_loss_price=to_python_type(prices['stop_loss_price']),
+                predicted_return=to_python_type(prices['predicted_return']),
+                risk_reward_ratio=to_python_type(prices['risk_reward_ratio']),
+                ai_confidence=int(round(prices['ai_confidence'])),  # SmallInteger column (0-100)
+                support_level=to_python_type(prices['support_level']),
+                resistance_level=to_python_type(prices['resistance_level']),
+                pivot_point=to_python_type(prices['pivot_point']),
+                atr=to_python_type(prices['atr']),
+                calculation_details=prices.get('calculation_details', {}),
+                status='pending'
+            )
+            signal_mappings.append(signal)
 
-                if ohlcv_df is None or len(ohlcv_df) < 60:
-                    logger.warning(f"   ⚠️  Insufficient data for {stock_code}, skipping")
-                    continue
-
-                # Rename columns to match TechnicalIndicators expectations (KIS DB uses lowercase)
-                ohlcv_df = ohlcv_df.copy()
-                ohlcv_df.rename(columns={
-                    'open': 'Open',
-                    'high': 'High',
-                    'low': 'Low',
-                    'close': 'Close',
-                    'volume': 'Volume'
-                }, inplace=True)
-
-                # Convert Decimal to float
-                for col in ['Open', 'High', 'Low', 'Close', 'Volume']:
-                    if col in ohlcv_df.columns:
-                        ohlcv_df[col] = ohlcv_df[col].astype(float)
-
-                # Add technical indicators
-                from src.analysis.technical_indicators import TechnicalIndicators
-                tech_indicators = TechnicalIndicators()
-                ohlcv_with_indicators = tech_indicators.add_all_indicators(ohlcv_df)
-
-                # Calculate prices
-                prices = self.price_calculator.calculate_prices(
-                    stock_code=stock_code,
-                    current_price=current_price,
-                    technical_data=ohlcv_with_indicators,
-                    prediction_days=7
-                )
+            signals_data.append({
+                'stock_code': stock_code,
+                'company_name': signal['company_name'],
+                'buy_price': signal['buy_price'],
+                'target_price': signal['target_price'],
+                'stop_loss_price': signal['stop_loss_price'],
+                'predicted_return': signal['predicted_return'],
+                'risk_reward_ratio': signal['risk_reward_ratio']
+            })
 
-                # Find corresponding tech_selection record
-                tech_selection_id = None
-                for selection in tech_selection_records:
-                    if selection.stock_code == stock_code:
-                        tech_selection_id = selection.id
-                        break
-
-                # Helper function to convert numpy types to Python types
-                def to_python_type(value):
-                    """Convert numpy types to Python native types for database storage"""
-                    import numpy as np
-                    if isinstance(value, (np.integer, np.floating)):
-                        return float(value)
-                    return value
-
-                # Create trading signal (convert numpy types to Python floats)
-                signal = TradingSignal(
-                    analysis_run_id=analysis_run.id,
-                    tech_selection_id=tech_selection_id,
-                    stock_id=None,  # Would link to stocks table if exists
-                    stock_code=stock_code,
-                    company_name=row.get('company_name', f"Company {stock_code}"),
-                    analysis_date=analysis_date,
-                    target_trade_date=target_trade_date,
-                    current_price=to_python_type(prices['current_price']),
-                    buy_price=to_python_type(prices['buy_price']),
-                    target_price=to_python_type(prices['target_price']),
-                    stop_loss_price=to_python_type(prices['stop_loss_price']),
-                    predicted_return=to_python_type(prices['predicted_return']),
-                    risk_reward_ratio=to_python_type(prices['risk_reward_ratio']),
-                    ai_confidence=to_python_type(prices['ai_confidence']),
-                    support_level=to_python_type(prices['support_level']),
-                    resistance_level=to_python_type(prices['resistance_level']),
-                    pivot_point=to_python_type(prices['pivot_point']),
-                    atr=to_python_type(prices['atr']),
-                    calculation_details=prices.get('calculation_details', {}),
-                    status='pending'
-                )
-                session.add(signal)
-
-                signals_data.append({
-                    'stock_code': stock_code,
-                    'company_name': signal.company_name,
-                    'buy_price': signal.buy_price,
-                    'target_price': signal.target_price,
-                    'stop_loss_price': signal.stop_loss_price,
-                    'predicted_return': signal.predicted_return,
-                    'risk_reward_ratio': signal.risk_reward_ratio
-                })
-
-                logger.info(f"   💾 Created signal for {stock_code}: Buy {signal.buy_price:,.0f} → Target {signal.target_price:,.0f}")
-
-            except Exception as e:
-                logger.error(f"   ❌ Failed to calculate prices for {stock_code}: {str(e)}")
-                continue
+            logger.info(f"   💾 Created signal for {stock_code}: Buy {signal['buy_price']:,.0f} → Target {signal['target_price']:,.0f}")
 
-        session.commit()
+        TradingSignal.bulk_insert(session, signal_mappings)
         logger.info(f"   💾 Saved {len(signals_data)} trading signals")
 
         return signals_data
 
+    def _compute_signal_for_stock(self, row, ohlcv_df: Optional['DataFrame']) -> Optional[Dict]:
+        """
+        Phase 5 worker: calculate prices for one selected stock from its OHLCV history
+
+        Runs on a pool thread, so it touches no ORM session.
+
+        Returns:
+            PriceCalculator result dict, or None if the stock is skipped
+        """
+        stock_code = row['stock_code']
+        try:
+            current_price = row['current_price']
+
+            if ohlcv_df is None or len(ohlcv_df) < 60:
+                logger.warning(f"   ⚠️  Insufficient data for {stock_code}, skipping")
+                return None
+
+            # Rename columns to match TechnicalIndicators expectations (KIS DB uses lowercase)
+            # and cast to float in one pass (returns a new frame, the shared input is untouched)
+            ohlcv_df = ohlcv_df.rename(columns={
+                'open': 'Open',
+                'high': 'High',
+                'low': 'Low',
+                'close': 'Close',
+                'volume': 'Volume'
+            }).astype({'Open': 'float64', 'High': 'float64', 'Low': 'float64', 'Close': 'float64', 'Volume': 'float64'})
+
+            # Add technical indicators (stateless, so one instance is shared by the pool threads)
+            ohlcv_with_indicators = self.tech_indicators.add_all_indicators(ohlcv_df)
+
+            # Calculate prices
+            return self.price_calculator.calculate_prices(
+                stock_code=stock_code,
+                current_price=current_price,
+                technical_data=ohlcv_with_indicators,
+                prediction_days=7
+            )
+
+        except Exception as e:
+            logger.error(f"   ❌ Failed to calculate prices for {stock_code}: {str(e)}")
+            return None
+
     def _get_current_phase(self, analysis_run: AnalysisRun) -> str:
         """Determine current phase from completion flags"""
         if not analysis_run.phase1_completed:
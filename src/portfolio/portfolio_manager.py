@@ -2,20 +2,56 @@
 포트폴리오 관리자
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict, List
+from typing import Dict, List, Sequence, Union
 from loguru import logger
 
 
 class PortfolioManager:
-    """포트폴리오 관리"""
+    """
+    포트폴리오 관리
 
-    def __init__(self, initial_capital: float = 10000000):
+    보유 수량/평균 매수가는 종목 인덱스로 정렬된 NumPy 배열에 저장한다.
+    백테스트처럼 tickers 를 미리 등록하면 get_portfolio_value 에 같은 순서의
+    가격 배열을 넘겨 dict 조회 없이 평가금액을 계산할 수 있다.
+    """
+
+    def __init__(self, initial_capital: float = 10000000, tickers: Sequence[str] = ()):
         self.initial_capital = initial_capital
         self.cash = initial_capital
-        self.holdings = {}  # {ticker: {'quantity': int, 'avg_price': float}}
         self.trades = []
 
+        self._ticker_index: Dict[str, int] = {}  # {ticker: 배열 인덱스}
+        self._quantity = np.zeros(0, dtype=np.int64)
+        self._avg_price = np.zeros(0, dtype=np.float64)
+        for ticker in tickers:
+            self._index_of(ticker)
+
+    def _index_of(self, ticker: str) -> int:
+        """종목의 배열 인덱스 (처음 보는 종목이면 배열 끝에 추가)"""
+        index = self._ticker_index.get(ticker)
+        if index is None:
+            index = len(self._ticker_index)
+            self._ticker_index[ticker] = index
+            self._quantity = np.append(self._quantity, 0)
+            self._avg_price = np.append(self._avg_price, 0.0)
+        return index
+
+    @property
+    def holdings(self) -> Dict[str, Dict]:
+        """보유 종목 {ticker: {'quantity': int, 'avg_price': float}} (읽기 전용 사본)"""
+        return {
+            ticker: {'quantity': int(self._quantity[index]), 'avg_price': float(self._avg_price[index])}
+            for ticker, index in self._ticker_index.items()
+            if self._quantity[index] > 0
+        }
+
+    def get_quantity(self, ticker: str) -> int:
+        """보유 수량 (보유하지 않으면 0)"""
+        index = self._ticker_index.get(ticker)
+        return int(self._quantity[index]) if index is not None else 0
+
     def buy(self, ticker: str, quantity: int, price: float):
         """매수"""
         cost = quantity * price
@@ -25,16 +61,15 @@ class PortfolioManager:
 
         self.cash -= cost
 
-        if ticker in self.holdings:
+        index = self._index_of(ticker)
+        current_qty = self._quantity[index]
+        if current_qty > 0:
             # 평균 매수가 재계산
-            current_qty = self.holdings[ticker]['quantity']
-            current_avg = self.holdings[ticker]['avg_price']
-            new_avg = (current_qty * current_avg + quantity * price) / (current_qty + quantity)
-
-            self.holdings[ticker]['quantity'] += quantity
-            self.holdings[ticker]['avg_price'] = new_avg
+            current_avg = self._avg_price[index]
+            self._avg_price[index] = (current_qty * current_avg + quantity * price) / (current_qty + quantity)
         else:
-            self.holdings[ticker] = {'quantity': quantity, 'avg_price': price}
+            self._avg_price[index] = price
+        self._quantity[index] = current_qty + quantity
 
         self.trades.append({
             'type': 'BUY',
@@ -49,20 +84,19 @@ class PortfolioManager:
 
     def sell(self, ticker: str, quantity: int, price: float):
         """매도"""
-        if ticker not in self.holdings:
+        held = self.get_quantity(ticker)
+        if held == 0:
             logger.warning(f"보유하지 않은 종목: {ticker}")
             return False
 
-        if self.holdings[ticker]['quantity'] < quantity:
-            logger.warning(f"수량 부족: 보유 {self.holdings[ticker]['quantity']}주")
+        if held < quantity:
+            logger.warning(f"수량 부족: 보유 {held}주")
             return False
 
         revenue = quantity * price
         self.cash += revenue
 
-        self.holdings[ticker]['quantity'] -= quantity
-        if self.holdings[ticker]['quantity'] == 0:
-            del self.holdings[ticker]
+        self._quantity[self._ticker_index[ticker]] = held - quantity
 
         self.trades.append({
             'type': 'SELL',
@@ -75,13 +109,24 @@ class PortfolioManager:
         logger.info(f"매도: {ticker} {quantity}주 @ {price:,}원")
         return True
 
-    def get_portfolio_value(self, current_prices: Dict[str, float]) -> float:
-        """포트폴리오 총 가치"""
-        holdings_value = sum(
-            holding['quantity'] * current_prices.get(ticker, holding['avg_price'])
-            for ticker, holding in self.holdings.items()
-        )
-        return self.cash + holdings_value
+    def get_portfolio_value(self, current_prices: Union[Dict[str, float], np.ndarray]) -> float:
+        """
+        포트폴리오 총 가치 (현재가가 없는 종목은 평균 매수가로 평가)
+
+        Args:
+            current_prices: {ticker: 현재가} 또는 등록된 종목 순서의 현재가 배열 (없는 종목은 NaN)
+        """
+        if isinstance(current_prices, np.ndarray):
+            prices = current_prices[:len(self._quantity)]
+            prices = np.where(np.isnan(prices), self._avg_price, prices)
+        else:
+            prices = np.array([
+                current_prices.get(ticker, self._avg_price[index])
+                for ticker, index in self._ticker_index.items()
+            ], dtype=np.float64)
+
+        held = self._quantity > 0
+        return self.cash + float(np.dot(self._quantity[held], prices[held]))
 
     def get_profit_loss(self, current_prices: Dict[str, float]) -> Dict:
         """손익 계산"""
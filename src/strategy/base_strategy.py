@@ -3,6 +3,7 @@
 """
 
 from abc import ABC, abstractmethod
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Optional
 from loguru import logger
@@ -28,6 +29,37 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def generate_signal_codes(self, close: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        날짜×종목 종가로 전 종목 시그널을 한 번에 계산 (선택 구현)
+
+        종가만으로 시그널이 정해지는 전략은 이 메서드를 구현하면 백테스트가 종목마다
+        generate_signals 를 호출하지 않고 열 단위 벡터 연산 한 번으로 처리한다.
+        결과는 종목별 generate_signals 의 Signal 컬럼과 같아야 한다.
+
+        Args:
+            close: 날짜×종목 종가 (종목의 데이터 구간 밖은 NaN)
+
+        Returns:
+            같은 모양의 시그널 코드 DataFrame (BUY=1, SELL=-1, HOLD=0), 지원하지 않으면 None
+        """
+        return None
+
+    @staticmethod
+    def _signal_codes(buy: pd.DataFrame, sell: pd.DataFrame) -> pd.DataFrame:
+        """매수/매도 조건 DataFrame -> 시그널 코드 (generate_signals 처럼 매도가 매수를 덮어씀)"""
+        codes = np.where(sell, -1, np.where(buy, 1, 0)).astype(np.int8)
+        return pd.DataFrame(codes, index=buy.index, columns=buy.columns)
+
+    def get_params(self) -> Dict:
+        """
+        전략 파라미터 (name/signals 를 제외한 인스턴스 속성)
+
+        generate_signals 결과는 이 값과 입력 데이터로만 결정된다고 보고
+        백테스트 엔진의 시그널 캐시 키로 사용한다.
+        """
+        return {key: value for key, value in vars(self).items() if key not in ('name', 'signals')}
+
     def get_position(self, df: pd.DataFrame, index: int) -> str:
         """
         현재 포지션 확인
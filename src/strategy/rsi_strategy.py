@@ -49,3 +49,16 @@ class RSIStrategy(BaseStrategy):
         df.loc[overbought_signal, 'Signal'] = 'SELL'
 
         return df
+
+    def generate_signal_codes(self, close: pd.DataFrame) -> pd.DataFrame:
+        """generate_signals 와 같은 RSI 시그널을 날짜×종목 종가 전체에 대해 계산"""
+        # TechnicalIndicators.calculate_rsi 와 같은 식, 종목의 데이터 구간 밖은 0 이 아니라 NaN 으로 둠
+        listed = close.notna()
+        delta = close.diff()
+        gain = delta.where(delta > 0, 0).where(listed).rolling(window=self.period).mean()
+        loss = (-delta.where(delta < 0, 0)).where(listed).rolling(window=self.period).mean()
+        rsi = 100 - (100 / (1 + gain / loss))
+
+        oversold_signal = (rsi > self.oversold) & (rsi.shift(1) <= self.oversold)
+        overbought_signal = (rsi < self.overbought) & (rsi.shift(1) >= self.overbought)
+        return self._signal_codes(oversold_signal, overbought_signal)
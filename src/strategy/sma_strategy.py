@@ -49,3 +49,12 @@ class SMAStrategy(BaseStrategy):
         df.loc[death_cross, 'Signal'] = 'SELL'
 
         return df
+
+    def generate_signal_codes(self, close: pd.DataFrame) -> pd.DataFrame:
+        """generate_signals 와 같은 크로스오버 시그널을 날짜×종목 종가 전체에 대해 계산"""
+        short_sma = close.rolling(window=self.short_period).mean()
+        long_sma = close.rolling(window=self.long_period).mean()
+
+        golden_cross = (short_sma > long_sma) & (short_sma.shift(1) <= long_sma.shift(1))
+        death_cross = (short_sma < long_sma) & (short_sma.shift(1) >= long_sma.shift(1))
+        return self._signal_codes(golden_cross, death_cross)
@@ -4,6 +4,7 @@ Maps KIS sector codes to Korean sector names
 """
 
 import pandas as pd
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict
 from loguru import logger
@@ -16,6 +17,11 @@ class SectorMapper:
         self.sector_codes = None
         self._load_sector_codes()
 
+        # Lookups run once per stock but distinct codes number in the hundreds,
+        # so memoize per instance (sector codes are only loaded here)
+        self.get_sector_name = lru_cache(maxsize=1024)(self.get_sector_name)
+        self.format_sector_display = lru_cache(maxsize=1024)(self.format_sector_display)
+
     def _load_sector_codes(self):
         """Load sector codes from CSV file"""
         sector_csv = Path(__file__).parent.parent.parent / "sector_codes.csv"
@@ -104,3 +110,32 @@ class SectorMapper:
             return large
 
         return f"{large} > {medium}"
+
+    def format_sector_display_series(self, large_codes: pd.Series, medium_codes: pd.Series) -> pd.Series:
+        """
+        Vectorized format_sector_display for whole columns
+
+        Only the distinct (large, medium) pairs are formatted; the results are mapped back to every row.
+
+        Args:
+            large_codes: Large category sector codes (missing codes allowed)
+            medium_codes: Medium category sector codes (missing codes allowed)
+
+        Returns:
+            Formatted sector strings, aligned with large_codes
+        """
+        # -1 stands in for a missing code so the pairs can be de-duplicated and matched as plain integers
+        pairs = pd.DataFrame({
+            'large': pd.to_numeric(large_codes, errors='coerce').fillna(-1).astype('int64').to_numpy(),
+            'medium': pd.to_numeric(medium_codes, errors='coerce').fillna(-1).astype('int64').to_numpy()
+        })
+        unique_pairs = pairs.drop_duplicates()
+        display = pd.Series(
+            [
+                self.format_sector_display(None if large < 0 else large, None if medium < 0 else medium)
+                for large, medium in zip(unique_pairs['large'], unique_pairs['medium'])
+            ],
+            index=pd.MultiIndex.from_frame(unique_pairs),
+            dtype=object
+        )
+        return pd.Series(display.reindex(pd.MultiIndex.from_frame(pairs)).to_numpy(), index=large_codes.index)
@@ -0,0 +1,62 @@
+"""
+BacktestEngine 테스트
+백테스트 기간에 거래일이 없을 때 빈 결과를 반환하는지 검증
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from src.execution.backtest_engine import BacktestEngine
+from src.strategy.sma_strategy import SMAStrategy
+
+
+def _sample_data():
+    """60 거래일짜리 단일 종목 주가"""
+    index = pd.date_range('2024-01-01', periods=60)
+    df = pd.DataFrame({
+        'Open': 100.0,
+        'High': 101.0,
+        'Low': 99.0,
+        'Close': np.linspace(100, 120, 60),
+        'Volume': 1000,
+    }, index=index)
+    return {'005930': df}
+
+
+def _assert_empty_result(result, initial_capital):
+    assert result['equity_curve'].empty
+    assert result['trades'] == []
+    assert result['final_capital'] == initial_capital
+    assert result['total_return'] == 0
+    assert result['sharpe_ratio'] == 0
+    assert result['max_drawdown'] == 0
+
+
+def test_backtest_empty_date_range():
+    """기간 내 거래일이 없으면 예외 없이 빈 자산 곡선 반환"""
+    engine = BacktestEngine()
+    result = engine.run(SMAStrategy(), _sample_data(), start_date=datetime(2030, 1, 1))
+    _assert_empty_result(result, engine.initial_capital)
+
+
+def test_backtest_no_data():
+    """종목 데이터가 없으면 예외 없이 빈 자산 곡선 반환"""
+    engine = BacktestEngine()
+    result = engine.run(SMAStrategy(), {})
+    _assert_empty_result(result, engine.initial_capital)
+
+
+def test_backtest_single_day():
+    """거래일이 하루뿐이면 수익률 통계는 0"""
+    engine = BacktestEngine()
+    data = {ticker: df.iloc[:1] for ticker, df in _sample_data().items()}
+    result = engine.run(SMAStrategy(), data)
+    assert len(result['equity_curve']) == 1
+    assert result['sharpe_ratio'] == 0
+    assert result['max_drawdown'] == 0
@@ -0,0 +1,117 @@
+"""
+주가 저장 중복 제거 테스트 (임시 파일 SQLite DB)
+
+겹치는 날짜를 다시 저장하면 새 행 수만 반환하고 (stock_id, date) 중복 행이 생기지 않는지,
+유니크 인덱스가 없을 때의 기존 날짜 조회 방식도 같은 결과를 내는지 검증
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pandas as pd
+import pytest
+from sqlalchemy import text
+
+from src.database import Database
+
+
+TICKER = '005930'
+
+
+@pytest.fixture(params=[True, False], ids=['on_conflict', 'existing_date_check'])
+def db(request, tmp_path):
+    """stocks 한 건이 있는 임시 SQLite DB (ON CONFLICT 경로 / 기존 날짜 조회 경로)"""
+    database = Database(f"sqlite:///{tmp_path / 'prices.db'}", price_cache=False)
+    database.create_tables()
+    database.add_stock(TICKER, '삼성전자', 'KOSPI')
+    database._price_unique_index = request.param
+    yield database
+    database.engine.dispose()
+
+
+def _prices(start: str, periods: int) -> pd.DataFrame:
+    index = pd.date_range(start, periods=periods, freq='B')
+    return pd.DataFrame({
+        'Open': 100.0,
+        'High': 110.0,
+        'Low': 90.0,
+        'Close': 105.0,
+        'Volume': 1000,
+    }, index=index)
+
+
+def _price_rows(db: Database, dates) -> list:
+    stock_id = db.get_stock_id(TICKER)
+    return [{
+        'stock_id': stock_id,
+        'date': price_date,
+        'open': 100,
+        'high': 110,
+        'low': 90,
+        'close': 105,
+        'volume': 1000,
+        'amount': None,
+    } for price_date in dates]
+
+
+def _duplicate_count(db: Database) -> int:
+    with db.engine.connect() as conn:
+        return conn.execute(text(
+            "SELECT COUNT(*) FROM (SELECT stock_id, date FROM stock_prices "
+            "GROUP BY stock_id, date HAVING COUNT(*) > 1)"
+        )).scalar()
+
+
+def _row_count(db: Database) -> int:
+    with db.engine.connect() as conn:
+        return conn.execute(text("SELECT COUNT(*) FROM stock_prices")).scalar()
+
+
+def test_add_stock_prices_overlapping_dates(db):
+    """겹치는 기간을 다시 저장하면 새 날짜만 저장"""
+    assert db.add_stock_prices(TICKER, _prices('2024-01-01', 10)) == 10
+    assert db.add_stock_prices(TICKER, _prices('2024-01-08', 10)) == 5
+    assert db.add_stock_prices(TICKER, _prices('2024-01-01', 10)) == 0
+
+    assert _row_count(db) == 15
+    assert _duplicate_count(db) == 0
+
+
+def test_bulk_insert_prices_overlapping_dates(db):
+    """일괄 저장도 이미 있는 날짜와 묶음 안의 중복 날짜를 건너뜀"""
+    dates = pd.date_range('2024-01-01', periods=10, freq='B')
+    assert db.bulk_insert_prices(_price_rows(db, dates[:6])) == 6
+
+    # dates[4:] 중 4, 5 는 이미 저장됨, 마지막 날짜는 묶음 안에서 중복
+    rows = _price_rows(db, list(dates[4:]) + [dates[-1]])
+    assert db.bulk_insert_prices(rows, chunksize=3) == 4
+
+    assert _row_count(db) == 10
+    assert _duplicate_count(db) == 0
+
+
+def test_missing_unique_index_falls_back(tmp_path):
+    """기존 중복 행 때문에 유니크 인덱스를 만들지 못한 DB도 주가 저장이 동작"""
+    url = f"sqlite:///{tmp_path / 'legacy.db'}"
+    db = Database(url, price_cache=False)
+    db.create_tables()
+    stock_id = db.add_stock(TICKER, '삼성전자', 'KOSPI').id
+    with db.engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_stock_prices_stock_date"))
+        for _ in range(2):
+            conn.execute(text(
+                "INSERT INTO stock_prices (stock_id, date, open, high, low, close, volume) "
+                "VALUES (:stock_id, '2024-01-01', 1, 1, 1, 1, 1)"
+            ), {'stock_id': stock_id})
+
+    # 인덱스 생성은 실패하고 ON CONFLICT 경로가 꺼짐
+    legacy = Database(url, price_cache=False)
+    legacy.create_tables()
+    assert legacy._supports_on_conflict() is False
+
+    assert legacy.add_stock_prices(TICKER, _prices('2024-01-01', 5)) == 4
+    assert legacy.add_stock_prices(TICKER, _prices('2024-01-01', 5)) == 0
+    assert _row_count(legacy) == 6
+    legacy.engine.dispose()
+    db.engine.dispose()